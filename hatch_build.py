@@ -0,0 +1,38 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Union
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    # bakes the about metadata from CITATION.cff into cff2toml/_about_metadata.py
+    # of wheels, so the about command does not read and parse CITATION.cff on every
+    # call. the module is written to a temporary directory, never to the source tree,
+    # and editable installs do not get it, so they read the CITATION.cff of the checkout
+
+    _generated_dir_path: Union[str, None] = None
+
+    def initialize(self, version: str, build_data: Dict[str, Any]) -> None:
+        if self.target_name != 'wheel' or version == 'editable':
+            return
+        about_metadata_module_path: str = os.path.join(
+            self.root, 'src', 'cff2toml', 'cli', 'about_command', 'about_metadata.py')
+        spec = importlib.util.spec_from_file_location(
+            'about_metadata', about_metadata_module_path)
+        about_metadata = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(about_metadata)
+
+        self._generated_dir_path = tempfile.mkdtemp(prefix='cff2toml-build-')
+        module_file_path: str = os.path.join(
+            self._generated_dir_path, about_metadata.ABOUT_METADATA_FILENAME)
+        about_metadata.write_about_metadata_module(citation_cff_file_path=os.path.join(
+            self.root, 'CITATION.cff'), module_file_path=module_file_path)
+        build_data['force_include'][module_file_path] = f"cff2toml/{about_metadata.ABOUT_METADATA_FILENAME}"
+
+    def finalize(self, version: str, build_data: Dict[str, Any], artifact_path: str) -> None:
+        if self._generated_dir_path is not None:
+            shutil.rmtree(self._generated_dir_path, ignore_errors=True)
+            self._generated_dir_path = None
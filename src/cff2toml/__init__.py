@@ -1,5 +1,31 @@
-from cff2toml.models.files.metadata_file import MetadataFile
-from cff2toml.models.files.cff_file import CffFile, LoadCffFileException, SaveCffFileException
-from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CffAndPyprojectTomlFileSynchronizer
-from cff2toml.models.files.toml_file import LoadTomlFileException, SaveTomlFileException, TomlFile
-from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+import importlib
+from typing import Any, Dict, List
+
+# the public classes are imported on first use, so running the CLI
+# does not import the models of the commands that are not run
+# {public name} -> {module that defines it}
+_LAZY_IMPORTS: Dict[str, str] = {
+    "MetadataFile": "cff2toml.models.files.metadata_file",
+    "CffFile": "cff2toml.models.files.cff_file",
+    "LoadCffFileException": "cff2toml.models.files.cff_file",
+    "SaveCffFileException": "cff2toml.models.files.cff_file",
+    "CffAndPyprojectTomlFileSynchronizer": "cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer",
+    "LoadTomlFileException": "cff2toml.models.files.toml_file",
+    "SaveTomlFileException": "cff2toml.models.files.toml_file",
+    "TomlFile": "cff2toml.models.files.toml_file",
+    "PyprojectTomlFile": "cff2toml.models.files.pyproject_toml_file",
+}
+
+__all__: List[str] = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,69 @@
+import os
+from typing import Any, Dict, List
+
+# reads the about metadata from cff2toml's own CITATION.cff.
+# hatch_build.py loads this module by its file path to generate
+# cff2toml/_about_metadata.py when a wheel is built, so the about command
+# does not read a file, and it must only import the standard library and PyYAML
+
+ABOUT_METADATA_FILENAME: str = '_about_metadata.py'
+
+
+def read_about_metadata(citation_cff_file_path: str) -> Dict[str, Any]:
+    import yaml
+
+    with open(citation_cff_file_path, 'r') as f:
+        cff_metadata: Dict[str, Any] = yaml.safe_load(f)
+
+    authors: List[Dict[str, str]] = []
+    for author_metadata in cff_metadata.get('authors', []):
+        # formats names like CffPersonAuthor.format_full_name
+        # and CffEntityAuthor do, without importing pydantic
+        if 'given-names' in author_metadata or 'family-names' in author_metadata:
+            name: str = ' '.join([str(n) for n in [author_metadata.get(k, '') for k in [
+                'given-names', 'name-particle', 'family-names', 'name-suffix']] if str(n).strip() != ''])
+        else:
+            name = str(author_metadata.get('name', ''))
+            if name.strip() == '':
+                name = 'anonymous'
+        authors.append(
+            {'name': name, 'email': str(author_metadata.get('email', ''))})
+
+    return {
+        'title': cff_metadata.get('title'),
+        'version': cff_metadata.get('version'),
+        'abstract': cff_metadata.get('abstract'),
+        'license': cff_metadata.get('license'),
+        'repository-code': cff_metadata.get('repository-code'),
+        'authors': authors
+    }
+
+
+def write_about_metadata_module(citation_cff_file_path: str, module_file_path: str) -> None:
+    about_metadata: Dict[str, Any] = read_about_metadata(
+        citation_cff_file_path=citation_cff_file_path)
+    with open(module_file_path, 'w') as f:
+        f.write(
+            f"# generated from CITATION.cff by hatch_build.py, do not edit\nABOUT_METADATA = {about_metadata!r}\n")
+
+
+def _find_citation_cff_file_path() -> str:
+    current_dir: str = os.path.dirname(os.path.abspath(__file__))
+    citation_cff_file_path: str = os.path.join(
+        current_dir, '..', '..', 'CITATION.cff')  # in distribution folder
+    if not os.path.isfile(path=citation_cff_file_path):
+        citation_cff_file_path = os.path.join(
+            current_dir, '..', '..', '..', '..', 'CITATION.cff')
+        if not os.path.isfile(path=citation_cff_file_path):
+            raise Exception('Cannot find the CITATION.cff file.')
+    return citation_cff_file_path
+
+
+def get_about_metadata() -> Dict[str, Any]:
+    # use the metadata generated at build time, and only read CITATION.cff
+    # when running from a source checkout where it was not generated
+    try:
+        from cff2toml._about_metadata import ABOUT_METADATA
+        return ABOUT_METADATA
+    except ImportError:
+        return read_about_metadata(citation_cff_file_path=_find_citation_cff_file_path())
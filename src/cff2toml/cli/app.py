@@ -1,11 +1,43 @@
+from typing import Dict, Union
 from typing_extensions import Annotated
 import typer
-from cff2toml.cli.about_command.about_command import about_command
-from cff2toml.cli.change_command.change_command import app_change
 from cff2toml.cli.context_helpers import TyperContextDictionary
-from cff2toml.cli.view_command.view_command import app_view
-
-app = typer.Typer(no_args_is_help=True)
+from cff2toml.cli.lazy_typer_group import LazyCommand, LazyTyperGroup
+from cff2toml.models.files.yaml_backend import YamlBackendException, YamlBackendName, set_default_yaml_backend
+
+# the commands are imported only when they are run, so that commands
+# and help do not pay for importing every command's dependencies.
+# {command name} -> (module, typer.Typer or command function, help)
+LAZY_COMMANDS: Dict[str, LazyCommand] = {
+    "about": LazyCommand("cff2toml.cli.about_command.about_command", "about_command",
+                         "View information about cff2toml."),
+    "sync-tree": LazyCommand("cff2toml.cli.sync_tree_command.sync_tree_command", "sync_tree_command",
+                             "Synchronize every CITATION.cff and pyproject.toml pair found under a directory in parallel."),
+    "change": LazyCommand("cff2toml.cli.change_command.change_command", "app_change",
+                          "Change metadata to specific value for both CITATION.cff and pyproject.toml files."),
+    "cache": LazyCommand("cff2toml.cli.cache_command.cache_command", "app_cache",
+                         "View, clear or warm the cache of parsed files."),
+    "view": LazyCommand("cff2toml.cli.view_command.view_command", "app_view",
+                        "View metadata for both CITATION.cff and pyproject.toml files."),
+    "parse-names": LazyCommand("cff2toml.cli.parse_names_command.parse_names_command", "parse_names_command",
+                               "Parse full names from stdin into their parts as JSON lines."),
+    "watch": LazyCommand("cff2toml.cli.watch_command.watch_command", "watch_command",
+                         "Watch CITATION.cff and pyproject.toml pairs and synchronize them when either file changes."),
+    "serve": LazyCommand("cff2toml.cli.serve_command.serve_command", "serve_command",
+                         "Serve view, change and sync as JSON-RPC methods over stdio or a Unix socket."),
+    "audit": LazyCommand("cff2toml.cli.audit_command.audit_command", "audit_command",
+                         "Report the commits in which CITATION.cff and pyproject.toml metadata differ."),
+    "check": LazyCommand("cff2toml.cli.check_command.check_command", "check_command",
+                         "Check that CITATION.cff and pyproject.toml pairs are in sync, with exit codes for CI."),
+}
+
+
+class AppGroup(LazyTyperGroup):
+    lazy_commands = LAZY_COMMANDS
+
+
+# help is formatted without rich, whose import costs more than the rest of the startup
+app = typer.Typer(cls=AppGroup, no_args_is_help=True, rich_markup_mode=None)
 
 
 # if you ever want to add a parameter that works without having to invoke a command
@@ -13,20 +45,15 @@ app = typer.Typer(no_args_is_help=True)
 # https://typer.tiangolo.com/tutorial/commands/context/
 
 @app.callback()
-def main(ctx: typer.Context, quiet: Annotated[bool, typer.Option(help="Hidden output mode (Only for 'change' command)")] = False, verbose: Annotated[bool, typer.Option(help="Verbose output mode")] = False, json: Annotated[bool, typer.Option(help="JSON output mode")] = False):
+def main(ctx: typer.Context, quiet: Annotated[bool, typer.Option(help="Hidden output mode (Only for 'change' and 'sync-tree' commands)")] = False, verbose: Annotated[bool, typer.Option(help="Verbose output mode")] = False, json: Annotated[bool, typer.Option(help="JSON output mode")] = False, yaml_backend: Annotated[YamlBackendName, typer.Option(help="YAML backend for reading and writing CFF files (auto uses libyaml when it is available)")] = YamlBackendName.AUTO, cache_dir: Annotated[Union[str, None], typer.Option(help="Directory of an opt-in cache of parsed files", envvar="CFF2TOML_CACHE_DIR")] = None):
+    try:
+        set_default_yaml_backend(yaml_backend)
+    except YamlBackendException as e:
+        raise typer.BadParameter(str(e), param_hint="--yaml-backend")
+    if cache_dir:
+        from cff2toml.models.files.parse_cache import ParseCache, set_default_parse_cache
+        set_default_parse_cache(ParseCache(cache_dir=cache_dir))
     d = TyperContextDictionary(ctx=ctx)
     d.set('quiet', quiet)
     d.set('verbose', verbose)
     d.set('json', json)
-
-
-@app.command(name="about", help="View information about cff2toml.")
-def about(ctx: typer.Context):
-    about_command(ctx=ctx)
-
-
-app.add_typer(app_change, name="change",
-              help="Change metadata to specific value for both CITATION.cff and pyproject.toml files.")
-
-app.add_typer(app_view, name="view",
-              help="View metadata for both CITATION.cff and pyproject.toml files.")
@@ -0,0 +1,58 @@
+from typing import List
+import typer
+from typing_extensions import Annotated
+
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output, is_verbose_output
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILENAME
+from cff2toml.models.files.git_blob_reader import DEFAULT_REV_RANGE, GitException
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILENAME
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_history_auditor import CffAndPyprojectTomlHistoryAuditor, CommitAuditResult
+
+from rich import print, print_json
+
+
+def audit_command(ctx: typer.Context,
+                  rev_range: Annotated[str, typer.Option(help="git revisions to audit, like v1.0..main")] = DEFAULT_REV_RANGE,
+                  repo: Annotated[str, typer.Option(help="directory of the git repository")] = '.',
+                  cff_file_path: Annotated[str, typer.Option(help="CITATION.cff file path from the root of the repository")] = DEFAULT_CITATION_CFF_FILENAME,
+                  pyproject_toml_path: Annotated[str, typer.Option(help="pyproject.toml file path from the root of the repository")] = DEFAULT_PYPROJECT_TOML_FILENAME):
+    """
+    Report the commits in which the metadata of CITATION.cff and pyproject.toml differ, reading both files from git objects
+    """
+    auditor = CffAndPyprojectTomlHistoryAuditor(
+        repo_dir=repo, rev_range=rev_range, cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_path)
+
+    results: List[CommitAuditResult] = []
+    try:
+        for result in auditor.audit():
+            results.append(result)
+            if is_json_output(ctx) or is_quiet_output(ctx):
+                continue
+            if result.error != '':
+                print(
+                    f"{result.commit[:12]} [red]cannot be audited:[/red] {result.error}")
+            elif len(result.missing_file_paths):
+                if is_verbose_output(ctx):
+                    print(
+                        f"{result.commit[:12]} [yellow]has no[/yellow] {' and '.join(result.missing_file_paths)}")
+            elif len(result.drifted_common_property_values):
+                for drifted in result.drifted_common_property_values:
+                    print(
+                        f"{result.commit[:12]} [red]{drifted.common_property_name} differs:[/red] {drifted.cff_property_path} is [green]{drifted.cff_value}[/green] but {drifted.pyproject_toml_property_path} is [green]{drifted.pyproject_toml_value}[/green]")
+            elif is_verbose_output(ctx):
+                print(f"{result.commit[:12]} [green]in sync[/green]")
+    except GitException as e:
+        print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+
+    drifted_results: List[CommitAuditResult] = [
+        result for result in results if len(result.drifted_common_property_values) or result.error != '']
+    if is_json_output(ctx):
+        print_json(data={
+            'rev_range': rev_range,
+            'commits': len(results),
+            'drifted': len(drifted_results),
+            'results': [result.model_dump(mode='json') for result in results]})
+    elif not is_quiet_output(ctx):
+        print(
+            f"[yellow]audited {len(results)} commits that changed[/yellow] {cff_file_path} [yellow]or[/yellow] {pyproject_toml_path} [yellow]in[/yellow] {rev_range} [yellow]and found {len(drifted_results)} with differing metadata[/yellow]")
@@ -0,0 +1,101 @@
+import os
+from typing import List, Union
+import typer
+from typing_extensions import Annotated
+
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.metadata_file import MetadataFile
+from cff2toml.models.files.parse_cache import ParseCache, get_default_parse_cache
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import COMMON_PROPERTY_CFF_KEYS, SYNCHRONIZED_CFF_KEYS
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import find_cff_and_pyproject_toml_file_pairs
+from cff2toml.models.files.toml_file import TomlFile
+
+from rich import print, print_json
+
+app_cache = typer.Typer(no_args_is_help=True, rich_markup_mode=None)
+
+
+# the CFF files are cached by the keys they are opened with, so the files are parsed
+# whole, and with the selected keys of view all, of check, and of the commands that
+# view or change one property
+WARMED_CFF_SELECTED_KEYS: List[Union[List[str], None]] = [None, SYNCHRONIZED_CFF_KEYS, []] + [
+    [cff_key] for cff_key in dict.fromkeys(COMMON_PROPERTY_CFF_KEYS.values())]
+
+
+def _get_parse_cache() -> ParseCache:
+    parse_cache = get_default_parse_cache()
+    if parse_cache is None:
+        raise typer.BadParameter(
+            "There is no cache directory. Use the --cache-dir option or set CFF2TOML_CACHE_DIR.", param_hint="--cache-dir")
+    return parse_cache
+
+
+def _open_metadata_files(file_path: str, parse_cache: ParseCache) -> List[MetadataFile]:
+    if file_path.endswith('.toml'):
+        return [TomlFile(file_path=file_path, parse_cache=parse_cache)]
+    return [CffFile(file_path=file_path, parse_cache=parse_cache, selected_keys=selected_keys) for selected_keys in WARMED_CFF_SELECTED_KEYS]
+
+
+@app_cache.command("stats")
+def cache_stats(ctx: typer.Context):
+    """
+    View the number of entries and the size of the parse cache
+    """
+    parse_cache = _get_parse_cache()
+    stats = parse_cache.stats()
+    if is_json_output(ctx):
+        print_json(stats.model_dump_json())
+    else:
+        print(f"[yellow]cache directory[/yellow]: {stats.cache_dir}")
+        print(f"[yellow]entries[/yellow]: {stats.entries}")
+        print(
+            f"[yellow]size[/yellow]: {stats.size_bytes} of {stats.max_size_bytes} bytes")
+
+
+@app_cache.command("clear")
+def cache_clear(ctx: typer.Context):
+    """
+    Remove every entry from the parse cache
+    """
+    parse_cache = _get_parse_cache()
+    removed = parse_cache.clear()
+    if not is_quiet_output(ctx):
+        print(
+            f"[green]removed {removed} entries from[/green] {parse_cache.cache_dir}")
+
+
+@app_cache.command("warm")
+def cache_warm(ctx: typer.Context,
+               paths: Annotated[List[str], typer.Argument(help="CITATION.cff and TOML files, or directories to search for CITATION.cff and pyproject.toml pairs")] = ['.']):
+    """
+    Parse files into the parse cache ahead of time
+    """
+    parse_cache = _get_parse_cache()
+    file_paths: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for cff_file_path, pyproject_toml_file_path in find_cff_and_pyproject_toml_file_pairs(root_dir=path):
+                file_paths.extend([cff_file_path, pyproject_toml_file_path])
+        else:
+            file_paths.append(path)
+
+    failed: int = 0
+    for file_path in file_paths:
+        try:
+            # loading the file parses it through the cache, and with selected
+            # keys, does not parse the sections of the other keys
+            for metadata_file in _open_metadata_files(file_path=file_path, parse_cache=parse_cache):
+                metadata_file._ensure_loaded()
+        except Exception as e:
+            failed += 1
+            print(f"[red]failed to warm[/red] {file_path}: {e}")
+    parse_cache.evict()
+
+    if is_json_output(ctx):
+        print_json(parse_cache.stats().model_dump_json())
+    elif not is_quiet_output(ctx):
+        print(
+            f"[green]warmed {len(file_paths) - failed} files with {parse_cache.hits} hits and {parse_cache.misses} misses[/green]")
+    if failed:
+        raise typer.Exit(code=1)
@@ -1,14 +1,100 @@
+from typing import Dict, List, Union
 import typer
 from typing_extensions import Annotated
 
-from cff2toml.cli.context_helpers import is_quiet_output
+from cff2toml.cli.command_metadata_output import CommandMetadataOutput
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output
 from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILE_PATH, CffFile
 from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILE_PATH, PyprojectTomlFile
-from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CffAndPyprojectTomlFileSynchronizer
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import COMMON_PROPERTY_CFF_KEYS, PROPERTY_MAPPINGS, CffAndPyprojectTomlFileSynchronizer
 
-from rich import print
+from rich import print, print_json
 
-app_change = typer.Typer(no_args_is_help=True)
+app_change = typer.Typer(no_args_is_help=True, rich_markup_mode=None)
+
+# the names of the change commands that differ from the common property names
+COMMON_PROPERTY_NAME_ALIASES: Dict[str, str] = {
+    "repo": "code_repository_url"
+}
+
+# authors are not a single text value, so they cannot be changed with --set
+SETTABLE_COMMON_PROPERTY_NAMES: List[str] = [
+    common_property_name for common_property_name in PROPERTY_MAPPINGS if common_property_name != "authors"]
+
+
+def _parse_assignments(assignments: List[str]) -> Dict[str, str]:
+    values: Dict[str, str] = {}
+    for assignment in assignments:
+        name, separator, value = assignment.partition('=')
+        name = name.strip()
+        name = COMMON_PROPERTY_NAME_ALIASES.get(name, name)
+        if separator == '' or name not in SETTABLE_COMMON_PROPERTY_NAMES:
+            raise typer.BadParameter(
+                f"{assignment} is not NAME=VALUE, where NAME is one of: {', '.join(SETTABLE_COMMON_PROPERTY_NAMES + list(COMMON_PROPERTY_NAME_ALIASES))}", param_hint="--set")
+        values[name] = value
+    return values
+
+
+def _open_cff_file(cff_file_path: str, common_property_names: List[str]) -> CffFile:
+    # only the sections of the changed properties are parsed, and
+    # the save patches them in place and writes the rest back as it was
+    return CffFile(file_path=cff_file_path, selected_keys=[COMMON_PROPERTY_CFF_KEYS[common_property_name] for common_property_name in common_property_names])
+
+
+@app_change.callback(invoke_without_command=True)
+def change_many(ctx: typer.Context,
+                assignments: Annotated[Union[List[str], None], typer.Option(
+                    "--set", metavar="NAME=VALUE", help="Change a metadata field, like version=1.2.3. Can be repeated to change several fields with one load and one save.")] = None,
+                cff_file_path: Annotated[str, typer.Option(help="CFF file path (Only for --set)"
+                                                           )] = DEFAULT_CITATION_CFF_FILE_PATH,
+                pyproject_toml_path: Annotated[str, typer.Option(help="pyproject.toml file path (Only for --set)")] = DEFAULT_PYPROJECT_TOML_FILE_PATH):
+    """
+    Change both CITATION.CFF and pyproject.toml
+    to have the same metadata.
+    """
+    if ctx.invoked_subcommand is not None:
+        if assignments:
+            raise typer.BadParameter(
+                f"cannot be used with the {ctx.invoked_subcommand} command", param_hint="--set")
+        # the commands have their own file path options, which go after the command name
+        for file_path, default_file_path, param_hint in [(cff_file_path, DEFAULT_CITATION_CFF_FILE_PATH, "--cff-file-path"), (pyproject_toml_path, DEFAULT_PYPROJECT_TOML_FILE_PATH, "--pyproject-toml-path")]:
+            if file_path != default_file_path:
+                raise typer.BadParameter(
+                    f"cannot be used before the {ctx.invoked_subcommand} command, pass it after the command instead", param_hint=param_hint)
+        return
+    if not assignments:
+        return
+    values: Dict[str, str] = _parse_assignments(assignments=assignments)
+
+    cff_file = _open_cff_file(
+        cff_file_path=cff_file_path, common_property_names=list(values))
+    pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
+
+    outputs: List[CommandMetadataOutput] = []
+    for common_metadata_name, value in values.items():
+        output: CommandMetadataOutput = CommandMetadataOutput(
+            command="change",
+            common_metadata_name=common_metadata_name,
+            cff_file_path=cff_file_path,
+            pyproject_toml_file_path=pyproject_toml_path)
+        output.setup_with_files(
+            cff_file=cff_file, pyproject_toml_file=pyproject_toml_file)
+        output.set_after_value(value)
+        outputs.append(output)
+
+    file_sync = CffAndPyprojectTomlFileSynchronizer(
+        cff_file=cff_file, pyproject_toml_file=pyproject_toml_file)
+    file_sync.set_common_properties(values=values)
+    file_sync.save()
+    if is_json_output(ctx=ctx):
+        print_json(data=[output.model_dump(mode='json') for output in outputs])
+    elif not is_quiet_output(ctx=ctx):
+        print(f"[yellow]changing {', '.join(values)} metadata...[/yellow]")
+        for output in outputs:
+            print(
+                f"[green]changed {output.common_metadata_name} for[/green] {output.cff_file_path} from [green]{output.cff_file_metadata_value_before_command}[/green] to [green]{output.cff_file_metadata_value_after_command}[/green]")
+            print(
+                f"[green]changed {output.common_metadata_name} for[/green] {output.pyproject_toml_file_path} from [green]{output.pyproject_toml_file_metadata_value_before_command}[/green] to [green]{output.pyproject_toml_file_metadata_value_after_command}[/green]")
 
 
 @app_change.command("version")
@@ -20,7 +106,8 @@ def change_version(ctx: typer.Context, version: Annotated[str, typer.Argument(he
     Change both CITATION.CFF and pyproject.toml
     to have the same version.
     """
-    cff_file = CffFile(file_path=cff_file_path)
+    cff_file = _open_cff_file(
+        cff_file_path=cff_file_path, common_property_names=["version"])
     pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
 
     file_sync = CffAndPyprojectTomlFileSynchronizer(
@@ -44,7 +131,8 @@ def change_license(ctx: typer.Context, license: Annotated[str, typer.Argument()]
     Change both CITATION.CFF and pyproject.toml
     to have the same license.
     """
-    cff_file = CffFile(file_path=cff_file_path)
+    cff_file = _open_cff_file(
+        cff_file_path=cff_file_path, common_property_names=["license"])
     pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
 
     file_sync = CffAndPyprojectTomlFileSynchronizer(
@@ -69,7 +157,8 @@ def change_title(ctx: typer.Context,
     Change both CITATION.CFF and pyproject.toml
     to have the same title.
     """
-    cff_file = CffFile(file_path=cff_file_path)
+    cff_file = _open_cff_file(
+        cff_file_path=cff_file_path, common_property_names=["title"])
     pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
 
     file_sync = CffAndPyprojectTomlFileSynchronizer(
@@ -94,7 +183,8 @@ def change_description(ctx: typer.Context,
     Change both CITATION.CFF and pyproject.toml
     to have the same description.
     """
-    cff_file = CffFile(file_path=cff_file_path)
+    cff_file = _open_cff_file(
+        cff_file_path=cff_file_path, common_property_names=["description"])
     pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
 
     file_sync = CffAndPyprojectTomlFileSynchronizer(
@@ -119,7 +209,8 @@ def change_code_repository_url(ctx: typer.Context,
     Change both CITATION.CFF and pyproject.toml
     to have the same code repository url.
     """
-    cff_file = CffFile(file_path=cff_file_path)
+    cff_file = _open_cff_file(
+        cff_file_path=cff_file_path, common_property_names=["code_repository_url"])
     pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
 
     file_sync = CffAndPyprojectTomlFileSynchronizer(
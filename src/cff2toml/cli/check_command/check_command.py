@@ -0,0 +1,61 @@
+from typing import Dict, List, Union
+import typer
+from typing_extensions import Annotated
+
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output, is_verbose_output
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_drift import CheckResult, CheckStatus, check_cff_and_pyproject_toml_file_pairs, get_check_status
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import FilePair, find_cff_and_pyproject_toml_file_pairs
+
+from rich import print, print_json
+
+# {status} -> exit code, so a CI job can tell drift apart from files that cannot be read
+CHECK_EXIT_CODES: Dict[CheckStatus, int] = {
+    CheckStatus.IN_SYNC: 0,
+    CheckStatus.DRIFT: 1,
+    CheckStatus.ERROR: 2
+}
+
+
+def check_command(ctx: typer.Context,
+                  root_dirs: Annotated[Union[List[str], None], typer.Argument(help="root directories to search for CITATION.cff and pyproject.toml pairs")] = None,
+                  check_all: Annotated[bool, typer.Option("--all", help="check every property of every pair, instead of stopping at the first difference")] = False):
+    """
+    Check that every CITATION.cff and pyproject.toml pair has the same metadata, without changing them. Exits with 0 when they are in sync, 1 when they differ and 2 when a file cannot be read
+    """
+    if not root_dirs:
+        root_dirs = ['.']
+    file_pairs: List[FilePair] = [
+        file_pair for root_dir in root_dirs for file_pair in find_cff_and_pyproject_toml_file_pairs(root_dir=root_dir)]
+    if not len(file_pairs):
+        if not is_json_output(ctx):
+            print(
+                f"[red]found no CITATION.cff and pyproject.toml pairs under[/red] {', '.join(root_dirs)}")
+        raise typer.Exit(code=CHECK_EXIT_CODES[CheckStatus.ERROR])
+
+    results: List[CheckResult] = []
+    for result in check_cff_and_pyproject_toml_file_pairs(file_pairs=file_pairs, check_all=check_all):
+        results.append(result)
+        if is_json_output(ctx) or is_quiet_output(ctx):
+            continue
+        if result.status == CheckStatus.ERROR:
+            print(
+                f"[red]cannot check[/red] {result.cff_file_path} and {result.pyproject_toml_file_path}: {result.error}")
+        elif result.status == CheckStatus.DRIFT:
+            for drifted in result.drifted_common_property_values:
+                print(
+                    f"[red]{drifted.common_property_name} differs:[/red] {drifted.cff_property_path} in {result.cff_file_path} is [green]{drifted.cff_value}[/green] but {drifted.pyproject_toml_property_path} in {result.pyproject_toml_file_path} is [green]{drifted.pyproject_toml_value}[/green]")
+        elif is_verbose_output(ctx):
+            print(
+                f"[green]in sync[/green] {result.cff_file_path} and {result.pyproject_toml_file_path}")
+
+    status: CheckStatus = get_check_status(results)
+    if is_json_output(ctx):
+        print_json(data={
+            'status': status.value,
+            'pairs': len(file_pairs),
+            'checked': len(results),
+            'results': [result.model_dump(mode='json') for result in results if result.status != CheckStatus.IN_SYNC]})
+    elif not is_quiet_output(ctx):
+        print(
+            f"[yellow]checked {len(results)} of {len(file_pairs)} pairs:[/yellow] {status.value}")
+    raise typer.Exit(code=CHECK_EXIT_CODES[status])
@@ -3,7 +3,7 @@ from typing import Any
 from pydantic import BaseModel
 from cff2toml.models.files.cff_file import CffFile
 from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
-from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import PROPERTY_MAPPINGS
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import COMMON_PROPERTY_CFF_KEYS, PROPERTY_MAPPINGS
 
 
 class CommandMetadataOutput(BaseModel):
@@ -19,9 +19,17 @@ class CommandMetadataOutput(BaseModel):
     pyproject_toml_file_metadata_value_after_command: Any = ''
 
     def setup(self):
-        cff_file = CffFile(file_path=self.cff_file_path)
+        # only the CFF section of the property is parsed, since nothing else is read
+        cff_file = CffFile(file_path=self.cff_file_path, selected_keys=[
+                           COMMON_PROPERTY_CFF_KEYS[self.common_metadata_name]])
         pyproject_toml_file = PyprojectTomlFile(
             file_path=self.pyproject_toml_file_path)
+        self.setup_with_files(cff_file=cff_file,
+                              pyproject_toml_file=pyproject_toml_file)
+
+    def setup_with_files(self, cff_file: CffFile, pyproject_toml_file: PyprojectTomlFile):
+        # reads the values from files that are already open, so
+        # outputs for several properties can share parsed files
         self.pyproject_toml_file_metadata_name = PROPERTY_MAPPINGS[self.common_metadata_name][0]
         self.cff_file_metadata_name = PROPERTY_MAPPINGS[self.common_metadata_name][1]
         self.cff_file_metadata_value_before_command = cff_file.get_metadata(
@@ -0,0 +1,48 @@
+import importlib
+from typing import Dict, List, NamedTuple, Tuple, Union
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    # the module is only imported when the command is run
+    module_name: str
+    # a typer.Typer for a group of commands, or a function for a single command
+    attribute_name: str
+    help: str
+
+
+class LazyTyperGroup(TyperGroup):
+    # subclasses set the commands, since typer creates the group itself
+    lazy_commands: Dict[str, LazyCommand] = {}
+
+    def list_commands(self, ctx) -> List[str]:
+        return list(self.commands) + [name for name in self.lazy_commands if name not in self.commands]
+
+    def get_command(self, ctx, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            # listing the commands in the help only needs their help,
+            # so their modules are not imported until they are run
+            return TyperCommand(name=cmd_name, help=self.lazy_commands[cmd_name].help, rich_markup_mode=None)
+        return command
+
+    def resolve_command(self, ctx, args: List[str]) -> Tuple:
+        if len(args) and args[0] in self.lazy_commands and args[0] not in self.commands:
+            self.add_command(self._load_command(args[0]), args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load_command(self, cmd_name: str):
+        lazy_command: LazyCommand = self.lazy_commands[cmd_name]
+        command_object: Union[typer.Typer, object] = getattr(
+            importlib.import_module(lazy_command.module_name), lazy_command.attribute_name)
+        if isinstance(command_object, typer.Typer):
+            command = typer.main.get_group(command_object)
+        else:
+            command_app = typer.Typer(
+                add_completion=False, rich_markup_mode=None)
+            command_app.command(name=cmd_name)(command_object)
+            command = typer.main.get_command(command_app)
+        command.name = cmd_name
+        command.help = lazy_command.help
+        return command
@@ -0,0 +1,18 @@
+import json
+import sys
+import typer
+
+from cff2toml.models.agents.people.human_name import HumanNameParser
+
+
+def parse_names_command():
+    """
+    Parse full names read line by line from stdin and write their parts as JSON lines to stdout
+    """
+    stdin = typer.get_text_stream('stdin')
+    write = sys.stdout.write
+    # every line is written as soon as it is parsed, so the memory used does not grow with the input,
+    # and every input line has an output line, even an empty one, so the output lines up with the input
+    for human_name in HumanNameParser.parse_many(line.rstrip('\r\n') for line in stdin):
+        write(json.dumps(human_name.model_dump(), ensure_ascii=False))
+        write('\n')
@@ -0,0 +1,38 @@
+import sys
+from typing import Union
+import typer
+from typing_extensions import Annotated
+
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.server.json_rpc_server import JsonRpcServer, JsonRpcServerException
+from cff2toml.server.metadata_rpc_methods import create_metadata_json_rpc_server
+
+from rich import print
+
+
+def serve_command(ctx: typer.Context,
+                  socket: Annotated[Union[str, None], typer.Option(help="path of a Unix socket to listen on, instead of stdin and stdout")] = None,
+                  durability: Annotated[Durability, typer.Option(help="flush no files to disk, or each file as it is written")] = Durability.NONE):
+    """
+    Serve the view, change and sync operations as JSON-RPC methods, one JSON message per line, over stdin and stdout or a Unix socket
+    """
+    json_rpc_server: JsonRpcServer = create_metadata_json_rpc_server(
+        durability=durability)
+    try:
+        if socket is None:
+            # stdout only carries responses, so nothing else is printed
+            json_rpc_server.serve_stream(
+                reader=typer.get_text_stream('stdin'), writer=sys.stdout)
+        else:
+            def on_ready() -> None:
+                if not is_json_output(ctx) and not is_quiet_output(ctx):
+                    print(
+                        f"[yellow]serving on[/yellow] {socket} [yellow](press Ctrl+C to stop)[/yellow]")
+            json_rpc_server.serve_unix_socket(
+                socket_path=socket, on_ready=on_ready)
+    except JsonRpcServerException as e:
+        print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        pass
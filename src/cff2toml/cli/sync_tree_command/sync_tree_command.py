@@ -0,0 +1,58 @@
+from typing import List, Union
+import typer
+from typing_extensions import Annotated
+
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output, is_verbose_output
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import CffAndPyprojectTomlTreeSynchronizer, SyncSource, TreeSyncResult
+
+from rich import print, print_json
+
+
+def sync_tree_command(ctx: typer.Context,
+                      root_dir: Annotated[str, typer.Argument(help="root directory to search for CITATION.cff and pyproject.toml pairs")] = '.',
+                      source: Annotated[SyncSource, typer.Option(help="file whose metadata is copied into the other file of each pair")] = SyncSource.PYPROJECT_TOML,
+                      workers: Annotated[Union[int, None], typer.Option(help="number of worker processes (defaults to the number of CPUs)", min=1)] = None,
+                      delete_missing_metadata: Annotated[bool, typer.Option(help="delete mapped metadata that is missing in the source file")] = True,
+                      durability: Annotated[Durability, typer.Option(help="flush no files to disk, each file as it is written, or all files together at the end")] = Durability.NONE):
+    """
+    Synchronize every CITATION.cff and pyproject.toml pair under a directory
+    """
+    tree_sync = CffAndPyprojectTomlTreeSynchronizer(
+        root_dir=root_dir, source=source, delete_missing_metadata=delete_missing_metadata, max_workers=workers, durability=durability)
+    file_pairs = tree_sync.find_file_pairs()
+
+    results: List[TreeSyncResult] = []
+    for result in tree_sync.sync(file_pairs=file_pairs):
+        results.append(result)
+        if is_json_output(ctx):
+            continue
+        if not result.is_ok:
+            print(
+                f"[red]failed to sync[/red] {result.cff_file_path} and {result.pyproject_toml_file_path}: {result.error}")
+        elif is_verbose_output(ctx):
+            for written_file_path in result.written_file_paths:
+                print(f"[green]wrote[/green] {written_file_path}")
+            if not len(result.written_file_paths):
+                print(
+                    f"[green]unchanged[/green] {result.cff_file_path} and {result.pyproject_toml_file_path}")
+
+    failed_results: List[TreeSyncResult] = [
+        result for result in results if not result.is_ok]
+    written_file_paths: List[str] = [
+        written_file_path for result in results for written_file_path in result.written_file_paths]
+    if is_json_output(ctx):
+        print_json(data={
+            'root_dir': root_dir,
+            'source': source.value,
+            'pairs': len(results),
+            'synced': len(results) - len(failed_results),
+            'failed': len(failed_results),
+            'written_file_paths': written_file_paths,
+            'errors': [result.model_dump() for result in failed_results]})
+    elif not is_quiet_output(ctx):
+        print(
+            f"[yellow]synced {len(results) - len(failed_results)} of {len(results)} pairs under[/yellow] {root_dir} [yellow]and wrote {len(written_file_paths)} files with {len(failed_results)} errors[/yellow]")
+
+    if len(failed_results):
+        raise typer.Exit(code=1)
@@ -1,14 +1,16 @@
+from typing import List
 import typer
 from typing_extensions import Annotated
 
 from cff2toml.cli.command_metadata_output import CommandMetadataOutput
 from cff2toml.cli.context_helpers import is_json_output, is_verbose_output
-from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILE_PATH
-from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILE_PATH
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILE_PATH, CffFile
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILE_PATH, PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import PROPERTY_MAPPINGS, SYNCHRONIZED_CFF_KEYS
 
 from rich import print, print_json
 
-app_view = typer.Typer(no_args_is_help=True)
+app_view = typer.Typer(no_args_is_help=True, rich_markup_mode=None)
 
 
 def _view_metadata(ctx: typer.Context, common_metadata_name: str, cff_file_path: str, pyproject_toml_file_path: str):
@@ -106,3 +108,46 @@ def view_description(
     _view_metadata(ctx=ctx, common_metadata_name="description",
                    cff_file_path=cff_file_path,
                    pyproject_toml_file_path=pyproject_toml_path)
+
+
+@ app_view.command("all")
+def view_all(
+        ctx: typer.Context,
+        cff_file_path: Annotated[str, typer.Option(help="CITATION.cff file path"
+                                                   )] = DEFAULT_CITATION_CFF_FILE_PATH,
+        pyproject_toml_path: Annotated[str, typer.Option(help="pyproject.toml file path")] = DEFAULT_PYPROJECT_TOML_FILE_PATH):
+    """
+    View all synchronized metadata, including authors, for CITATION.CFF and pyproject.toml
+    """
+    # open both files once and read every mapped property from them,
+    # without parsing the CFF sections that are not mapped
+    cff_file = CffFile(file_path=cff_file_path,
+                       selected_keys=SYNCHRONIZED_CFF_KEYS)
+    pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_path)
+    outputs: List[CommandMetadataOutput] = []
+    for common_metadata_name in PROPERTY_MAPPINGS:
+        output: CommandMetadataOutput = CommandMetadataOutput(
+            command="view",
+            common_metadata_name=common_metadata_name,
+            cff_file_path=cff_file_path,
+            pyproject_toml_file_path=pyproject_toml_path)
+        output.setup_with_files(
+            cff_file=cff_file, pyproject_toml_file=pyproject_toml_file)
+        outputs.append(output)
+
+    if not is_json_output(ctx):
+        if is_verbose_output(ctx):
+            print(f"[yellow]viewing all metadata...[/yellow]")
+        for output in outputs:
+            if is_verbose_output(ctx):
+                print(
+                    f"{output.cff_file_path} has {output.cff_file_metadata_name} [green]{output.cff_file_metadata_value_after_command}[/green]")
+                print(
+                    f"{output.pyproject_toml_file_path} has {output.pyproject_toml_file_metadata_name} [green]{output.pyproject_toml_file_metadata_value_after_command}[/green]")
+            else:
+                print(
+                    f"{output.cff_file_path} has {output.common_metadata_name} [green]{output.cff_file_metadata_value_after_command}[/green]")
+                print(
+                    f"{output.pyproject_toml_file_path} has {output.common_metadata_name} [green]{output.pyproject_toml_file_metadata_value_after_command}[/green]")
+    else:
+        print_json(data=[output.model_dump(mode='json') for output in outputs])
@@ -0,0 +1,66 @@
+import json
+import sys
+from typing import List, Union
+import typer
+from typing_extensions import Annotated
+
+from cff2toml.cli.context_helpers import is_json_output, is_quiet_output, is_verbose_output
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.file_watcher import DEFAULT_POLL_INTERVAL_S
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import FilePair, find_cff_and_pyproject_toml_file_pairs
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_watch_synchronizer import DEFAULT_DEBOUNCE_S, CffAndPyprojectTomlWatchSynchronizer, WatchSyncResult
+
+from rich import print
+
+
+def watch_command(ctx: typer.Context,
+                  root_dirs: Annotated[Union[List[str], None], typer.Argument(help="root directories to search for CITATION.cff and pyproject.toml pairs")] = None,
+                  polling: Annotated[bool, typer.Option(help="poll the files instead of using inotify")] = False,
+                  poll_interval: Annotated[float, typer.Option(help="seconds between two polls of the files", min=0.01)] = DEFAULT_POLL_INTERVAL_S,
+                  debounce: Annotated[float, typer.Option(help="seconds without changes before changed files are synced", min=0)] = DEFAULT_DEBOUNCE_S,
+                  delete_missing_metadata: Annotated[bool, typer.Option(help="delete mapped metadata that is missing in the changed file")] = True,
+                  durability: Annotated[Durability, typer.Option(help="flush no files to disk, or each file as it is written")] = Durability.NONE,
+                  timeout: Annotated[Union[float, None], typer.Option(help="stop watching after this many seconds", min=0)] = None):
+    """
+    Watch CITATION.cff and pyproject.toml pairs and synchronize a pair whenever one of its files changes
+    """
+    if not root_dirs:
+        root_dirs = ['.']
+    file_pairs: List[FilePair] = [
+        file_pair for root_dir in root_dirs for file_pair in find_cff_and_pyproject_toml_file_pairs(root_dir=root_dir)]
+    if not len(file_pairs):
+        if not is_json_output(ctx):
+            print(
+                f"[red]found no CITATION.cff and pyproject.toml pairs under[/red] {', '.join(root_dirs)}")
+        raise typer.Exit(code=1)
+
+    watch_sync = CffAndPyprojectTomlWatchSynchronizer(file_pairs=file_pairs, delete_missing_metadata=delete_missing_metadata,
+                                                      debounce_s=debounce, use_polling=polling, poll_interval_s=poll_interval, durability=durability)
+    if not is_json_output(ctx) and not is_quiet_output(ctx):
+        print(
+            f"[yellow]watching {len(file_pairs)} pairs under[/yellow] {', '.join(root_dirs)} [yellow](press Ctrl+C to stop)[/yellow]")
+
+    try:
+        for result in watch_sync.watch(timeout_s=timeout):
+            _print_result(ctx=ctx, result=result)
+    except KeyboardInterrupt:
+        pass
+
+
+def _print_result(ctx: typer.Context, result: WatchSyncResult) -> None:
+    if is_json_output(ctx):
+        # every sync is written as a JSON line as soon as it is done, since watching never ends
+        sys.stdout.write(json.dumps(result.model_dump(mode='json')))
+        sys.stdout.write('\n')
+        sys.stdout.flush()
+    elif not result.is_ok:
+        print(
+            f"[red]failed to sync[/red] {result.cff_file_path} and {result.pyproject_toml_file_path}: {result.error}")
+    elif is_quiet_output(ctx):
+        pass
+    elif len(result.written_file_paths):
+        for written_file_path in result.written_file_paths:
+            print(f"[green]wrote[/green] {written_file_path}")
+    elif is_verbose_output(ctx):
+        print(
+            f"[green]unchanged[/green] {result.cff_file_path} and {result.pyproject_toml_file_path}")
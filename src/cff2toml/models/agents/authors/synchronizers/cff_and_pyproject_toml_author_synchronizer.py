@@ -1,16 +1,75 @@
-from typing import Any, Dict, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
 
 from cff2toml.models.agents.authors.cff_entity_author import CffEntityAuthor
 from cff2toml.models.agents.authors.cff_person_author import CffPersonAuthor
 from cff2toml.models.agents.authors.pyproject_toml_author import PyprojectTomlAuthor
-from cff2toml.models.agents.people.human_name import HumanName
-from cff2toml.models.files.cff_file import CffAuthor
+from cff2toml.models.agents.people.human_name import HumanName, HumanNameParser
+from cff2toml.models.basic_model import BasicModel
+from cff2toml.models.files.cff_file import CffAuthor, CffFile
 
 CffAuthorData = Dict[str, Any]
 PyprojectTomlAuthorData = Dict[str, Any]
 
 Author = Union[CffPersonAuthor, CffEntityAuthor, PyprojectTomlAuthor]
 
+# the canonical form of an author's metadata, which is the same
+# for equal metadata whatever the order of its keys
+AuthorFingerprint = Tuple[Tuple[str, Any], ...]
+
+# the number of converted authors that are remembered, so the authors
+# that did not change since they were last synced are not converted again
+AUTHOR_DATA_CACHE_SIZE: int = 65536
+
+# the fields that a cff person author keeps when it is changed to an anonymous entity author
+ANONYMOUS_ENTITY_AUTHOR_FIELD_NAMES: List[str] = [
+    'email', 'orcid', 'address', 'city', 'alias', 'country', 'fax', 'post_code', 'region', 'tel', 'website']
+
+
+@lru_cache(maxsize=None)
+def _get_serialized_fields(model_class: Type[BasicModel]) -> List[Tuple[str, str, Any]]:
+    # (field name, alias, default) of every field, in the order that model_dump uses
+    return [(field_name, field_info.serialization_alias or field_name, field_info.default)
+            for field_name, field_info in model_class.model_fields.items()]
+
+
+def _to_data(model_class: Type[BasicModel], values: Dict[str, Any]) -> Dict[str, Any]:
+    # the same data as model_class(**values).model_dump(mode="json", exclude_defaults=True, by_alias=True)
+    # for models with string fields, without creating and validating a model
+    data: Dict[str, Any] = {}
+    for field_name, alias, default in _get_serialized_fields(model_class):
+        value = values.get(field_name, default)
+        if value != default:
+            data[alias] = value
+    return data
+
+
+def get_author_fingerprint(author_metadata: Any) -> Union[AuthorFingerprint, None]:
+    # returns None for metadata that cannot be fingerprinted, like
+    # authors that are not tables or have lists as values
+    if not isinstance(author_metadata, dict):
+        return None
+    # dict.items reads the plain values that tomlkit tables also keep,
+    # without creating a tomlkit item for every value
+    author_fingerprint: AuthorFingerprint = tuple(
+        sorted(dict.items(author_metadata)))
+    try:
+        hash(author_fingerprint)
+    except TypeError:
+        return None
+    return author_fingerprint
+
+
+def _model_to_data(model: BasicModel) -> Dict[str, Any]:
+    # the same data as model.model_dump(mode="json", exclude_defaults=True, by_alias=True)
+    # for models with string fields
+    data: Dict[str, Any] = {}
+    for field_name, alias, default in _get_serialized_fields(type(model)):
+        value = getattr(model, field_name)
+        if value != default:
+            data[alias] = value
+    return data
+
 
 class CffAndPyprojectTomlAuthorSynchronizer():
 
@@ -107,3 +166,92 @@ class CffAndPyprojectTomlAuthorSynchronizer():
         else:
             raise TypeError(
                 "Cannot convert to Pyproject TOML data. Should be an instance of CffAuthor or PyprojcetTomlAuthor.")
+
+    @staticmethod
+    def to_author_data(authors: List[Author]) -> Tuple[List[CffAuthorData], List[PyprojectTomlAuthorData]]:
+        # converts the authors to the data of both files in one pass, which is the same data as
+        # to_cff_author_data and to_pyproject_toml_author_data, but the authors are only read,
+        # so they are neither copied nor converted to other models that are validated and dumped
+        author_data_for_cff: List[CffAuthorData] = []
+        author_data_for_pyproject_toml: List[PyprojectTomlAuthorData] = []
+        for author in authors:
+            if isinstance(author, CffPersonAuthor):
+                if not author.given_names and not author.family_names:
+                    # the cff person author is changed to an anonymous entity author
+                    entity_values: Dict[str, Any] = {field_name: getattr(
+                        author, field_name) for field_name in ANONYMOUS_ENTITY_AUTHOR_FIELD_NAMES}
+                    entity_values['name'] = 'anonymous'
+                    author_data_for_cff.append(
+                        _to_data(CffEntityAuthor, entity_values))
+                else:
+                    author_data_for_cff.append(_model_to_data(author))
+                author_data_for_pyproject_toml.append(_to_data(PyprojectTomlAuthor, {'name': ' '.join(
+                    [author.given_names, author.name_particle, author.family_names, author.name_suffix]), 'email': author.email}))
+            elif isinstance(author, CffEntityAuthor):
+                author_data_for_cff.append(_model_to_data(author))
+                author_data_for_pyproject_toml.append(
+                    _to_data(PyprojectTomlAuthor, {'name': author.name}))
+            elif isinstance(author, PyprojectTomlAuthor):
+                first_name, middle_name, particle, last_name, suffix = HumanNameParser.get_name_parts(
+                    text=author.name)
+                if not first_name and not last_name:
+                    author_data_for_cff.append(_to_data(CffEntityAuthor, {
+                                               'name': 'anonymous', 'email': author.email}))
+                else:
+                    author_data_for_cff.append(_to_data(CffPersonAuthor, {
+                        'given_names': first_name + ' ' + middle_name if first_name and middle_name else first_name,
+                        'name_particle': particle,
+                        'family_names': last_name,
+                        'name_suffix': suffix,
+                        'email': author.email}))
+                author_data_for_pyproject_toml.append(_model_to_data(author))
+            else:
+                raise TypeError(
+                    "Cannot convert to author data. Should be an instance of CffAuthor or PyprojcetTomlAuthor.")
+        return author_data_for_cff, author_data_for_pyproject_toml
+
+    @staticmethod
+    def _to_author_data_pair(author: Author) -> Tuple[CffAuthorData, PyprojectTomlAuthorData]:
+        author_data_for_cff, author_data_for_pyproject_toml = CffAndPyprojectTomlAuthorSynchronizer.to_author_data(
+            authors=[author])
+        return author_data_for_cff[0], author_data_for_pyproject_toml[0]
+
+    @staticmethod
+    @lru_cache(maxsize=AUTHOR_DATA_CACHE_SIZE)
+    def _cff_author_fingerprint_to_author_data(author_fingerprint: AuthorFingerprint) -> Tuple[CffAuthorData, PyprojectTomlAuthorData]:
+        return CffAndPyprojectTomlAuthorSynchronizer._to_author_data_pair(CffFile.to_author(dict(author_fingerprint)))
+
+    @staticmethod
+    @lru_cache(maxsize=AUTHOR_DATA_CACHE_SIZE)
+    def _pyproject_toml_author_fingerprint_to_author_data(author_fingerprint: AuthorFingerprint) -> Tuple[CffAuthorData, PyprojectTomlAuthorData]:
+        return CffAndPyprojectTomlAuthorSynchronizer._to_author_data_pair(PyprojectTomlAuthor.model_validate(dict(author_fingerprint)))
+
+    @staticmethod
+    def _metadata_to_author_data(author_metadata_list: List[Any], to_author: Callable[[Any], Author], fingerprint_to_author_data: Callable[[AuthorFingerprint], Tuple[CffAuthorData, PyprojectTomlAuthorData]]) -> Tuple[List[CffAuthorData], List[PyprojectTomlAuthorData]]:
+        author_data_for_cff: List[CffAuthorData] = []
+        author_data_for_pyproject_toml: List[PyprojectTomlAuthorData] = []
+        for author_metadata in author_metadata_list:
+            author_fingerprint = get_author_fingerprint(author_metadata)
+            if author_fingerprint is None:
+                cff_author_data, pyproject_toml_author_data = CffAndPyprojectTomlAuthorSynchronizer._to_author_data_pair(
+                    to_author(author_metadata))
+            else:
+                cff_author_data, pyproject_toml_author_data = fingerprint_to_author_data(
+                    author_fingerprint)
+            # the remembered data is shared, so each file gets its own copy
+            author_data_for_cff.append(dict(cff_author_data))
+            author_data_for_pyproject_toml.append(
+                dict(pyproject_toml_author_data))
+        return author_data_for_cff, author_data_for_pyproject_toml
+
+    @staticmethod
+    def cff_metadata_to_author_data(author_metadata_list: List[Any]) -> Tuple[List[CffAuthorData], List[PyprojectTomlAuthorData]]:
+        # the same data as to_author_data(CffFile.authors), but authors that were converted before
+        # are looked up by their fingerprint instead of being validated and converted again
+        return CffAndPyprojectTomlAuthorSynchronizer._metadata_to_author_data(author_metadata_list=author_metadata_list, to_author=CffFile.to_author, fingerprint_to_author_data=CffAndPyprojectTomlAuthorSynchronizer._cff_author_fingerprint_to_author_data)
+
+    @staticmethod
+    def pyproject_toml_metadata_to_author_data(author_metadata_list: List[Any]) -> Tuple[List[CffAuthorData], List[PyprojectTomlAuthorData]]:
+        # the same data as to_author_data(PyprojectTomlFile.authors), but authors that were converted before
+        # are looked up by their fingerprint instead of being validated and converted again
+        return CffAndPyprojectTomlAuthorSynchronizer._metadata_to_author_data(author_metadata_list=author_metadata_list, to_author=PyprojectTomlAuthor.model_validate, fingerprint_to_author_data=CffAndPyprojectTomlAuthorSynchronizer._pyproject_toml_author_fingerprint_to_author_data)
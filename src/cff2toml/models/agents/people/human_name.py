@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple
 
 from pydantic import BaseModel
 
@@ -30,17 +31,35 @@ class HumanName(BaseModel):
 
     @full_name.setter
     def full_name(self, full_name: str) -> None:
-        name: HumanName = HumanNameParser.parse(text=full_name)
-        self.first_name = name.first_name
-        self.last_name = name.last_name
-        self.middle_name = name.middle_name
-        self.particle = name.particle
-        self.suffix = name.suffix
+        self.first_name, self.middle_name, self.particle, self.last_name, self.suffix = HumanNameParser.get_name_parts(
+            text=full_name)
 
 
-class Token(BaseModel):
-    tag: str
-    value: str
+class Token:
+    # tokens are created for every word of every parsed name,
+    # so they are plain slotted objects instead of pydantic models
+    __slots__ = ('tag', 'value')
+
+    def __init__(self, tag: str, value: str):
+        self.tag = tag
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Token) and self.tag == other.tag and self.value == other.value
+
+    def __repr__(self) -> str:
+        return f"Token(tag={self.tag!r}, value={self.value!r})"
+
+
+# (first name, middle name, particle, last name, suffix)
+HumanNameParts = Tuple[str, str, str, str, str]
+
+_NAME_PARTICLE_SET: FrozenSet[str] = frozenset(NAME_PARTICLES)
+_NAME_SUFFIX_SET: FrozenSet[str] = frozenset(NAME_SUFFIXES)
+
+# the number of parsed names that are remembered, since
+# the same authors are parsed again on every sync
+NAME_PARTS_CACHE_SIZE: int = 4096
 
 
 class HumanNameParser:
@@ -60,7 +79,7 @@ class HumanNameParser:
         if len(raw_tokens):
             # find suffix
             token = raw_tokens.pop()
-            if token.value.casefold() in NAME_SUFFIXES and len(raw_tokens) >= 2:
+            if token.value.casefold() in _NAME_SUFFIX_SET and len(raw_tokens) >= 2:
                 token.tag = HumanNameParser.SUFFIX_TAG
                 tokens.append(token)
             else:
@@ -74,7 +93,7 @@ class HumanNameParser:
                     tokens.append(token)
                     break
                 elif len(raw_tokens) == 1:
-                    if has_last_name and token.value.casefold() in NAME_PARTICLES:
+                    if has_last_name and token.value.casefold() in _NAME_PARTICLE_SET:
                         token.tag = HumanNameParser.PARTICLE_TAG
                         tokens.append(token)
                     elif has_last_name:
@@ -85,7 +104,7 @@ class HumanNameParser:
                         has_last_name = True
                         tokens.append(token)
                 else:
-                    if has_last_name and token.value.casefold() in NAME_PARTICLES:
+                    if has_last_name and token.value.casefold() in _NAME_PARTICLE_SET:
                         token.tag = HumanNameParser.PARTICLE_TAG
                         tokens.append(token)
                     else:
@@ -93,31 +112,30 @@ class HumanNameParser:
 
                         # see if the token is the first part of a particle with 2 words
                         # currently this algorithm only handles particles with at most 2 words
-                        next_token = raw_tokens.pop()
-                        possible_two_word_particle = ' '.join(
-                            [next_token.value, token.value]).casefold()
-                        if has_last_name and possible_two_word_particle in NAME_PARTICLES:
-                            token = Token(
-                                tag=HumanNameParser.PARTICLE_TAG, value=possible_two_word_particle)
-                            tokens.append(token)
-                        elif has_last_name is False:
-                            raw_tokens.append(next_token)
+                        next_token = raw_tokens[-1]
+                        if has_last_name:
+                            possible_two_word_particle = (
+                                next_token.value + ' ' + token.value).casefold()
+                            if possible_two_word_particle in _NAME_PARTICLE_SET:
+                                raw_tokens.pop()
+                                tokens.append(Token(
+                                    tag=HumanNameParser.PARTICLE_TAG, value=possible_two_word_particle))
+                                continue
+
+                        if has_last_name is False:
                             token.tag = HumanNameParser.LAST_NAME_TAG
                             has_last_name = True
                             tokens.append(token)
                         else:
-                            raw_tokens.append(next_token)
-
                             # it is either a middle name token or a n-ary last name token
                             # but we will assume it is a middle name token for now
                             token.tag = HumanNameParser.MIDDLE_NAME_TAG
 
                             # merge middle name with previous token if necessary
-                            previous_token = tokens.pop()
+                            previous_token = tokens[-1]
                             if previous_token.tag == HumanNameParser.MIDDLE_NAME_TAG:
+                                tokens.pop()
                                 token.value = token.value + previous_token.value
-                            else:
-                                tokens.append(previous_token)
 
                             # append middle name token
                             tokens.append(token)
@@ -128,29 +146,42 @@ class HumanNameParser:
         else:
             return []
 
+    @staticmethod
+    @lru_cache(maxsize=NAME_PARTS_CACHE_SIZE)
+    def get_name_parts(text: str) -> HumanNameParts:
+        words: List[str] = text.strip().split(sep=' ')
+        # most names are "Given Family", which are always a first
+        # and a last name, so they do not need to be tokenized
+        if len(words) == 2:
+            return (words[0].strip(), '', '', words[1].strip(), '')
+        if len(words) == 1:
+            return (words[0].strip(), '', '', '', '')
+
+        parts: Dict[str, List[str]] = {HumanNameParser.FIRST_NAME_TAG: [], HumanNameParser.MIDDLE_NAME_TAG: [
+        ], HumanNameParser.PARTICLE_TAG: [], HumanNameParser.LAST_NAME_TAG: [], HumanNameParser.SUFFIX_TAG: []}
+        for token in HumanNameParser.get_tokens(text=text):
+            parts[token.tag].append(token.value)
+        return (' '.join(parts[HumanNameParser.FIRST_NAME_TAG]).strip(),
+                ' '.join(parts[HumanNameParser.MIDDLE_NAME_TAG]).strip(),
+                ' '.join(parts[HumanNameParser.PARTICLE_TAG]).strip(),
+                ' '.join(parts[HumanNameParser.LAST_NAME_TAG]).strip(),
+                ' '.join(parts[HumanNameParser.SUFFIX_TAG]).strip())
+
     @staticmethod
     def parse(text: str) -> HumanName:
+        first_name, middle_name, particle, last_name, suffix = HumanNameParser.get_name_parts(
+            text=text)
+        # the parts are already valid strings, so they are not validated again
+        return HumanName.model_construct(first_name=first_name, middle_name=middle_name, particle=particle, last_name=last_name, suffix=suffix)
 
-        human_name = HumanName()
-
-        tokens: List[Token] = HumanNameParser.get_tokens(text=text)
-
-        for token in tokens:
-            if token.tag == HumanNameParser.FIRST_NAME_TAG:
-                human_name.first_name += ' ' + token.value
-            elif token.tag == HumanNameParser.MIDDLE_NAME_TAG:
-                human_name.middle_name += ' ' + token.value
-            elif token.tag == HumanNameParser.PARTICLE_TAG:
-                human_name.particle += ' ' + token.value
-            elif token.tag == HumanNameParser.LAST_NAME_TAG:
-                human_name.last_name += ' ' + token.value
-            elif token.tag == HumanNameParser.SUFFIX_TAG:
-                human_name.suffix += ' ' + token.value
-
-        human_name.first_name = human_name.first_name.strip()
-        human_name.middle_name = human_name.middle_name.strip()
-        human_name.particle = human_name.particle.strip()
-        human_name.last_name = human_name.last_name.strip()
-        human_name.suffix = human_name.suffix.strip()
-
-        return human_name
+    @staticmethod
+    def parse_many(texts: Iterable[str]) -> Iterator[HumanName]:
+        # the names are parsed one at a time as they are read, so a stream
+        # of names of any length is parsed in constant memory, and the
+        # names seen before in the stream are taken from the cache
+        get_name_parts = HumanNameParser.get_name_parts
+        construct = HumanName.model_construct
+        for text in texts:
+            first_name, middle_name, particle, last_name, suffix = get_name_parts(
+                text=text)
+            yield construct(first_name=first_name, middle_name=middle_name, particle=particle, last_name=last_name, suffix=suffix)
@@ -0,0 +1,125 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import functools
+import threading
+from typing import Any, Callable, Collection, Generic, TypeVar, Union
+
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILE_PATH, CffFile
+from cff2toml.models.files.metadata_file import MetadataFile
+from cff2toml.models.files.parse_cache import ParseCache
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILE_PATH, PyprojectTomlFile
+from cff2toml.models.files.yaml_backend import YamlBackend, YamlBackendName
+
+# the number of threads that read, parse and write files for the async API
+DEFAULT_MAX_ASYNC_WORKERS: int = 8
+
+T = TypeVar('T')
+WrappedFile = TypeVar('WrappedFile', bound=MetadataFile)
+
+
+class AsyncFileExecutor:
+
+    # runs the blocking file operations of the async API in a bounded pool of threads,
+    # so an event loop is never blocked by reading, parsing or writing a file, and no
+    # more than max_workers files are read, parsed or written at the same time
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_ASYNC_WORKERS):
+        self.max_workers = max_workers
+        self._thread_pool: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='cff2toml')
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # the function runs in the context of the caller, so a save with batch
+        # durability joins the WriteBatch that the caller is in
+        context: contextvars.Context = contextvars.copy_context()
+        return await loop.run_in_executor(self._thread_pool, functools.partial(context.run, function, *args, **kwargs))
+
+    def close(self) -> None:
+        self._thread_pool.shutdown(wait=True)
+
+    def __enter__(self) -> 'AsyncFileExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+_default_async_file_executor: Union[AsyncFileExecutor, None] = None
+_default_async_file_executor_lock: threading.Lock = threading.Lock()
+
+
+def get_default_async_file_executor() -> AsyncFileExecutor:
+    # created on first use, so importing the async API does not start threads
+    global _default_async_file_executor
+    with _default_async_file_executor_lock:
+        if _default_async_file_executor is None:
+            _default_async_file_executor = AsyncFileExecutor()
+        return _default_async_file_executor
+
+
+class AsyncMetadataFile(Generic[WrappedFile]):
+
+    # an async counterpart of a metadata file, whose methods run the methods of
+    # the wrapped file in the executor. the wrapped file can be used directly for
+    # the metadata that is already loaded, which does not need the executor
+
+    def __init__(self, file: WrappedFile, *, executor: Union[AsyncFileExecutor, None] = None):
+        if executor is None:
+            executor = get_default_async_file_executor()
+        self.file: WrappedFile = file
+        self.executor = executor
+
+    async def load(self) -> None:
+        await self.executor.run(self.file._ensure_loaded)
+
+    async def get_metadata(self, property_path: str, default_value: Any = None) -> Any:
+        return await self.executor.run(self.file.get_metadata, property_path=property_path, default_value=default_value)
+
+    async def set_metadata(self, property_path: str, value: Any) -> None:
+        await self.executor.run(self.file.set_metadata, property_path=property_path, value=value)
+
+    async def delete_metadata(self, property_path: str) -> None:
+        await self.executor.run(self.file.delete_metadata, property_path=property_path)
+
+    async def has_metadata(self, property_path: str) -> bool:
+        return await self.executor.run(self.file.has_metadata, property_path=property_path)
+
+    async def save(self, file_path: Union[str, None] = None, force: bool = False, durability: Durability = Durability.NONE) -> bool:
+        # returns whether the file was written
+        return await self.executor.run(self.file.save, file_path=file_path, force=force, durability=durability)
+
+    @property
+    def file_path(self) -> str:
+        return self.file.file_path
+
+
+class AsyncCffFile(AsyncMetadataFile[CffFile]):
+
+    @classmethod
+    async def open(cls, file_path: str = DEFAULT_CITATION_CFF_FILE_PATH, *, yaml_backend: Union[YamlBackend, YamlBackendName, str, None] = None, parse_cache: Union[ParseCache, None] = None, selected_keys: Union[Collection[str], None] = None, executor: Union[AsyncFileExecutor, None] = None) -> 'AsyncCffFile':
+        # the file is opened and parsed in the executor
+        if executor is None:
+            executor = get_default_async_file_executor()
+        cff_file: CffFile = await executor.run(_open_loaded_file, CffFile, file_path=file_path, yaml_backend=yaml_backend, parse_cache=parse_cache, selected_keys=selected_keys)
+        return cls(file=cff_file, executor=executor)
+
+
+class AsyncPyprojectTomlFile(AsyncMetadataFile[PyprojectTomlFile]):
+
+    @classmethod
+    async def open(cls, file_path: str = DEFAULT_PYPROJECT_TOML_FILE_PATH, *, parse_cache: Union[ParseCache, None] = None, executor: Union[AsyncFileExecutor, None] = None) -> 'AsyncPyprojectTomlFile':
+        # the file is opened and parsed in the executor
+        if executor is None:
+            executor = get_default_async_file_executor()
+        pyproject_toml_file: PyprojectTomlFile = await executor.run(_open_loaded_file, PyprojectTomlFile, file_path=file_path, parse_cache=parse_cache)
+        return cls(file=pyproject_toml_file, executor=executor)
+
+
+def _open_loaded_file(file_class: Callable[..., WrappedFile], **kwargs: Any) -> WrappedFile:
+    metadata_file: WrappedFile = file_class(**kwargs)
+    metadata_file._ensure_loaded()
+    return metadata_file
+
@@ -0,0 +1,138 @@
+from contextvars import ContextVar
+from enum import Enum
+import os
+import stat
+import tempfile
+import threading
+from typing import Set, Union
+
+
+class Durability(str, Enum):
+    # the file is replaced atomically, but not flushed to disk,
+    # so a crash can lose the new content but never truncates the file
+    NONE = "none"
+    # every file and its directory are flushed to disk before save returns
+    FILE = "file"
+    # files are flushed to disk together when the surrounding WriteBatch ends,
+    # or like FILE when there is no surrounding WriteBatch
+    BATCH = "batch"
+
+
+_umask: Union[int, None] = None
+_umask_lock: threading.Lock = threading.Lock()
+
+
+def _read_umask() -> int:
+    # linux shows the umask in /proc, so it can be read without changing it
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # elsewhere os.umask can only be read by setting it
+    umask: int = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _get_umask() -> int:
+    # read on the first write of a new file, not on import, since setting the umask
+    # to read it changes the umask of every thread of the process for a moment
+    global _umask
+    with _umask_lock:
+        if _umask is None:
+            _umask = _read_umask()
+        return _umask
+
+
+def fsync_directory(dir_path: str) -> None:
+    # makes a rename in the directory durable.
+    # directories cannot be opened on Windows, where this is skipped
+    try:
+        dir_fd: int = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class WriteBatch:
+
+    def __init__(self):
+        self.file_paths: Set[str] = set()
+        self._token = None
+
+    def add(self, file_path: str) -> None:
+        # a symlinked file is replaced in the directory of its target,
+        # so that directory is the one to flush
+        self.file_paths.add(os.path.realpath(file_path))
+
+    def flush(self) -> None:
+        # the written files are flushed when the batch ends, instead of as each one
+        # is written, and then each directory is flushed once to make the renames
+        # durable. os.sync is not used, since it flushes every filesystem of the machine
+        for file_path in self.file_paths:
+            try:
+                with open(file_path, 'rb+') as f:
+                    os.fsync(f.fileno())
+            except OSError:
+                pass
+        for dir_path in {os.path.dirname(file_path) for file_path in self.file_paths}:
+            fsync_directory(dir_path)
+        self.file_paths.clear()
+
+    def __enter__(self):
+        self._token = _current_write_batch.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_write_batch.reset(self._token)
+        self.flush()
+
+
+_current_write_batch: ContextVar[Union[WriteBatch, None]] = ContextVar(
+    '_current_write_batch', default=None)
+
+
+def atomic_write_text(file_path: str, text: str, durability: Durability = Durability.NONE) -> None:
+    # write to a temporary file next to the target and rename it over the
+    # target, so readers see either the old or the new content, never a mix
+    target_file_path: str = os.path.realpath(file_path)
+    dir_path: str = os.path.dirname(target_file_path)
+    write_batch: Union[WriteBatch, None] = _current_write_batch.get()
+    if durability == Durability.BATCH and write_batch is None:
+        durability = Durability.FILE
+
+    fd, tmp_file_path = tempfile.mkstemp(
+        dir=dir_path, prefix='.' + os.path.basename(target_file_path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            if durability == Durability.FILE:
+                f.flush()
+                os.fsync(f.fileno())
+        # temporary files are only readable by their owner,
+        # so give the file the mode the target had, or would get
+        try:
+            os.chmod(tmp_file_path, stat.S_IMODE(
+                os.stat(target_file_path).st_mode))
+        except FileNotFoundError:
+            os.chmod(tmp_file_path, 0o666 & ~_get_umask())
+        os.replace(tmp_file_path, target_file_path)
+    except:
+        try:
+            os.remove(tmp_file_path)
+        except OSError:
+            pass
+        raise
+
+    if durability == Durability.FILE:
+        fsync_directory(dir_path)
+    elif durability == Durability.BATCH and write_batch is not None:
+        write_batch.add(target_file_path)
@@ -1,10 +1,14 @@
-from typing import List, Union
-import yaml
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, Union
 import os
 from cff2toml.models.agents.authors.cff_entity_author import CffEntityAuthor
 from cff2toml.models.agents.authors.cff_person_author import CffPersonAuthor
+from cff2toml.models.files.atomic_write import Durability
 from cff2toml.models.files.metadata_file import MetadataFile, DEFAULT_DIR
+from cff2toml.models.files.parse_cache import ParseCache
+from cff2toml.models.files.yaml_backend import YamlBackend, YamlBackendName, get_yaml_backend
+from cff2toml.models.files.yaml_sections import YamlSections, dump_yaml_sections, get_yaml_section_keys, load_yaml_section_values, load_yaml_sections
 from cff2toml.models.metadata import Metadata
+from cff2toml.models.property_path import compile_property_path
 
 DEFAULT_CITATION_CFF_FILENAME: str = 'CITATION.cff'
 DEFAULT_CITATION_CFF_FILE_PATH: str = os.path.join(
@@ -23,31 +27,199 @@ class SaveCffFileException(Exception):
 
 class CffFile(MetadataFile):
 
-    def __init__(self, file_path: str = DEFAULT_CITATION_CFF_FILE_PATH):
-        super().__init__(file_path=file_path)
+    _yaml_backend: Union[YamlBackend, None] = None
+    # the top level keys that are parsed when the file is loaded, or None for all of them
+    _selected_keys: Union[FrozenSet[str], None] = None
+    # the raw text of every top level key, when only the selected keys were parsed
+    _yaml_sections: Union[YamlSections, None] = None
+
+    # the YAML backend and the parse cache are keyword only so the default
+    # file path remains the only positional default of the constructor.
+    # with selected keys, only the sections of those top level keys are parsed,
+    # and the other sections are kept as raw text, which is parsed when one of
+    # their keys is used, and is written back unchanged otherwise
+    def __init__(self, file_path: str = DEFAULT_CITATION_CFF_FILE_PATH, *, yaml_backend: Union[YamlBackend, YamlBackendName, str, None] = None, parse_cache: Union[ParseCache, None] = None, selected_keys: Union[Collection[str], None] = None):
+        super().__init__(file_path=file_path, parse_cache=parse_cache)
         self.file_path = file_path
+        if not isinstance(yaml_backend, YamlBackend):
+            yaml_backend = get_yaml_backend(name=yaml_backend)
+        self._yaml_backend = yaml_backend
+        if selected_keys is not None:
+            self._selected_keys = frozenset(selected_keys)
+        # only stat the file here, it is parsed on the first metadata access
         try:
-            with open(self.file_path, 'r') as cff_file:
-                self._metadata.from_dict(yaml.safe_load(cff_file))
+            self._file_stat = os.stat(self.file_path)
+        except OSError:
+            raise LoadCffFileException(
+                f"Cannot load this CFF file: {self.file_path}")
+        self._is_loaded = False
+
+    def _parse_selected_keys(self, text: str) -> Union[YamlSections, Dict[str, Any]]:
+        # a document that cannot be split into sections is loaded whole
+        yaml_sections: Union[YamlSections, None] = load_yaml_sections(
+            text=text, keys=self._selected_keys, yaml_backend=self.yaml_backend)
+        if yaml_sections is None:
+            return self.yaml_backend.load(text)
+        return yaml_sections
+
+    def _load_metadata(self) -> None:
+        try:
+            if self._selected_keys is not None:
+                parse = self._parse_selected_keys
+                if self.parse_cache is not None:
+                    parsed = self.parse_cache.load(
+                        file_path=self.file_path, parser_name=f"yaml-sections:{','.join(sorted(self._selected_keys))}", parse=parse)
+                else:
+                    with open(self.file_path, 'r') as cff_file:
+                        parsed = parse(cff_file.read())
+                if isinstance(parsed, YamlSections):
+                    self._yaml_sections = parsed
+                    self._metadata.from_dict(dict(parsed.values))
+                else:
+                    self._metadata.from_dict(parsed)
+            elif self.parse_cache is not None:
+                self._metadata.from_dict(self.parse_cache.load(
+                    file_path=self.file_path, parser_name='yaml', parse=self.yaml_backend.load))
+            else:
+                with open(self.file_path, 'r') as cff_file:
+                    self._metadata.from_dict(self.yaml_backend.load(cff_file))
         except:
             raise LoadCffFileException(
                 f"Cannot load this CFF file: {self.file_path}")
 
-    def save(self, file_path: Union[str, None] = None) -> None:
+    def _load_skipped_sections(self, keys: Union[Iterable[str], None] = None) -> None:
+        # parses the skipped sections of the keys, or of all keys when keys is None
+        self._ensure_loaded()
+        if self._yaml_sections is None:
+            return
+        if keys is None:
+            keys = get_yaml_section_keys(self._yaml_sections)
+        loaded_keys = self._yaml_sections.values.keys()
+        keys_to_load: List[str] = [key for key in keys if key not in loaded_keys]
+        if not len(keys_to_load):
+            return
+        try:
+            yaml_sections: YamlSections = load_yaml_section_values(
+                yaml_sections=self._yaml_sections, keys=keys_to_load, yaml_backend=self.yaml_backend)
+        except Exception:
+            raise LoadCffFileException(
+                f"Cannot load this CFF file: {self.file_path}")
+        self._metadata.add_loaded_properties({key: value for key, value in yaml_sections.values.items(
+        ) if key not in loaded_keys})
+        self._yaml_sections = yaml_sections
+
+    def _load_skipped_section(self, property_path: str) -> None:
+        if self._yaml_sections is None:
+            return
+        property_path_keys = compile_property_path(property_path)
+        if len(property_path_keys) and isinstance(property_path_keys[0], str):
+            self._load_skipped_sections(keys=[property_path_keys[0]])
+        else:
+            self._load_skipped_sections()
+
+    def get_metadata(self, property_path: str, default_value: Any = None) -> Any:
+        self._ensure_loaded()
+        self._load_skipped_section(property_path=property_path)
+        return super().get_metadata(property_path=property_path, default_value=default_value)
+
+    def set_metadata(self, property_path: str, value: Any) -> None:
+        self._ensure_loaded()
+        self._load_skipped_section(property_path=property_path)
+        super().set_metadata(property_path=property_path, value=value)
+
+    def delete_metadata(self, property_path: str) -> None:
+        self._ensure_loaded()
+        self._load_skipped_section(property_path=property_path)
+        super().delete_metadata(property_path=property_path)
+
+    def has_metadata(self, property_path: str) -> bool:
+        self._ensure_loaded()
+        self._load_skipped_section(property_path=property_path)
+        return super().has_metadata(property_path=property_path)
+
+    def restore_metadata(self, metadata_snapshot: Metadata) -> None:
+        # the sections that were parsed after the snapshot was taken are kept,
+        # since they are not parsed again once their keys are loaded
+        self._ensure_loaded()
+        if self._yaml_sections is None:
+            super().restore_metadata(metadata_snapshot)
+            return
+        snapshot_keys = metadata_snapshot.to_clean_dict().keys()
+        self._metadata.restore(metadata_snapshot, loaded_properties={
+                               key: value for key, value in self._yaml_sections.values.items() if key not in snapshot_keys})
+
+    @property
+    def metadata(self) -> Metadata:
+        # the metadata can be read and changed as a whole, so every section is parsed
+        self._load_skipped_sections()
+        return self._metadata
+
+    def _split_loaded_file(self) -> Union[YamlSections, None]:
+        # splits the text that the metadata was loaded from, so a save only writes the
+        # changed sections again. returns None when the file changed since it was opened,
+        # or cannot be split, and the metadata must be dumped whole
+        if self._file_stat is None:
+            return None
+        try:
+            with open(self.file_path, 'r') as cff_file:
+                file_stat: os.stat_result = os.fstat(cff_file.fileno())
+                if (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns) != (self._file_stat.st_ino, self._file_stat.st_size, self._file_stat.st_mtime_ns):
+                    return None
+                text: str = cff_file.read()
+        except OSError:
+            return None
+        yaml_sections: Union[YamlSections, None] = load_yaml_sections(
+            text=text, keys=[], yaml_backend=self.yaml_backend)
+        if yaml_sections is None:
+            return None
+        # every section was loaded with the rest of the file
+        values: Dict[str, Any] = self._metadata.to_clean_dict()
+        if get_yaml_section_keys(yaml_sections) != list(values.keys()):
+            return None
+        return yaml_sections._replace(values=values)
+
+    def save(self, file_path: Union[str, None] = None, force: bool = False, durability: Durability = Durability.NONE) -> bool:
+        # returns whether the file was written
         if file_path is None:
             file_path = self.file_path
+        if self._is_unchanged_file(file_path=file_path, force=force):
+            return False
+        # a forced save, or a save to another path, of a file whose metadata
+        # was never read must write the file's metadata, not an empty document
+        self._ensure_loaded()
         if self._metadata is not None:
             try:
-                with open(file_path, 'w') as cff_file:
-                    yaml.safe_dump(self._metadata.to_dict(),
-                                   cff_file, sort_keys=False)
+                yaml_sections: Union[YamlSections, None] = self._yaml_sections
+                if yaml_sections is None:
+                    yaml_sections = self._split_loaded_file()
+                if yaml_sections is not None:
+                    text, yaml_sections = dump_yaml_sections(
+                        yaml_sections=yaml_sections, data=self._metadata.to_dict(), yaml_backend=self.yaml_backend)
+                else:
+                    text = self.yaml_backend.dump(self._metadata.to_dict())
+                is_written: bool = self._write_text(
+                    file_path=file_path, text=text, force=force, durability=durability)
             except:
                 raise SaveCffFileException(
                     f"Cannot save this CFF file: {file_path}")
+            if yaml_sections is not None and file_path == self.file_path:
+                self._yaml_sections = yaml_sections
+            self._mark_saved(file_path=file_path)
+            return is_written
         else:
             raise SaveCffFileException(
                 f"Cannot save this CFF file: {file_path} because there is no data.")
 
+    @property
+    def selected_keys(self) -> Union[FrozenSet[str], None]:
+        return self._selected_keys
+
+    @property
+    def yaml_backend(self) -> YamlBackend:
+        if self._yaml_backend is None:
+            self._yaml_backend = get_yaml_backend()
+        return self._yaml_backend
+
     @property
     def metadata_version(self):
         return self.get_metadata("version")
@@ -72,21 +244,19 @@ class CffFile(MetadataFile):
     def metadata_repository_code(self):
         return self.get_metadata("repository-code")
 
-    @property
-    def authors(self) -> List[CffAuthor]:
-        cff_authors: List[CffAuthor] = []
-        for author_metadata in self.metadata_authors:
+    @staticmethod
+    def to_author(author_metadata: Dict[str, Any]) -> CffAuthor:
+        metadata: Metadata = Metadata()
+        metadata.from_dict(author_metadata)
 
-            metadata: Metadata = Metadata()
-            metadata.from_dict(author_metadata)
+        if metadata.has('given-names') or metadata.has('family-names'):
+            return CffPersonAuthor.model_validate(author_metadata)
+        else:
+            if not metadata.has('name') or str(metadata.get('name')).strip() == '':
+                metadata.set('name', 'anonymous')
+            # set does not change author_metadata, so validate the changed copy
+            return CffEntityAuthor.model_validate(metadata.to_dict())
 
-            if metadata.has('given-names') or metadata.has('family-names'):
-                cff_author: CffAuthor = CffPersonAuthor.model_validate(
-                    author_metadata)
-            else:
-                if not metadata.has('name') or str(metadata.get('name')).strip() == '':
-                    metadata.set('name', 'anonymous')
-                cff_author: CffAuthor = CffEntityAuthor.model_validate(
-                    author_metadata)
-            cff_authors.append(cff_author)
-        return cff_authors
+    @property
+    def authors(self) -> List[CffAuthor]:
+        return [CffFile.to_author(author_metadata) for author_metadata in self.metadata_authors]
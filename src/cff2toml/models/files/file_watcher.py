@@ -0,0 +1,222 @@
+from abc import ABC, abstractmethod
+import os
+import select
+import struct
+import sys
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Set, Tuple, Union
+
+# a watcher tells which of the watched files may have changed. it watches the
+# directories of the files instead of the files themselves, since a file that is
+# saved by renaming a new file over it, like cff2toml and most editors do, is a
+# new file after every save
+
+DEFAULT_POLL_INTERVAL_S: float = 0.5
+
+# from <sys/inotify.h>
+IN_MODIFY: int = 0x00000002
+IN_ATTRIB: int = 0x00000004
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_Q_OVERFLOW: int = 0x00004000
+IN_CLOEXEC: int = 0o2000000
+IN_NONBLOCK: int = 0o4000
+
+INOTIFY_WATCH_MASK: int = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event without its name, which follows it
+INOTIFY_EVENT_HEADER: struct.Struct = struct.Struct('iIII')
+
+INOTIFY_READ_SIZE: int = 64 * 1024
+
+# the inode, size and modification time of a file, or None for a missing file
+FileSignature = Union[Tuple[int, int, int], None]
+
+
+class FileWatcherException(Exception):
+    pass
+
+
+def to_file_signature(file_stat: Union[os.stat_result, None]) -> FileSignature:
+    if file_stat is None:
+        return None
+    return (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+
+def get_file_signature(file_path: str) -> FileSignature:
+    # changes when the file is written, replaced or deleted
+    try:
+        return to_file_signature(os.stat(file_path))
+    except OSError:
+        return None
+
+
+def _get_remaining_s(deadline: Union[float, None]) -> Union[float, None]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+class FileWatcher(ABC):
+
+    name: str = ''
+
+    def __init__(self, file_paths: Iterable[str]):
+        self.file_paths: FrozenSet[str] = frozenset(
+            os.path.abspath(file_path) for file_path in file_paths)
+
+    @abstractmethod
+    def wait(self, timeout_s: Union[float, None] = None) -> Set[str]:
+        # returns the absolute paths of the watched files that may have changed,
+        # as soon as there are any, or an empty set after timeout_s seconds
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'FileWatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class PollingFileWatcher(FileWatcher):
+
+    name: str = 'polling'
+
+    def __init__(self, file_paths: Iterable[str], poll_interval_s: float = DEFAULT_POLL_INTERVAL_S):
+        super().__init__(file_paths=file_paths)
+        self.poll_interval_s = poll_interval_s
+        self._file_signatures: Dict[str, FileSignature] = {
+            file_path: get_file_signature(file_path) for file_path in self.file_paths}
+
+    def _poll(self) -> Set[str]:
+        changed_file_paths: Set[str] = set()
+        for file_path in self.file_paths:
+            file_signature: FileSignature = get_file_signature(file_path)
+            if file_signature != self._file_signatures[file_path]:
+                self._file_signatures[file_path] = file_signature
+                changed_file_paths.add(file_path)
+        return changed_file_paths
+
+    def wait(self, timeout_s: Union[float, None] = None) -> Set[str]:
+        deadline: Union[float, None] = None if timeout_s is None else time.monotonic() + \
+            timeout_s
+        while True:
+            changed_file_paths: Set[str] = self._poll()
+            remaining_s: Union[float, None] = _get_remaining_s(deadline)
+            if len(changed_file_paths) or remaining_s == 0:
+                return changed_file_paths
+            time.sleep(self.poll_interval_s if remaining_s is None else min(
+                self.poll_interval_s, remaining_s))
+
+
+def _get_libc() -> Any:
+    # inotify has no python module, so it is called through libc, which the
+    # running python is linked with, without a new dependency
+    if not sys.platform.startswith('linux'):
+        raise FileWatcherException("inotify is only available on Linux.")
+    import ctypes
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError) as e:
+        raise FileWatcherException(f"inotify is not available: {e}")
+    inotify_init1.argtypes = [ctypes.c_int]
+    inotify_init1.restype = ctypes.c_int
+    inotify_add_watch.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    inotify_add_watch.restype = ctypes.c_int
+    return libc
+
+
+class InotifyFileWatcher(FileWatcher):
+
+    name: str = 'inotify'
+
+    def __init__(self, file_paths: Iterable[str]):
+        super().__init__(file_paths=file_paths)
+        import ctypes
+        libc = _get_libc()
+        fd: int = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise FileWatcherException(
+                f"Cannot start inotify: {os.strerror(ctypes.get_errno())}")
+        self._fd: int = fd
+        # {watch descriptor} -> {directory path}
+        self._watched_dir_paths: Dict[int, str] = {}
+        try:
+            for dir_path in sorted({os.path.dirname(file_path) for file_path in self.file_paths}):
+                wd: int = libc.inotify_add_watch(
+                    fd, os.fsencode(dir_path), INOTIFY_WATCH_MASK)
+                if wd < 0:
+                    raise FileWatcherException(
+                        f"Cannot watch {dir_path}: {os.strerror(ctypes.get_errno())}")
+                self._watched_dir_paths[wd] = dir_path
+        except:
+            self.close()
+            raise
+
+    def _read_events(self) -> Set[str]:
+        changed_file_paths: Set[str] = set()
+        while True:
+            try:
+                data: bytes = os.read(self._fd, INOTIFY_READ_SIZE)
+            except BlockingIOError:
+                break
+            if not len(data):
+                break
+            offset: int = 0
+            while offset < len(data):
+                wd, mask, _, name_length = INOTIFY_EVENT_HEADER.unpack_from(
+                    data, offset)
+                offset += INOTIFY_EVENT_HEADER.size
+                name: str = os.fsdecode(
+                    data[offset:offset + name_length].rstrip(b'\0'))
+                offset += name_length
+                if mask & IN_Q_OVERFLOW:
+                    # events were lost, so any of the files may have changed
+                    changed_file_paths.update(self.file_paths)
+                    continue
+                dir_path: Union[str, None] = self._watched_dir_paths.get(wd)
+                if dir_path is None or name == '':
+                    continue
+                file_path: str = os.path.join(dir_path, name)
+                if file_path in self.file_paths:
+                    changed_file_paths.add(file_path)
+        return changed_file_paths
+
+    def wait(self, timeout_s: Union[float, None] = None) -> Set[str]:
+        deadline: Union[float, None] = None if timeout_s is None else time.monotonic() + \
+            timeout_s
+        while True:
+            remaining_s: Union[float, None] = _get_remaining_s(deadline)
+            readable_fds, _, _ = select.select(
+                [self._fd], [], [], remaining_s)
+            if len(readable_fds):
+                changed_file_paths: Set[str] = self._read_events()
+                if len(changed_file_paths):
+                    return changed_file_paths
+            if _get_remaining_s(deadline) == 0:
+                return set()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_file_watcher(file_paths: Iterable[str], use_polling: bool = False, poll_interval_s: float = DEFAULT_POLL_INTERVAL_S) -> FileWatcher:
+    # inotify when it is available, and polling otherwise
+    file_paths = list(file_paths)
+    if not use_polling:
+        try:
+            return InotifyFileWatcher(file_paths=file_paths)
+        except FileWatcherException:
+            pass
+    return PollingFileWatcher(file_paths=file_paths, poll_interval_s=poll_interval_s)
@@ -0,0 +1,88 @@
+import subprocess
+from typing import IO, List, NamedTuple, Union
+
+# the files of any commit are read from the git objects of the local repository,
+# without checking out the commit, through one git cat-file --batch process
+
+DEFAULT_REV_RANGE: str = 'HEAD'
+
+
+class GitException(Exception):
+    pass
+
+
+class GitObject(NamedTuple):
+    object_id: str
+    object_type: str
+    content: bytes
+
+
+def _run_git(repo_dir: str, args: List[str]) -> str:
+    try:
+        completed_process: subprocess.CompletedProcess = subprocess.run(
+            ['git', '-C', repo_dir] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise GitException(f"Cannot run git: {e}")
+    if completed_process.returncode != 0:
+        raise GitException(
+            f"git {' '.join(args)} failed: {completed_process.stderr.decode('utf-8', errors='replace').strip()}")
+    return completed_process.stdout.decode('utf-8')
+
+
+def list_git_commits(repo_dir: str, rev_range: str = DEFAULT_REV_RANGE, file_paths: Union[List[str], None] = None) -> List[str]:
+    # the commits of the rev range, oldest first, and only the commits
+    # that changed one of the files when file paths are given
+    args: List[str] = ['rev-list', '--reverse', rev_range, '--']
+    if file_paths is not None:
+        args += file_paths
+    return _run_git(repo_dir=repo_dir, args=args).split()
+
+
+class GitBlobReader:
+
+    def __init__(self, repo_dir: str = '.'):
+        self.repo_dir = repo_dir
+        try:
+            self._process: Union[subprocess.Popen, None] = subprocess.Popen(
+                ['git', '-C', repo_dir, 'cat-file', '--batch'], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            raise GitException(f"Cannot run git: {e}")
+
+    def read_object(self, object_name: str) -> Union[GitObject, None]:
+        # reads an object by any name that git understands, like {commit}:{file path},
+        # and returns None when there is no such object
+        if self._process is None:
+            raise GitException("The git cat-file process is closed.")
+        stdin: IO[bytes] = self._process.stdin
+        stdout: IO[bytes] = self._process.stdout
+        try:
+            stdin.write(object_name.encode('utf-8') + b'\n')
+            stdin.flush()
+            header: bytes = stdout.readline()
+        except OSError as e:
+            raise GitException(f"Cannot read {object_name} with git cat-file: {e}")
+        header_parts: List[str] = header.decode('utf-8').split()
+        if len(header_parts) != 3:
+            if not len(header_parts):
+                raise GitException(
+                    f"git cat-file stopped while reading {object_name}, so {self.repo_dir} may not be a git repository.")
+            # like {object name} missing, or {object name} ambiguous
+            return None
+        object_id, object_type, size = header_parts
+        content: bytes = stdout.read(int(size))
+        # the content is followed by a line feed
+        stdout.read(1)
+        return GitObject(object_id=object_id, object_type=object_type, content=content)
+
+    def close(self) -> None:
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def __enter__(self) -> 'GitBlobReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
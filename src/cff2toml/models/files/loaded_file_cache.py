@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Callable, Collection, Tuple, TypeVar, Union
+
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.file_watcher import FileSignature, get_file_signature, to_file_signature
+from cff2toml.models.files.metadata_file import MetadataFile
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.yaml_backend import YamlBackendName
+
+DEFAULT_MAX_LOADED_FILES: int = 128
+
+LoadedFile = TypeVar('LoadedFile', bound=MetadataFile)
+
+
+class LoadedFileCache:
+
+    # keeps files open across requests, so a file is parsed again only when it changed
+    # on disk. a file is reused while its signature, which is its inode, size and
+    # modification time, is the one it had when it was opened or last saved here
+
+    def __init__(self, yaml_backend: Union[YamlBackendName, str, None] = None,
+                 selected_cff_keys: Union[Collection[str], None] = None,
+                 max_files: int = DEFAULT_MAX_LOADED_FILES):
+        self.yaml_backend = yaml_backend
+        self.selected_cff_keys = selected_cff_keys
+        self.max_files = max_files
+        # {file path} -> (signature, file), with the least recently used file first
+        self._files: OrderedDict[str, Tuple[FileSignature, MetadataFile]] = OrderedDict()
+
+    def _get_file(self, file_path: str, open_file: Callable[[str], LoadedFile]) -> LoadedFile:
+        if file_path in self._files:
+            file_signature, metadata_file = self._files[file_path]
+            if file_signature == get_file_signature(file_path):
+                self._files.move_to_end(file_path)
+                return metadata_file
+            del self._files[file_path]
+        metadata_file = open_file(file_path)
+        self._files[file_path] = (
+            to_file_signature(metadata_file.file_stat), metadata_file)
+        while len(self._files) > self.max_files:
+            self._files.popitem(last=False)
+        return metadata_file
+
+    def _open_cff_file(self, file_path: str) -> CffFile:
+        return CffFile(file_path=file_path, yaml_backend=self.yaml_backend, selected_keys=self.selected_cff_keys)
+
+    def get_cff_file(self, file_path: str) -> CffFile:
+        return self._get_file(file_path=file_path, open_file=self._open_cff_file)
+
+    def get_pyproject_toml_file(self, file_path: str) -> PyprojectTomlFile:
+        return self._get_file(file_path=file_path, open_file=PyprojectTomlFile)
+
+    def mark_saved(self, file_path: str) -> None:
+        # the open file has the metadata that was just written, so it is kept
+        if file_path in self._files:
+            self._files[file_path] = (get_file_signature(
+                file_path), self._files[file_path][1])
+
+    def discard(self, file_path: str) -> None:
+        # for a file whose metadata may differ from the file on disk, like after a failed save
+        self._files.pop(file_path, None)
+
+    def clear(self) -> None:
+        self._files.clear()
+
+    def __len__(self) -> int:
+        return len(self._files)
@@ -1,7 +1,10 @@
-from typing import Any, List
+import os
+from typing import Any, List, Union
 
 from pydantic import BaseModel
 
+from cff2toml.models.files.atomic_write import Durability, atomic_write_text
+from cff2toml.models.files.parse_cache import ParseCache, get_default_parse_cache
 from cff2toml.models.metadata import Metadata
 
 DEFAULT_DIR: str = '.'
@@ -10,21 +13,94 @@ DEFAULT_DIR: str = '.'
 class MetadataFile(BaseModel):
 
     _metadata: Metadata = Metadata()
+    # files are parsed on the first metadata access, not on construction,
+    # so subclasses that read a file set this to False in their constructor
+    _is_loaded: bool = True
+    _file_stat: Union[os.stat_result, None] = None
+    _parse_cache: Union[ParseCache, None] = None
     file_path: str = ''
 
+    def __init__(self, file_path: str = '', *, parse_cache: Union[ParseCache, None] = None):
+        super().__init__(file_path=file_path)
+        if parse_cache is None:
+            parse_cache = get_default_parse_cache()
+        self._parse_cache = parse_cache
+
+    def _load_metadata(self) -> None:
+        # subclasses that read a file parse it into self._metadata here
+        pass
+
+    def _ensure_loaded(self) -> None:
+        if not self._is_loaded:
+            self._load_metadata()
+            self._is_loaded = True
+
+    def _is_unchanged_file(self, file_path: str, force: bool = False) -> bool:
+        # a file that was never loaded, or whose metadata was not
+        # changed since it was loaded or saved, does not need a save
+        if force or file_path != self.file_path:
+            return False
+        return not self._is_loaded or not self._metadata.is_dirty
+
+    def _mark_saved(self, file_path: str) -> None:
+        if file_path == self.file_path:
+            self._metadata.mark_clean()
+
+    def _write_text(self, file_path: str, text: str, force: bool = False, durability: Durability = Durability.NONE) -> bool:
+        # skip the write when the file already has this content,
+        # so its modification time does not change
+        if not force:
+            try:
+                with open(file_path, 'r') as f:
+                    if f.read() == text:
+                        return False
+            except OSError:
+                pass
+        atomic_write_text(file_path=file_path, text=text,
+                          durability=durability)
+        return True
+
     def get_metadata(self, property_path: str, default_value: Any = None) -> Any:
+        self._ensure_loaded()
         return self._metadata.get(property_path=property_path, default_value=default_value)
 
     def set_metadata(self, property_path: str, value: Any) -> None:
+        self._ensure_loaded()
         self._metadata.set(property_path=property_path, value=value)
 
     def delete_metadata(self, property_path: str) -> None:
+        self._ensure_loaded()
         if self._metadata is not None:
             self._metadata.delete(property_path=property_path)
 
     def has_metadata(self, property_path: str) -> bool:
+        self._ensure_loaded()
         return self._metadata.has(property_path=property_path)
 
+    def snapshot_metadata(self) -> Metadata:
+        # like metadata.snapshot(), but a subclass that loads its metadata
+        # in parts does not have to load the parts that were not used
+        self._ensure_loaded()
+        return self._metadata.snapshot()
+
+    def restore_metadata(self, metadata_snapshot: Metadata) -> None:
+        self._ensure_loaded()
+        self._metadata.restore(metadata_snapshot)
+
     @property
     def metadata(self) -> Metadata:
+        self._ensure_loaded()
         return self._metadata
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._is_loaded
+
+    @property
+    def parse_cache(self) -> Union[ParseCache, None]:
+        return self._parse_cache
+
+    @property
+    def file_stat(self) -> Union[os.stat_result, None]:
+        # the stat of the file when it was opened
+        return self._file_stat
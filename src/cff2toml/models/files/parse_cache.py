@@ -0,0 +1,234 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Callable, List, Tuple, Union
+
+from pydantic import BaseModel
+
+# bump this when the layout or the pickled data changes
+PARSE_CACHE_FORMAT_VERSION: int = 1
+
+DEFAULT_PARSE_CACHE_MAX_SIZE_BYTES: int = 64 * 1024 * 1024
+
+# files modified this recently are not indexed by their stat,
+# because a second change within the same mtime tick with the
+# same size would be indistinguishable from the cached version
+RACY_MTIME_WINDOW_NS: int = 2 * 1_000_000_000
+
+# checking the cache size needs a directory scan,
+# so only do it after this many writes per process
+EVICTION_CHECK_INTERVAL: int = 64
+
+
+class ParseCacheStats(BaseModel):
+    cache_dir: str
+    entries: int = 0
+    size_bytes: int = 0
+    max_size_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class ParseCache:
+    # an opt-in on-disk cache of parsed files.
+    # entries are pickled, so only point it at a directory you trust.
+    #
+    # layout, where the stat index maps (parser, path, size, mtime_ns)
+    # to the content hash of the file, and the data entries hold the
+    # parsed metadata of each distinct file content:
+    #   {cache_dir}/v{PARSE_CACHE_FORMAT_VERSION}/stat/{key}
+    #   {cache_dir}/v{PARSE_CACHE_FORMAT_VERSION}/data/{content hash}.pickle
+    #
+    # every file is written to a temporary file and renamed into place,
+    # so processes that share the cache directory never see partial entries
+
+    def __init__(self, cache_dir: str, max_size_bytes: int = DEFAULT_PARSE_CACHE_MAX_SIZE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self._writes_since_eviction_check = 0
+
+    @property
+    def _versioned_dir(self) -> str:
+        return os.path.join(self.cache_dir, f"v{PARSE_CACHE_FORMAT_VERSION}")
+
+    @property
+    def _stat_dir(self) -> str:
+        return os.path.join(self._versioned_dir, 'stat')
+
+    @property
+    def _data_dir(self) -> str:
+        return os.path.join(self._versioned_dir, 'data')
+
+    def _stat_key(self, parser_name: str, file_path: str, file_stat: os.stat_result) -> str:
+        key: str = '\0'.join([parser_name, os.path.abspath(file_path), str(
+            file_stat.st_size), str(file_stat.st_mtime_ns)])
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=20).hexdigest()
+
+    def _content_key(self, parser_name: str, content: bytes) -> str:
+        content_hash = hashlib.blake2b(digest_size=20)
+        content_hash.update(parser_name.encode('utf-8'))
+        content_hash.update(b'\0')
+        content_hash.update(content)
+        return content_hash.hexdigest()
+
+    def _data_path(self, content_key: str) -> str:
+        return os.path.join(self._data_dir, content_key + '.pickle')
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        dir_path: str = os.path.dirname(path)
+        os.makedirs(dir_path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_entry(self, path: str, content: bytes) -> None:
+        # the cache is only an optimization, so a full disk or a read only
+        # cache directory must not stop the file from being loaded
+        try:
+            self._write_atomically(path=path, content=content)
+        except OSError:
+            pass
+
+    def _read_data(self, content_key: str) -> Tuple[bool, Any]:
+        data_path: str = self._data_path(content_key)
+        try:
+            with open(data_path, 'rb') as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # a corrupt entry, or one pickled by an incompatible
+            # library version, is treated as a miss and replaced
+            self._remove(data_path)
+            return False, None
+        # refresh the modification time so eviction is least recently used
+        try:
+            os.utime(data_path)
+        except OSError:
+            pass
+        return True, data
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def load(self, file_path: str, parser_name: str, parse: Callable[[str], Any]) -> Any:
+        # returns the parsed content of the file, either from the cache
+        # or by calling parse on the decoded file content
+        with open(file_path, 'rb') as f:
+            file_stat: os.stat_result = os.fstat(f.fileno())
+            stat_key_path: str = os.path.join(
+                self._stat_dir, self._stat_key(parser_name=parser_name, file_path=file_path, file_stat=file_stat))
+            try:
+                with open(stat_key_path, 'r') as stat_key_file:
+                    is_hit, data = self._read_data(stat_key_file.read())
+                if is_hit:
+                    self.hits += 1
+                    return data
+            except OSError:
+                pass
+            content: bytes = f.read()
+
+        content_key: str = self._content_key(
+            parser_name=parser_name, content=content)
+        is_hit, data = self._read_data(content_key)
+        if is_hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            data = parse(content.decode('utf-8'))
+            self._write_entry(self._data_path(content_key), pickle.dumps(
+                data, protocol=pickle.HIGHEST_PROTOCOL))
+            self._writes_since_eviction_check += 1
+
+        if time.time_ns() - file_stat.st_mtime_ns > RACY_MTIME_WINDOW_NS:
+            self._write_entry(stat_key_path, content_key.encode('utf-8'))
+
+        if self._writes_since_eviction_check >= EVICTION_CHECK_INTERVAL:
+            self.evict()
+        return data
+
+    def _list_entries(self, dir_path: str) -> List[os.DirEntry]:
+        try:
+            with os.scandir(dir_path) as entries:
+                # skip the temporary files that other processes are writing
+                return [entry for entry in entries if entry.is_file(follow_symlinks=False) and not entry.name.startswith('.tmp-')]
+        except FileNotFoundError:
+            return []
+
+    def evict(self) -> int:
+        # removes the least recently used data entries until the
+        # cache fits in max_size_bytes, and returns how many were removed
+        self._writes_since_eviction_check = 0
+        sized_entries: List[Tuple[int, int, str]] = []
+        size_bytes: int = 0
+        for entry in self._list_entries(self._data_dir):
+            try:
+                entry_stat: os.stat_result = entry.stat()
+            except FileNotFoundError:
+                continue
+            sized_entries.append(
+                (entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+            size_bytes += entry_stat.st_size
+
+        evicted: int = 0
+        sized_entries.sort()
+        for _, entry_size, entry_path in sized_entries:
+            if size_bytes <= self.max_size_bytes:
+                break
+            self._remove(entry_path)
+            size_bytes -= entry_size
+            evicted += 1
+
+        # every edit of a file adds a stat index entry, and entries that
+        # point to evicted data are misses, so the index is dropped when
+        # it outgrows the data. it is rebuilt from the content hashes.
+        stat_entries: List[os.DirEntry] = self._list_entries(self._stat_dir)
+        if len(stat_entries) > 4 * max(1, len(sized_entries) - evicted):
+            for entry in stat_entries:
+                self._remove(entry.path)
+        return evicted
+
+    def clear(self) -> int:
+        removed: int = 0
+        for dir_path in [self._stat_dir, self._data_dir]:
+            for entry in self._list_entries(dir_path):
+                self._remove(entry.path)
+                if dir_path == self._data_dir:
+                    removed += 1
+        return removed
+
+    def stats(self) -> ParseCacheStats:
+        stats: ParseCacheStats = ParseCacheStats(
+            cache_dir=self.cache_dir, max_size_bytes=self.max_size_bytes, hits=self.hits, misses=self.misses)
+        for entry in self._list_entries(self._data_dir):
+            try:
+                stats.size_bytes += entry.stat().st_size
+                stats.entries += 1
+            except FileNotFoundError:
+                continue
+        return stats
+
+
+_default_parse_cache: Union[ParseCache, None] = None
+
+
+def get_default_parse_cache() -> Union[ParseCache, None]:
+    return _default_parse_cache
+
+
+def set_default_parse_cache(parse_cache: Union[ParseCache, None]) -> None:
+    global _default_parse_cache
+    _default_parse_cache = parse_cache
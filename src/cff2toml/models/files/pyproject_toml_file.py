@@ -1,7 +1,8 @@
 import os
-from typing import List
+from typing import List, Union
 from cff2toml.models.agents.authors.pyproject_toml_author import PyprojectTomlAuthor
 from cff2toml.models.files.metadata_file import DEFAULT_DIR
+from cff2toml.models.files.parse_cache import ParseCache
 from cff2toml.models.files.toml_file import TomlFile
 
 DEFAULT_PYPROJECT_TOML_FILENAME: str = 'pyproject.toml'
@@ -12,8 +13,8 @@ DEFAULT_PYPROJECT_TOML_FILE_PATH: str = os.path.join(
 
 class PyprojectTomlFile(TomlFile):
 
-    def __init__(self, file_path: str = DEFAULT_PYPROJECT_TOML_FILE_PATH):
-        super().__init__(file_path=file_path)
+    def __init__(self, file_path: str = DEFAULT_PYPROJECT_TOML_FILE_PATH, *, parse_cache: Union[ParseCache, None] = None):
+        super().__init__(file_path=file_path, parse_cache=parse_cache)
 
     @property
     def metadata_project_version(self):
@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Set, Union
+
+from cff2toml.models.files.async_metadata_file import AsyncCffFile, AsyncFileExecutor, AsyncPyprojectTomlFile, get_default_async_file_executor
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILE_PATH
+from cff2toml.models.files.parse_cache import ParseCache
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILE_PATH
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CffAndPyprojectTomlFileSynchronizer, CommonPropertyValues
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import FilePair, SyncSource, TreeSyncResult, sync_cff_and_pyproject_toml_file_pair
+from cff2toml.models.files.yaml_backend import YamlBackendName
+
+
+class AsyncCffAndPyprojectTomlFileSynchronizer:
+
+    # an async counterpart of CffAndPyprojectTomlFileSynchronizer, whose
+    # methods run the methods of the synchronizer in the executor
+
+    def __init__(self, cff_file: AsyncCffFile, pyproject_toml_file: AsyncPyprojectTomlFile, *, executor: Union[AsyncFileExecutor, None] = None):
+        if executor is None:
+            executor = cff_file.executor
+        self.cff_file = cff_file
+        self.pyproject_toml_file = pyproject_toml_file
+        self.executor = executor
+        self.file_sync: CffAndPyprojectTomlFileSynchronizer = CffAndPyprojectTomlFileSynchronizer(
+            cff_file=cff_file.file, pyproject_toml_file=pyproject_toml_file.file)
+
+    @classmethod
+    async def open(cls, cff_file_path: str = DEFAULT_CITATION_CFF_FILE_PATH, pyproject_toml_file_path: str = DEFAULT_PYPROJECT_TOML_FILE_PATH, *,
+                   yaml_backend: Union[YamlBackendName, str, None] = None, parse_cache: Union[ParseCache, None] = None,
+                   executor: Union[AsyncFileExecutor, None] = None) -> 'AsyncCffAndPyprojectTomlFileSynchronizer':
+        # both files are opened and parsed at the same time
+        if executor is None:
+            executor = get_default_async_file_executor()
+        cff_file, pyproject_toml_file = await asyncio.gather(
+            AsyncCffFile.open(file_path=cff_file_path, yaml_backend=yaml_backend,
+                              parse_cache=parse_cache, executor=executor),
+            AsyncPyprojectTomlFile.open(file_path=pyproject_toml_file_path, parse_cache=parse_cache, executor=executor))
+        return cls(cff_file=cff_file, pyproject_toml_file=pyproject_toml_file, executor=executor)
+
+    async def update_cff_with_pyproject_toml(self, delete_missing_metadata: bool = True) -> None:
+        await self.executor.run(self.file_sync.update_cff_with_pyproject_toml, delete_missing_metadata=delete_missing_metadata)
+
+    async def update_pyproject_toml_with_cff(self, delete_missing_metadata: bool = True) -> None:
+        await self.executor.run(self.file_sync.update_pyproject_toml_with_cff, delete_missing_metadata=delete_missing_metadata)
+
+    async def get_common_property_values(self) -> Dict[str, CommonPropertyValues]:
+        return await self.executor.run(self.file_sync.get_common_property_values)
+
+    async def set_common_properties(self, values: Dict[str, Any]) -> None:
+        await self.executor.run(self.file_sync.set_common_properties, values=values)
+
+    async def save(self, durability: Durability = Durability.NONE) -> List[str]:
+        # returns the paths of the files that were written
+        return await self.executor.run(self.file_sync.save, durability=durability)
+
+
+async def async_sync_file_pairs(file_pairs: Iterable[FilePair], source: SyncSource = SyncSource.PYPROJECT_TOML,
+                                delete_missing_metadata: bool = True, max_concurrency: Union[int, None] = None,
+                                yaml_backend: Union[YamlBackendName, str, None] = None,
+                                durability: Durability = Durability.NONE,
+                                executor: Union[AsyncFileExecutor, None] = None) -> AsyncIterator[TreeSyncResult]:
+    # syncs every pair in the executor and yields the result of each pair as soon as
+    # it is done, so the results are in the order the pairs finish. no more than
+    # max_concurrency pairs, which defaults to the workers of the executor, are
+    # in flight at once, so the file pairs can come from a lazy iterable of any size
+    if executor is None:
+        executor = get_default_async_file_executor()
+    if max_concurrency is None:
+        max_concurrency = executor.max_workers
+    file_pair_iterator: Iterator[FilePair] = iter(file_pairs)
+    pending: Set['asyncio.Future[TreeSyncResult]'] = set()
+
+    def start_next_file_pair() -> None:
+        for cff_file_path, pyproject_toml_file_path in file_pair_iterator:
+            pending.add(asyncio.ensure_future(executor.run(sync_cff_and_pyproject_toml_file_pair, cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_file_path,
+                        source=source, delete_missing_metadata=delete_missing_metadata, yaml_backend=yaml_backend, durability=durability)))
+            return
+
+    try:
+        for _ in range(max(1, max_concurrency)):
+            start_next_file_pair()
+        while len(pending):
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                start_next_file_pair()
+                yield future.result()
+    finally:
+        # the pairs that were not started are never started when the caller stops early
+        for future in pending:
+            future.cancel()
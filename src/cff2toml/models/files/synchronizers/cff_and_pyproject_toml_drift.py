@@ -0,0 +1,92 @@
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator, List, Union
+
+from pydantic import BaseModel
+
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import PROPERTY_MAPPINGS, CommonPropertyValues, is_common_property_in_sync
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import FilePair
+from cff2toml.models.files.yaml_backend import YamlBackendName
+from cff2toml.models.metadata import Metadata
+
+
+def iter_drifted_common_property_values(get_cff_value: Callable[[str], Any], get_pyproject_toml_value: Callable[[str], Any]) -> Iterator[CommonPropertyValues]:
+    # the values of the common properties whose values differ between the files. the values
+    # are read one property at a time, so a caller that stops at the first drifted property
+    # does not read, or parse, the properties after it
+    for common_property_name, (pyproject_toml_property_path, cff_property_path) in PROPERTY_MAPPINGS.items():
+        cff_value: Any = get_cff_value(cff_property_path)
+        pyproject_toml_value: Any = get_pyproject_toml_value(
+            pyproject_toml_property_path)
+        if not is_common_property_in_sync(common_property_name=common_property_name, cff_value=cff_value, pyproject_toml_value=pyproject_toml_value):
+            yield CommonPropertyValues(
+                common_property_name=common_property_name,
+                cff_property_path=cff_property_path,
+                cff_value=cff_value,
+                pyproject_toml_property_path=pyproject_toml_property_path,
+                pyproject_toml_value=pyproject_toml_value)
+
+
+def get_drifted_common_property_values(cff_metadata: Metadata, pyproject_toml_metadata: Metadata) -> List[CommonPropertyValues]:
+    return list(iter_drifted_common_property_values(get_cff_value=cff_metadata.get, get_pyproject_toml_value=pyproject_toml_metadata.get))
+
+
+class CheckStatus(str, Enum):
+    IN_SYNC = "in-sync"
+    DRIFT = "drift"
+    # a file is missing or cannot be parsed
+    ERROR = "error"
+
+
+# the statuses from the best to the worst, so the status of several checks is the worst of them
+CHECK_STATUS_ORDER: List[CheckStatus] = [
+    CheckStatus.IN_SYNC, CheckStatus.DRIFT, CheckStatus.ERROR]
+
+
+class CheckResult(BaseModel):
+    cff_file_path: str
+    pyproject_toml_file_path: str
+    status: CheckStatus = CheckStatus.IN_SYNC
+    drifted_common_property_values: List[CommonPropertyValues] = []
+    error: str = ''
+
+
+def check_cff_and_pyproject_toml_file_pair(cff_file_path: str, pyproject_toml_file_path: str, check_all: bool = False,
+                                           yaml_backend: Union[YamlBackendName, str, None] = None) -> CheckResult:
+    # compares the files without changing them, and stops at the first drifted
+    # property unless check_all is set. the CFF file is split into its top level
+    # sections, and only the sections of the compared properties are parsed
+    result: CheckResult = CheckResult(
+        cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_file_path)
+    try:
+        cff_file: CffFile = CffFile(
+            file_path=cff_file_path, yaml_backend=yaml_backend, selected_keys=[])
+        pyproject_toml_file: PyprojectTomlFile = PyprojectTomlFile(
+            file_path=pyproject_toml_file_path)
+        for drifted_common_property_values in iter_drifted_common_property_values(get_cff_value=cff_file.get_metadata, get_pyproject_toml_value=pyproject_toml_file.get_metadata):
+            result.drifted_common_property_values.append(
+                drifted_common_property_values)
+            result.status = CheckStatus.DRIFT
+            if not check_all:
+                break
+    except Exception as e:
+        result.status = CheckStatus.ERROR
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def check_cff_and_pyproject_toml_file_pairs(file_pairs: Iterable[FilePair], check_all: bool = False,
+                                            yaml_backend: Union[YamlBackendName, str, None] = None) -> Iterator[CheckResult]:
+    # yields the result of every pair, but stops after the first pair
+    # that is not in sync unless check_all is set
+    for cff_file_path, pyproject_toml_file_path in file_pairs:
+        result: CheckResult = check_cff_and_pyproject_toml_file_pair(
+            cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_file_path, check_all=check_all, yaml_backend=yaml_backend)
+        yield result
+        if result.status != CheckStatus.IN_SYNC and not check_all:
+            return
+
+
+def get_check_status(results: Iterable[CheckResult]) -> CheckStatus:
+    return max((result.status for result in results), key=CHECK_STATUS_ORDER.index, default=CheckStatus.IN_SYNC)
@@ -1,8 +1,13 @@
-from typing import Any, Dict, List, Tuple, Union
-from cff2toml.models.agents.authors.pyproject_toml_author import PyprojectTomlAuthor
-from cff2toml.models.agents.authors.synchronizers.cff_and_pyproject_toml_author_synchronizer import Author, CffAndPyprojectTomlAuthorSynchronizer, CffAuthorData, PyprojectTomlAuthorData
-from cff2toml.models.files.cff_file import CffAuthor, CffFile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple, Union
+from pydantic import BaseModel
+from cff2toml.models.agents.authors.synchronizers.cff_and_pyproject_toml_author_synchronizer import Author, CffAndPyprojectTomlAuthorSynchronizer, CffAuthorData, PyprojectTomlAuthorData, get_author_fingerprint
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.metadata_file import MetadataFile
 from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.metadata import Metadata
+from cff2toml.models.property_path import compile_property_path
 
 # {common property name} -> (pyproject.toml property path}, {cff property path})
 PROPERTY_MAPPINGS: Dict[str, Tuple[str, str]] = {
@@ -14,11 +19,95 @@ PROPERTY_MAPPINGS: Dict[str, Tuple[str, str]] = {
     "authors": ("project.authors", "authors")
 }
 
+# {common property name} -> {top level key of the cff property path}, so a CFF file
+# can be opened with only the keys of the common properties that are used selected
+COMMON_PROPERTY_CFF_KEYS: Dict[str, str] = {common_property_name: str(compile_property_path(cff_property_path)[0])
+                                            for common_property_name, (_, cff_property_path) in PROPERTY_MAPPINGS.items()}
+
+# the top level keys of the CFF file that are synchronized
+SYNCHRONIZED_CFF_KEYS: List[str] = list(COMMON_PROPERTY_CFF_KEYS.values())
+
 
 class CffAndPyprojectTomlFileSynchronizerException(Exception):
     pass
 
 
+def _to_pyproject_toml_author_data(author_metadata_list: Any, is_cff: bool) -> List[PyprojectTomlAuthorData]:
+    if is_cff:
+        author_data_list: List[PyprojectTomlAuthorData] = CffAndPyprojectTomlAuthorSynchronizer.cff_metadata_to_author_data(
+            author_metadata_list=author_metadata_list)[1]
+    else:
+        author_data_list = CffAndPyprojectTomlAuthorSynchronizer.pyproject_toml_metadata_to_author_data(
+            author_metadata_list=author_metadata_list)[1]
+    # names that are joined from empty name parts have extra spaces, like 'Will  Riley '
+    return [{key: ' '.join(value.split()) if isinstance(value, str) else value for key, value in author_data.items()} for author_data in author_data_list]
+
+
+def _normalize_value(value: Any) -> Any:
+    # YAML reads unquoted versions like 1.0 as numbers, and folded text
+    # ends with a line break, so these compare equal to TOML strings
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    return value
+
+
+def is_common_property_in_sync(common_property_name: str, cff_value: Any, pyproject_toml_value: Any) -> bool:
+    # authors have different fields in each file, so they are in sync when
+    # both files' authors give the same authors for pyproject.toml
+    if common_property_name == "authors" and isinstance(cff_value, list) and isinstance(pyproject_toml_value, list):
+        try:
+            return _to_pyproject_toml_author_data(cff_value, is_cff=True) == _to_pyproject_toml_author_data(pyproject_toml_value, is_cff=False)
+        except Exception:
+            return False
+    return _normalize_value(cff_value) == _normalize_value(pyproject_toml_value)
+
+
+class CommonPropertyValues(BaseModel):
+    common_property_name: str
+    cff_property_path: str
+    cff_value: Any = None
+    pyproject_toml_property_path: str
+    pyproject_toml_value: Any = None
+
+    @property
+    def is_in_sync(self) -> bool:
+        return is_common_property_in_sync(common_property_name=self.common_property_name, cff_value=self.cff_value, pyproject_toml_value=self.pyproject_toml_value)
+
+
+def _is_same_author_data(current_author_data: Any, author_data: Dict[str, Any]) -> bool:
+    # authors are compared by their fingerprints, which are cheaper to compare
+    # than tomlkit tables, and are the same whatever the order of their keys
+    current_author_fingerprint = get_author_fingerprint(current_author_data)
+    author_fingerprint = get_author_fingerprint(author_data)
+    if current_author_fingerprint is None or author_fingerprint is None:
+        return current_author_data == author_data
+    return current_author_fingerprint == author_fingerprint
+
+
+def _set_author_list(metadata_file: MetadataFile, property_path: str, author_data_list: List[Dict[str, Any]]) -> None:
+    # the authors that did not change are kept as they are, so a list that
+    # already has the same authors leaves the metadata unchanged and clean
+    current_author_data_list: Any = metadata_file.get_metadata(property_path)
+    if not isinstance(current_author_data_list, list):
+        metadata_file.set_metadata(property_path, author_data_list)
+        return
+    is_changed: bool = len(current_author_data_list) != len(author_data_list)
+    merged_author_data_list: List[Any] = []
+    for i, author_data in enumerate(author_data_list):
+        if i < len(current_author_data_list) and _is_same_author_data(current_author_data_list[i], author_data):
+            merged_author_data_list.append(current_author_data_list[i])
+        else:
+            merged_author_data_list.append(author_data)
+            is_changed = True
+    if is_changed:
+        # the list is set once, since setting each changed author would copy the list each time
+        metadata_file.set_metadata(property_path, merged_author_data_list)
+
+
 # synchronizer
 class CffAndPyprojectTomlFileSynchronizer:
 
@@ -31,7 +120,27 @@ class CffAndPyprojectTomlFileSynchronizer:
         self.cff_file = cff_file
         self.pyproject_toml_file = pyproject_toml_file
 
+    @contextmanager
+    def _rollback_on_error(self) -> Iterator[None]:
+        # snapshots cost no copy, so an update that fails halfway
+        # can put back both files' metadata as it was before. the
+        # skipped sections of the CFF file are not parsed for them
+        cff_metadata_snapshot: Metadata = self.cff_file.snapshot_metadata()
+        pyproject_toml_metadata_snapshot: Metadata = self.pyproject_toml_file.snapshot_metadata()
+        try:
+            yield
+        except:
+            self.cff_file.restore_metadata(cff_metadata_snapshot)
+            self.pyproject_toml_file.restore_metadata(
+                pyproject_toml_metadata_snapshot)
+            raise
+
     def update_cff_with_pyproject_toml(self, delete_missing_metadata: bool = True) -> None:
+        with self._rollback_on_error():
+            self._update_cff_with_pyproject_toml(
+                delete_missing_metadata=delete_missing_metadata)
+
+    def _update_cff_with_pyproject_toml(self, delete_missing_metadata: bool = True) -> None:
         for common_property_name, (pyproject_toml_property_path, cff_property_path) in PROPERTY_MAPPINGS.items():
             value = self.pyproject_toml_file.get_metadata(
                 property_path=pyproject_toml_property_path)
@@ -50,19 +159,22 @@ class CffAndPyprojectTomlFileSynchronizer:
                         property_path=cff_property_path)
 
     def _update_cff_with_pyproject_toml_authors(self, delete_missing_metadata: bool = True):
-        pyproject_toml_authors: List[PyprojectTomlAuthor] = self.pyproject_toml_file.authors
-
-        # copy the list so it passes the type checker
-        authors: List[Author] = list(pyproject_toml_authors)
+        author_metadata_list: List[Any] = self.pyproject_toml_file.metadata_project_authors
 
         # set both files' authors since the the CFF file's author objects may be invalid an they may also need to be updated
         # but only remove the authors section in the
         # cff file if there are no authors in the pyproject toml file
         # and if the delete missing metadata flag is set to true
-        if len(authors) or delete_missing_metadata:
-            self.set_authors(authors=authors)
+        if len(author_metadata_list) or delete_missing_metadata:
+            self._set_author_data(*CffAndPyprojectTomlAuthorSynchronizer.pyproject_toml_metadata_to_author_data(
+                author_metadata_list=author_metadata_list))
 
     def update_pyproject_toml_with_cff(self, delete_missing_metadata: bool = True) -> None:
+        with self._rollback_on_error():
+            self._update_pyproject_toml_with_cff(
+                delete_missing_metadata=delete_missing_metadata)
+
+    def _update_pyproject_toml_with_cff(self, delete_missing_metadata: bool = True) -> None:
         for common_property_name, (pyproject_toml_property_path, cff_property_path) in PROPERTY_MAPPINGS.items():
             value = self.cff_file.get_metadata(property_path=cff_property_path)
             if value is not None:
@@ -80,18 +192,26 @@ class CffAndPyprojectTomlFileSynchronizer:
                         property_path=pyproject_toml_property_path)
 
     def _update_pyproject_toml_with_cff_authors(self, delete_missing_metadata: bool = True):
-        cff_authors: List[CffAuthor] = self.cff_file.authors
-
-        # copy the list so it passes the type checker
-        authors: List[Author] = list(cff_authors)
+        author_metadata_list: List[Any] = self.cff_file.metadata_authors
 
         # set both files' authors since the the pyproject toml file's author objects
         # may be invalid an they may also need to be updated
         # but only remove the authors section in the
         # pyproject toml file if there are no authors in the cff file
         # and if the delete missing metadata flag is set to true
-        if len(authors) or delete_missing_metadata:
-            self.set_authors(authors=authors)
+        if len(author_metadata_list) or delete_missing_metadata:
+            self._set_author_data(*CffAndPyprojectTomlAuthorSynchronizer.cff_metadata_to_author_data(
+                author_metadata_list=author_metadata_list))
+
+    def get_common_property_values(self) -> Dict[str, CommonPropertyValues]:
+        # reads every mapped property, so each file is parsed only once
+        return {common_property_name: CommonPropertyValues(
+            common_property_name=common_property_name,
+            cff_property_path=cff_property_path,
+            cff_value=self.cff_file.get_metadata(cff_property_path),
+            pyproject_toml_property_path=pyproject_toml_property_path,
+            pyproject_toml_value=self.pyproject_toml_file.get_metadata(pyproject_toml_property_path))
+            for common_property_name, (pyproject_toml_property_path, cff_property_path) in PROPERTY_MAPPINGS.items()}
 
     def _set_common_property(self, common_property_name: str, value: Any):
         if common_property_name in PROPERTY_MAPPINGS:
@@ -104,6 +224,13 @@ class CffAndPyprojectTomlFileSynchronizer:
             raise CffAndPyprojectTomlFileSynchronizerException(
                 f"Cannot set common property: {common_property_name} because it cannot be found.")
 
+    def set_common_properties(self, values: Dict[str, Any]) -> None:
+        # sets several common properties at once, or none of them when one fails
+        with self._rollback_on_error():
+            for common_property_name, value in values.items():
+                self._set_common_property(
+                    common_property_name=common_property_name, value=value)
+
     def set_version(self, version: str) -> None:
         self._set_common_property(
             common_property_name="version", value=version)
@@ -124,19 +251,25 @@ class CffAndPyprojectTomlFileSynchronizer:
             common_property_name="license", value=license)
 
     def set_authors(self, authors: List[Author]):
-        if len(authors):
-            author_data_for_cff: list[CffAuthorData] = [
-                CffAndPyprojectTomlAuthorSynchronizer.to_cff_author_data(author=author) for author in authors]
-            author_data_for_pyproject_toml: list[PyprojectTomlAuthorData] = [
-                CffAndPyprojectTomlAuthorSynchronizer.to_pyproject_toml_author_data(author=author) for author in authors]
+        self._set_author_data(
+            *CffAndPyprojectTomlAuthorSynchronizer.to_author_data(authors=authors))
 
-            self.cff_file.set_metadata("authors", author_data_for_cff)
-            self.pyproject_toml_file.set_metadata(
-                "project.authors", author_data_for_pyproject_toml)
+    def _set_author_data(self, author_data_for_cff: List[CffAuthorData], author_data_for_pyproject_toml: List[PyprojectTomlAuthorData]):
+        if len(author_data_for_cff):
+            _set_author_list(metadata_file=self.cff_file,
+                             property_path="authors", author_data_list=author_data_for_cff)
+            _set_author_list(metadata_file=self.pyproject_toml_file,
+                             property_path="project.authors", author_data_list=author_data_for_pyproject_toml)
         else:
             self.cff_file.delete_metadata("authors")
             self.pyproject_toml_file.delete_metadata("project.authors")
 
-    def save(self):
-        self.cff_file.save()
-        self.pyproject_toml_file.save()
+    def save(self, durability: Durability = Durability.NONE) -> List[str]:
+        # returns the paths of the files that were written, since files
+        # whose metadata did not change are left untouched
+        written_file_paths: List[str] = []
+        if self.cff_file.save(durability=durability):
+            written_file_paths.append(self.cff_file.file_path)
+        if self.pyproject_toml_file.save(durability=durability):
+            written_file_paths.append(self.pyproject_toml_file.file_path)
+        return written_file_paths
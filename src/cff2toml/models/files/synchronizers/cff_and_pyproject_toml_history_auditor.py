@@ -0,0 +1,115 @@
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+from pydantic import BaseModel
+
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILENAME
+from cff2toml.models.files.git_blob_reader import DEFAULT_REV_RANGE, GitBlobReader, GitObject, list_git_commits
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILENAME
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_drift import get_drifted_common_property_values
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CommonPropertyValues
+from cff2toml.models.files.yaml_backend import YamlBackend, YamlBackendName, get_yaml_backend
+from cff2toml.models.metadata import Metadata
+
+
+class CommitAuditResult(BaseModel):
+    commit: str
+    # the object ids of the files' blobs in the commit, or None for a missing file
+    cff_blob: Union[str, None] = None
+    pyproject_toml_blob: Union[str, None] = None
+    drifted_common_property_values: List[CommonPropertyValues] = []
+    # the paths of the files that are missing in the commit
+    missing_file_paths: List[str] = []
+    error: str = ''
+
+    @property
+    def is_in_sync(self) -> bool:
+        return not len(self.drifted_common_property_values) and not len(self.missing_file_paths) and self.error == ''
+
+
+class CffAndPyprojectTomlHistoryAuditor:
+
+    # reports which common properties differ between the files in every commit of
+    # a rev range that changed one of them. the files are read from the git objects,
+    # and every distinct version of a file is parsed once, since most commits change
+    # only one of the two files
+
+    def __init__(self, repo_dir: str = '.', rev_range: str = DEFAULT_REV_RANGE,
+                 cff_file_path: str = DEFAULT_CITATION_CFF_FILENAME,
+                 pyproject_toml_file_path: str = DEFAULT_PYPROJECT_TOML_FILENAME,
+                 yaml_backend: Union[YamlBackend, YamlBackendName, str, None] = None):
+        self.repo_dir = repo_dir
+        self.rev_range = rev_range
+        # paths relative to the root of the repository
+        self.cff_file_path = cff_file_path
+        self.pyproject_toml_file_path = pyproject_toml_file_path
+        if not isinstance(yaml_backend, YamlBackend):
+            yaml_backend = get_yaml_backend(name=yaml_backend)
+        self.yaml_backend = yaml_backend
+        # {blob object id} -> the metadata of the blob, or the error that parsing it raised
+        self._parsed_blobs: Dict[str, Union[Metadata, Exception]] = {}
+
+    def _parse_cff(self, content: bytes) -> Dict[str, Any]:
+        return self.yaml_backend.load(content.decode('utf-8'))
+
+    @staticmethod
+    def _parse_pyproject_toml(content: bytes) -> Dict[str, Any]:
+        import tomlkit
+        return tomlkit.loads(content.decode('utf-8')).unwrap()
+
+    def _get_metadata(self, git_object: GitObject, parse: Callable[[bytes], Dict[str, Any]]) -> Metadata:
+        if git_object.object_id not in self._parsed_blobs:
+            try:
+                data: Any = parse(git_object.content)
+                if not isinstance(data, dict):
+                    raise ValueError(
+                        f"The blob {git_object.object_id} has no top level mapping.")
+                metadata: Metadata = Metadata()
+                metadata.from_dict(data)
+                self._parsed_blobs[git_object.object_id] = metadata
+            except Exception as e:
+                self._parsed_blobs[git_object.object_id] = e
+        parsed_blob: Union[Metadata, Exception] = self._parsed_blobs[git_object.object_id]
+        if isinstance(parsed_blob, Exception):
+            raise parsed_blob
+        return parsed_blob
+
+    def audit(self) -> Iterator[CommitAuditResult]:
+        # yields a result for every commit, oldest first, in which one of the files changed
+        commits: List[str] = list_git_commits(repo_dir=self.repo_dir, rev_range=self.rev_range, file_paths=[
+                                              self.cff_file_path, self.pyproject_toml_file_path])
+        last_blobs: Union[Tuple[Union[str, None], Union[str, None]], None] = None
+        with GitBlobReader(repo_dir=self.repo_dir) as git_blob_reader:
+            for commit in commits:
+                cff_object: Union[GitObject, None] = git_blob_reader.read_object(
+                    f"{commit}:{self.cff_file_path}")
+                pyproject_toml_object: Union[GitObject, None] = git_blob_reader.read_object(
+                    f"{commit}:{self.pyproject_toml_file_path}")
+                blobs: Tuple[Union[str, None], Union[str, None]] = (
+                    None if cff_object is None else cff_object.object_id,
+                    None if pyproject_toml_object is None else pyproject_toml_object.object_id)
+                # merges can be listed without changing the files
+                if blobs == last_blobs:
+                    continue
+                last_blobs = blobs
+                yield self._audit_commit(commit=commit, cff_object=cff_object, pyproject_toml_object=pyproject_toml_object)
+
+    def _audit_commit(self, commit: str, cff_object: Union[GitObject, None], pyproject_toml_object: Union[GitObject, None]) -> CommitAuditResult:
+        result: CommitAuditResult = CommitAuditResult(commit=commit,
+                                                      cff_blob=None if cff_object is None else cff_object.object_id,
+                                                      pyproject_toml_blob=None if pyproject_toml_object is None else pyproject_toml_object.object_id)
+        if cff_object is None or cff_object.object_type != 'blob':
+            result.missing_file_paths.append(self.cff_file_path)
+        if pyproject_toml_object is None or pyproject_toml_object.object_type != 'blob':
+            result.missing_file_paths.append(self.pyproject_toml_file_path)
+        if len(result.missing_file_paths):
+            return result
+        try:
+            cff_metadata: Metadata = self._get_metadata(
+                git_object=cff_object, parse=self._parse_cff)
+            pyproject_toml_metadata: Metadata = self._get_metadata(
+                git_object=pyproject_toml_object, parse=self._parse_pyproject_toml)
+            result.drifted_common_property_values = get_drifted_common_property_values(
+                cff_metadata=cff_metadata, pyproject_toml_metadata=pyproject_toml_metadata)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        return result
@@ -0,0 +1,171 @@
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+import os
+from typing import FrozenSet, Iterator, List, Tuple, Union
+
+from pydantic import BaseModel
+
+from cff2toml.models.files.atomic_write import Durability, WriteBatch
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILENAME, CffFile
+from cff2toml.models.files.parse_cache import ParseCache, get_default_parse_cache
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILENAME, PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CffAndPyprojectTomlFileSynchronizer
+from cff2toml.models.files.yaml_backend import YamlBackendName, get_default_yaml_backend_name
+
+# directories that never contain package metadata worth synchronizing
+# and that are often very large, so the walk does not descend into them
+SKIPPED_DIRECTORY_NAMES: FrozenSet[str] = frozenset(
+    ['node_modules', '__pycache__', 'venv', 'site-packages'])
+
+FilePair = Tuple[str, str]
+
+
+class SyncSource(str, Enum):
+    # the file whose metadata is copied into the other file
+    PYPROJECT_TOML = "pyproject"
+    CFF = "cff"
+
+
+class TreeSyncResult(BaseModel):
+    cff_file_path: str
+    pyproject_toml_file_path: str
+    written_file_paths: List[str] = []
+    error: str = ''
+
+    @property
+    def is_ok(self) -> bool:
+        return self.error == ''
+
+
+def _is_skipped_directory(name: str) -> bool:
+    # hidden directories include .git, .venv, .tox, .nox and the tool caches
+    return name.startswith('.') or name.endswith('.egg-info') or name in SKIPPED_DIRECTORY_NAMES
+
+
+def find_cff_and_pyproject_toml_file_pairs(root_dir: str,
+                                           cff_filename: str = DEFAULT_CITATION_CFF_FILENAME,
+                                           pyproject_toml_filename: str = DEFAULT_PYPROJECT_TOML_FILENAME) -> List[FilePair]:
+    # iterative os.scandir walk that prunes skipped directories
+    # before descending into them
+    pairs: List[FilePair] = []
+    pending_dirs: List[str] = [root_dir]
+    while len(pending_dirs):
+        current_dir: str = pending_dirs.pop()
+        has_cff_file: bool = False
+        has_pyproject_toml_file: bool = False
+        sub_dirs: List[str] = []
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_skipped_directory(entry.name):
+                            sub_dirs.append(entry.path)
+                    elif entry.name == cff_filename:
+                        has_cff_file = True
+                    elif entry.name == pyproject_toml_filename:
+                        has_pyproject_toml_file = True
+        except OSError:
+            # unreadable directories are not package directories
+            continue
+        if has_cff_file and has_pyproject_toml_file:
+            pairs.append((os.path.join(current_dir, cff_filename),
+                          os.path.join(current_dir, pyproject_toml_filename)))
+        # reverse so the stack visits sub directories in name order
+        sub_dirs.sort(reverse=True)
+        pending_dirs.extend(sub_dirs)
+    pairs.sort()
+    return pairs
+
+
+def sync_cff_and_pyproject_toml_file_pair(cff_file_path: str, pyproject_toml_file_path: str,
+                                          source: SyncSource = SyncSource.PYPROJECT_TOML,
+                                          delete_missing_metadata: bool = True,
+                                          yaml_backend: Union[YamlBackendName, str, None] = None,
+                                          parse_cache_dir: Union[str, None] = None,
+                                          durability: Durability = Durability.NONE) -> TreeSyncResult:
+    # module level function so it can be pickled and run by a worker process
+    result: TreeSyncResult = TreeSyncResult(
+        cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_file_path)
+    try:
+        parse_cache: Union[ParseCache, None] = None
+        if parse_cache_dir is not None:
+            parse_cache = ParseCache(cache_dir=parse_cache_dir)
+        file_sync = CffAndPyprojectTomlFileSynchronizer(
+            cff_file=CffFile(file_path=cff_file_path,
+                             yaml_backend=yaml_backend, parse_cache=parse_cache),
+            pyproject_toml_file=PyprojectTomlFile(file_path=pyproject_toml_file_path, parse_cache=parse_cache))
+        if source == SyncSource.CFF:
+            file_sync.update_pyproject_toml_with_cff(
+                delete_missing_metadata=delete_missing_metadata)
+        else:
+            file_sync.update_cff_with_pyproject_toml(
+                delete_missing_metadata=delete_missing_metadata)
+        result.written_file_paths = file_sync.save(durability=durability)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+SyncTask = Tuple[str, str, SyncSource, bool,
+                 YamlBackendName, Union[str, None], Durability]
+
+
+def _sync_cff_and_pyproject_toml_file_pair_args(args: SyncTask) -> TreeSyncResult:
+    return sync_cff_and_pyproject_toml_file_pair(*args)
+
+
+class CffAndPyprojectTomlTreeSynchronizer:
+
+    def __init__(self, root_dir: str, source: SyncSource = SyncSource.PYPROJECT_TOML,
+                 delete_missing_metadata: bool = True, max_workers: Union[int, None] = None,
+                 yaml_backend: Union[YamlBackendName, str, None] = None,
+                 parse_cache_dir: Union[str, None] = None,
+                 durability: Durability = Durability.NONE):
+        self.root_dir = root_dir
+        self.source = source
+        self.delete_missing_metadata = delete_missing_metadata
+        self.max_workers = max_workers
+        # resolved now since worker processes that are spawned
+        # instead of forked do not inherit the defaults
+        self.yaml_backend = YamlBackendName(
+            yaml_backend or get_default_yaml_backend_name())
+        if parse_cache_dir is None:
+            default_parse_cache: Union[ParseCache,
+                                       None] = get_default_parse_cache()
+            if default_parse_cache is not None:
+                parse_cache_dir = default_parse_cache.cache_dir
+        self.parse_cache_dir = parse_cache_dir
+        self.durability = durability
+
+    def find_file_pairs(self) -> List[FilePair]:
+        return find_cff_and_pyproject_toml_file_pairs(root_dir=self.root_dir)
+
+    def sync(self, file_pairs: Union[List[FilePair], None] = None) -> Iterator[TreeSyncResult]:
+        if file_pairs is None:
+            file_pairs = self.find_file_pairs()
+        # with batch durability the workers do not flush the files they
+        # write, and all of them are flushed together once the pairs are synced
+        task_durability: Durability = Durability.NONE if self.durability == Durability.BATCH else self.durability
+        tasks: List[SyncTask] = [
+            (cff_file_path, pyproject_toml_file_path, self.source, self.delete_missing_metadata, self.yaml_backend, self.parse_cache_dir, task_durability) for cff_file_path, pyproject_toml_file_path in file_pairs]
+        write_batch: WriteBatch = WriteBatch()
+        for result in self._sync_tasks(tasks=tasks):
+            for written_file_path in result.written_file_paths:
+                write_batch.add(written_file_path)
+            yield result
+        if self.durability == Durability.BATCH and len(write_batch.file_paths):
+            write_batch.flush()
+
+    def _sync_tasks(self, tasks: List[SyncTask]) -> Iterator[TreeSyncResult]:
+        max_workers: int = self.max_workers or os.cpu_count() or 1
+        max_workers = min(max_workers, len(tasks))
+        if max_workers <= 1:
+            # avoid the process pool startup cost for small trees
+            for task in tasks:
+                yield _sync_cff_and_pyproject_toml_file_pair_args(task)
+        else:
+            # hand out several pairs per task so the inter-process
+            # overhead is amortized over thousands of small files
+            chunksize: int = max(1, len(tasks) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(_sync_cff_and_pyproject_toml_file_pair_args, tasks, chunksize=chunksize)
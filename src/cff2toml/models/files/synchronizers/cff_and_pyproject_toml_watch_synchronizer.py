@@ -0,0 +1,193 @@
+import os
+import time
+from typing import Dict, Iterator, List, Set, Union
+
+from pydantic import BaseModel
+
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.file_watcher import DEFAULT_POLL_INTERVAL_S, FileSignature, FileWatcher, get_file_signature, open_file_watcher, to_file_signature
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CffAndPyprojectTomlFileSynchronizer
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import FilePair, SyncSource
+from cff2toml.models.files.yaml_backend import YamlBackendName
+
+# editors often save a file with several writes, or save several files at
+# once, so changes are synced when the files were quiet for this long
+DEFAULT_DEBOUNCE_S: float = 0.1
+
+
+class WatchSyncResult(BaseModel):
+    cff_file_path: str
+    pyproject_toml_file_path: str
+    # the file that changed, whose metadata was copied into the other file
+    source: SyncSource
+    written_file_paths: List[str] = []
+    error: str = ''
+
+    @property
+    def is_ok(self) -> bool:
+        return self.error == ''
+
+
+class _WatchedFilePair:
+
+    def __init__(self, cff_file_path: str, pyproject_toml_file_path: str, yaml_backend: Union[YamlBackendName, str, None] = None):
+        self.cff_file_path = os.path.abspath(cff_file_path)
+        self.pyproject_toml_file_path = os.path.abspath(
+            pyproject_toml_file_path)
+        self.yaml_backend = yaml_backend
+        self.file_sync: Union[CffAndPyprojectTomlFileSynchronizer, None] = None
+        # the signatures of the files as they were last read or written here, so
+        # the events of the writes of a sync are not taken for changes
+        self.file_signatures: Dict[str, FileSignature] = {}
+
+    def open_cff_file(self) -> CffFile:
+        cff_file: CffFile = CffFile(
+            file_path=self.cff_file_path, yaml_backend=self.yaml_backend)
+        self.file_signatures[self.cff_file_path] = to_file_signature(
+            cff_file.file_stat)
+        return cff_file
+
+    def open_pyproject_toml_file(self) -> PyprojectTomlFile:
+        pyproject_toml_file: PyprojectTomlFile = PyprojectTomlFile(
+            file_path=self.pyproject_toml_file_path)
+        self.file_signatures[self.pyproject_toml_file_path] = to_file_signature(
+            pyproject_toml_file.file_stat)
+        return pyproject_toml_file
+
+    def load(self) -> None:
+        # both files are parsed up front, so a change only parses the file that changed
+        self.file_sync = CffAndPyprojectTomlFileSynchronizer(
+            cff_file=self.open_cff_file(), pyproject_toml_file=self.open_pyproject_toml_file())
+        self.file_sync.cff_file.metadata
+        self.file_sync.pyproject_toml_file.metadata
+
+    def get_changed_file_paths(self) -> List[str]:
+        return [file_path for file_path in [self.cff_file_path, self.pyproject_toml_file_path]
+                if get_file_signature(file_path) != self.file_signatures.get(file_path)]
+
+
+class CffAndPyprojectTomlWatchSynchronizer:
+
+    def __init__(self, file_pairs: List[FilePair], delete_missing_metadata: bool = True,
+                 debounce_s: float = DEFAULT_DEBOUNCE_S, use_polling: bool = False,
+                 poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+                 yaml_backend: Union[YamlBackendName, str, None] = None,
+                 durability: Durability = Durability.NONE):
+        self.delete_missing_metadata = delete_missing_metadata
+        self.debounce_s = debounce_s
+        self.use_polling = use_polling
+        self.poll_interval_s = poll_interval_s
+        self.durability = durability
+        self._file_pairs: List[_WatchedFilePair] = [_WatchedFilePair(
+            cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_file_path, yaml_backend=yaml_backend) for cff_file_path, pyproject_toml_file_path in file_pairs]
+        self._is_loaded: bool = False
+
+    @property
+    def file_paths(self) -> List[str]:
+        return [file_path for file_pair in self._file_pairs for file_path in [file_pair.cff_file_path, file_pair.pyproject_toml_file_path]]
+
+    def load(self) -> List[WatchSyncResult]:
+        # returns the errors of the pairs whose files cannot be loaded yet,
+        # which are loaded again when one of their files changes
+        errors: List[WatchSyncResult] = []
+        for file_pair in self._file_pairs:
+            try:
+                file_pair.load()
+            except Exception as e:
+                file_pair.file_sync = None
+                errors.append(WatchSyncResult(cff_file_path=file_pair.cff_file_path, pyproject_toml_file_path=file_pair.pyproject_toml_file_path,
+                                              source=SyncSource.PYPROJECT_TOML, error=f"{type(e).__name__}: {e}"))
+        self._is_loaded = True
+        return errors
+
+    def open_file_watcher(self) -> FileWatcher:
+        return open_file_watcher(file_paths=self.file_paths, use_polling=self.use_polling, poll_interval_s=self.poll_interval_s)
+
+    def watch(self, file_watcher: Union[FileWatcher, None] = None, timeout_s: Union[float, None] = None) -> Iterator[WatchSyncResult]:
+        # syncs the pairs whose files change, until timeout_s seconds have passed, or forever
+        if not self._is_loaded:
+            yield from self.load()
+        if file_watcher is None:
+            with self.open_file_watcher() as file_watcher:
+                yield from self.watch(file_watcher=file_watcher, timeout_s=timeout_s)
+            return
+        deadline: Union[float, None] = None if timeout_s is None else time.monotonic() + \
+            timeout_s
+        while True:
+            remaining_s: Union[float, None] = None if deadline is None else max(
+                0.0, deadline - time.monotonic())
+            changed_file_paths: Set[str] = file_watcher.wait(
+                timeout_s=remaining_s)
+            if len(changed_file_paths):
+                # wait for the rest of a burst of events
+                while True:
+                    more_changed_file_paths: Set[str] = file_watcher.wait(
+                        timeout_s=self.debounce_s)
+                    if not len(more_changed_file_paths):
+                        break
+                    changed_file_paths |= more_changed_file_paths
+                yield from self.sync_changed_files(changed_file_paths=changed_file_paths)
+            elif deadline is not None and time.monotonic() >= deadline:
+                return
+
+    def sync_changed_files(self, changed_file_paths: Set[str]) -> Iterator[WatchSyncResult]:
+        # syncs the pairs of the files, but only the files that are not as they were
+        # last read or written here changed, so the writes of a sync are ignored
+        changed_file_paths = {os.path.abspath(
+            file_path) for file_path in changed_file_paths}
+        for file_pair in self._file_pairs:
+            if file_pair.cff_file_path not in changed_file_paths and file_pair.pyproject_toml_file_path not in changed_file_paths:
+                continue
+            # the other file is checked too, in case its event has not come yet
+            changed_pair_file_paths: List[str] = file_pair.get_changed_file_paths()
+            if len(changed_pair_file_paths):
+                yield self._sync_file_pair(file_pair=file_pair, changed_file_paths=changed_pair_file_paths)
+
+    def _get_source(self, file_pair: _WatchedFilePair, changed_file_paths: List[str]) -> SyncSource:
+        # when both files changed, the last one that was changed is the source
+        if file_pair.pyproject_toml_file_path not in changed_file_paths:
+            return SyncSource.CFF
+        if file_pair.cff_file_path not in changed_file_paths:
+            return SyncSource.PYPROJECT_TOML
+        try:
+            if os.stat(file_pair.cff_file_path).st_mtime_ns > os.stat(file_pair.pyproject_toml_file_path).st_mtime_ns:
+                return SyncSource.CFF
+        except OSError:
+            pass
+        return SyncSource.PYPROJECT_TOML
+
+    def _sync_file_pair(self, file_pair: _WatchedFilePair, changed_file_paths: List[str]) -> WatchSyncResult:
+        source: SyncSource = self._get_source(
+            file_pair=file_pair, changed_file_paths=changed_file_paths)
+        result: WatchSyncResult = WatchSyncResult(cff_file_path=file_pair.cff_file_path,
+                                                  pyproject_toml_file_path=file_pair.pyproject_toml_file_path, source=source)
+        try:
+            if file_pair.file_sync is None:
+                file_pair.load()
+            else:
+                # only the files that changed are parsed again, and the
+                # other file is kept as it was parsed or last written
+                if file_pair.cff_file_path in changed_file_paths:
+                    file_pair.file_sync.cff_file = file_pair.open_cff_file()
+                if file_pair.pyproject_toml_file_path in changed_file_paths:
+                    file_pair.file_sync.pyproject_toml_file = file_pair.open_pyproject_toml_file()
+            file_sync: CffAndPyprojectTomlFileSynchronizer = file_pair.file_sync
+            if source == SyncSource.CFF:
+                file_sync.update_pyproject_toml_with_cff(
+                    delete_missing_metadata=self.delete_missing_metadata)
+            else:
+                file_sync.update_cff_with_pyproject_toml(
+                    delete_missing_metadata=self.delete_missing_metadata)
+            result.written_file_paths = file_sync.save(
+                durability=self.durability)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            # a file that cannot be parsed, like one that is being edited, is
+            # parsed again with the other file when one of them changes again
+            file_pair.file_sync = None
+        for written_file_path in result.written_file_paths:
+            file_pair.file_signatures[os.path.abspath(
+                written_file_path)] = get_file_signature(written_file_path)
+        return result
@@ -1,6 +1,16 @@
-from typing import OrderedDict, Union
+import os
+from typing import Any, Dict, List, Union
+from cff2toml.models.files.atomic_write import Durability
 from cff2toml.models.files.metadata_file import MetadataFile
+from cff2toml.models.files.parse_cache import ParseCache
+from cff2toml.models.property_path import is_same_value
 import tomlkit
+from tomlkit import TOMLDocument
+from tomlkit.container import Container
+from tomlkit.items import AbstractTable, Array, InlineTable
+
+# a value that is never stored in metadata, to tell missing keys apart from None
+_MISSING: Any = object()
 
 
 class LoadTomlFileException(Exception):
@@ -11,30 +21,190 @@ class SaveTomlFileException(Exception):
     pass
 
 
+class _DottedKeyEditException(Exception):
+
+    def __init__(self, container: Any, key: str):
+        super().__init__(f"Cannot change the dotted key {key} in place.")
+        self.container = container
+
+
+def _check_not_dotted_key(container: Any, key: Union[str, int]) -> None:
+    # tomlkit does not render changes to dotted keys, like urls.Source = "...", or
+    # new keys next to them, as the values it has, so their container is changed
+    # after its dotted keys are replaced with tables
+    body_container: Any = container.value if isinstance(
+        container, AbstractTable) else container
+    if not isinstance(body_container, Container):
+        return
+    for body_key, _ in body_container.body:
+        if body_key is not None and body_key.is_dotted() and (body_key.key == key or key not in body_container):
+            raise _DottedKeyEditException(container=container, key=body_key.key)
+
+
+def _replace_dotted_keys(container: Any) -> bool:
+    # replaces the dotted keys of the container, like urls.Source = "..." in [project],
+    # with a table of the same values, like [project.urls], and keeps the rest of the
+    # document as it is. returns whether there were dotted keys to replace
+    body_container: Any = container.value if isinstance(
+        container, AbstractTable) else container
+    dotted_keys: List[str] = list(dict.fromkeys(
+        body_key.key for body_key, _ in body_container.body if body_key is not None and body_key.is_dotted()))
+    for key in dotted_keys:
+        value: Dict[str, Any] = container[key].unwrap()
+        del container[key]
+        table = tomlkit.table()
+        for table_key, table_value in value.items():
+            table[table_key] = table_value
+        table.add(tomlkit.nl())
+        container[key] = table
+    return len(dotted_keys) > 0
+
+
+def _to_inline_table(value: Dict[str, Any], old_inline_table: InlineTable) -> InlineTable:
+    # a new inline table with the spaces inside the braces of the old one, like { name = "..." }
+    inline_table: InlineTable = tomlkit.inline_table()
+    inline_table.update(value)
+    text: str = inline_table.as_string()
+    if not old_inline_table.as_string().startswith('{ ') or text == '{}':
+        return inline_table
+    return tomlkit.parse(f"value = {{ {text[1:-1]} }}")['value']
+
+
+def _update_toml_value(container: Any, key: Union[str, int], old_value: Any, value: Any) -> None:
+    if isinstance(key, str):
+        _check_not_dotted_key(container=container, key=key)
+    if old_value is not _MISSING:
+        toml_value: Any = container[key]
+        if isinstance(old_value, dict) and isinstance(value, dict) and isinstance(container, Array) and isinstance(toml_value, InlineTable):
+            # a changed inline table in an array, like an author in authors = [{...}, ...],
+            # is replaced whole, since tomlkit leaves extra spaces in inline tables whose
+            # keys are changed one by one, so it looks like the unchanged elements
+            container[key] = _to_inline_table(
+                value=value, old_inline_table=toml_value)
+            return
+        if isinstance(old_value, dict) and isinstance(value, dict) and isinstance(toml_value, dict):
+            _update_toml_container(
+                container=toml_value, old_data=old_value, data=value)
+            return
+        # inline arrays that get longer or shorter, like authors = [{...}, ...], are
+        # changed in place too, so they keep their style and the comments of the
+        # elements that are kept, instead of becoming an array of tables
+        if isinstance(old_value, list) and isinstance(value, list) and isinstance(toml_value, list) and (len(old_value) == len(value) or isinstance(toml_value, Array)):
+            for i, (old_element, element) in enumerate(zip(old_value, value)):
+                if old_element is not element:
+                    _update_toml_value(container=toml_value, key=i,
+                                       old_value=old_element, value=element)
+            for element in value[len(old_value):]:
+                toml_value.append(element)
+            for i in reversed(range(len(value), len(old_value))):
+                del toml_value[i]
+            return
+        if is_same_value(old_value, value):
+            return
+    container[key] = value
+
+
+def _update_toml_container(container: Any, old_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+    # changes the tomlkit container from old_data to data in place, so everything
+    # else in the container keeps its comments and layout. the metadata versions
+    # share the values that did not change, so only the changed paths are visited
+    for key in old_data:
+        if key not in data:
+            _check_not_dotted_key(container=container, key=key)
+            del container[key]
+    for key, value in data.items():
+        old_value: Any = old_data.get(key, _MISSING)
+        if old_value is not value:
+            _update_toml_value(container=container, key=key,
+                               old_value=old_value, value=value)
+
+
 class TomlFile(MetadataFile):
 
-    def __init__(self, file_path: str):
-        super().__init__(file_path=file_path)
+    # the parsed tomlkit document, which is updated with the changes to the metadata
+    # when the file is saved. the metadata holds plain python values instead of the
+    # tomlkit items, since editing tomlkit items also changes the items around them,
+    # which the older versions of the metadata share
+    _document: Union[TOMLDocument, None] = None
+    # the metadata that the document has
+    _document_data: Dict[str, Any] = {}
+
+    def __init__(self, file_path: str, *, parse_cache: Union[ParseCache, None] = None):
+        super().__init__(file_path=file_path, parse_cache=parse_cache)
         self.file_path = file_path
+        # only stat the file here, it is parsed on the first metadata access
         try:
-            with open(self.file_path, 'r') as toml_file:
-                self._metadata.from_dict(
-                    OrderedDict(tomlkit.load(toml_file).value))
+            self._file_stat = os.stat(self.file_path)
+        except OSError:
+            raise LoadTomlFileException(
+                f"Cannot load this TOML file: {self.file_path}")
+        self._is_loaded = False
+
+    def _load_metadata(self) -> None:
+        try:
+            if self.parse_cache is not None:
+                # tomlkit items are pickled, so entries are
+                # keyed by the tomlkit version that created them
+                document: TOMLDocument = self.parse_cache.load(
+                    file_path=self.file_path, parser_name=f"tomlkit-document-{tomlkit.__version__}", parse=self._parse)
+            else:
+                with open(self.file_path, 'r') as toml_file:
+                    document = self._parse(toml_file.read())
+            self._document = document
+            self._document_data = document.unwrap()
+            self._metadata.from_dict(self._document_data)
         except:
             raise LoadTomlFileException(
                 f"Cannot load this TOML file: {self.file_path}")
 
-    def save(self, file_path: Union[str, None] = None) -> None:
+    @staticmethod
+    def _parse(text: str) -> TOMLDocument:
+        return tomlkit.loads(text)
+
+    def _dump(self, data: Dict[str, Any]) -> str:
+        # only the changes since the document was loaded or last dumped are applied
+        # to it, instead of building a new document from the metadata, which would
+        # lose the comments and layout of the file
+        if self._document is None:
+            return tomlkit.dumps(data)
+        old_data: Dict[str, Any] = self._document_data
+        while True:
+            try:
+                _update_toml_container(
+                    container=self._document, old_data=old_data, data=data)
+                break
+            except _DottedKeyEditException as e:
+                # the document may be half changed, so once the dotted keys are replaced,
+                # it is parsed again, for tomlkit to lay out the new tables, and changed
+                # from the values it has
+                if not _replace_dotted_keys(container=e.container):
+                    raise
+                self._document = tomlkit.loads(self._document.as_string())
+                old_data = self._document.unwrap()
+        if self._document.unwrap() != data:
+            raise SaveTomlFileException(
+                f"Cannot change this TOML file in place: {self.file_path}")
+        self._document_data = data
+        return self._document.as_string()
+
+    def save(self, file_path: Union[str, None] = None, force: bool = False, durability: Durability = Durability.NONE) -> bool:
+        # returns whether the file was written
         if file_path is None:
             file_path = self.file_path
+        if self._is_unchanged_file(file_path=file_path, force=force):
+            return False
+        # a forced save, or a save to another path, of a file whose metadata
+        # was never read must write the file's metadata, not an empty document
+        self._ensure_loaded()
         if self._metadata is not None:
             try:
-                with open(file_path, 'w') as toml_file:
-                    tomlkit.dump(OrderedDict(self._metadata.to_dict()),
-                                 toml_file)
+                is_written: bool = self._write_text(file_path=file_path, text=self._dump(
+                    self._metadata.to_dict()), force=force, durability=durability)
             except:
                 raise SaveTomlFileException(
                     f"Cannot save this TOML file: {file_path}")
+            self._mark_saved(file_path=file_path)
+            return is_written
         else:
             raise SaveTomlFileException(
                 f"Cannot save this TOML file: {file_path} because there is no data.")
@@ -0,0 +1,90 @@
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Any, Dict, Union
+
+# PyYAML is imported on first use, so the CLI can
+# choose a backend without paying for the import
+
+# PyYAML's pure python emitter and libyaml's emitter fold long scalars
+# at different places, so lines are never folded, which keeps the dumped
+# bytes identical whichever backend wrote them
+YAML_DUMP_WIDTH: int = 2**31 - 1
+
+
+class YamlBackendName(str, Enum):
+    AUTO = "auto"
+    LIBYAML = "libyaml"
+    PYTHON = "python"
+
+
+class YamlBackendException(Exception):
+    pass
+
+
+class YamlBackend:
+
+    def __init__(self, name: YamlBackendName, loader: Any, dumper: Any):
+        self.name = name
+        self.loader = loader
+        self.dumper = dumper
+
+    def load(self, stream: Union[str, bytes, IO]) -> Any:
+        import yaml
+        return yaml.load(stream, Loader=self.loader)
+
+    def dump(self, data: Any, stream: Union[IO, None] = None, default_style: Union[str, None] = None) -> Any:
+        import yaml
+        return yaml.dump(data, stream, Dumper=self.dumper, sort_keys=False, width=YAML_DUMP_WIDTH, default_style=default_style)
+
+
+def has_libyaml() -> bool:
+    import yaml
+    return bool(getattr(yaml, '__with_libyaml__', False))
+
+
+@lru_cache(maxsize=None)
+def _get_yaml_backends() -> Dict[YamlBackendName, YamlBackend]:
+    import yaml
+    yaml_backends: Dict[YamlBackendName, YamlBackend] = {
+        YamlBackendName.PYTHON: YamlBackend(
+            name=YamlBackendName.PYTHON, loader=yaml.SafeLoader, dumper=yaml.SafeDumper)
+    }
+    if has_libyaml():
+        yaml_backends[YamlBackendName.LIBYAML] = YamlBackend(
+            name=YamlBackendName.LIBYAML, loader=yaml.CSafeLoader, dumper=yaml.CSafeDumper)
+    return yaml_backends
+
+
+_default_yaml_backend_name: YamlBackendName = YamlBackendName.AUTO
+
+
+def get_yaml_backend(name: Union[YamlBackendName, str, None] = None) -> YamlBackend:
+    if name is None:
+        name = _default_yaml_backend_name
+    try:
+        name = YamlBackendName(name)
+    except ValueError:
+        raise YamlBackendException(
+            f"Unknown YAML backend: {name}")
+    yaml_backends: Dict[YamlBackendName, YamlBackend] = _get_yaml_backends()
+    if name == YamlBackendName.AUTO:
+        # prefer libyaml, but fall back to the pure python backend
+        # when PyYAML was built without it
+        return yaml_backends.get(YamlBackendName.LIBYAML, yaml_backends[YamlBackendName.PYTHON])
+    if name not in yaml_backends:
+        raise YamlBackendException(
+            f"The YAML backend {name.value} is not available because PyYAML was built without libyaml.")
+    return yaml_backends[name]
+
+
+def set_default_yaml_backend(name: Union[YamlBackendName, str]) -> None:
+    global _default_yaml_backend_name
+    # fail early if the backend is unknown or unavailable,
+    # which auto never is, so it does not need to import PyYAML
+    if name != YamlBackendName.AUTO:
+        get_yaml_backend(name=name)
+    _default_yaml_backend_name = YamlBackendName(name)
+
+
+def get_default_yaml_backend_name() -> YamlBackendName:
+    return _default_yaml_backend_name
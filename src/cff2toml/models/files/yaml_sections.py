@@ -0,0 +1,265 @@
+from typing import Any, Collection, Dict, Iterable, List, NamedTuple, Set, Tuple, Union
+
+from cff2toml.models.files.yaml_backend import YamlBackend
+from cff2toml.models.property_path import is_same_value
+
+# a YAML document whose root is a block mapping can be split into one section of
+# raw text per top level key, from the key up to the next top level key. each
+# section is a valid YAML document on its own, so the sections that are needed can
+# be parsed one by one, and the others can be written back as they were read
+
+BYTE_ORDER_MARK: str = '\ufeff'
+
+# the quoting and block styles of string scalars that are kept when a scalar is patched
+KEPT_SCALAR_STYLES: Tuple[str, ...] = ('"', "'", '|', '>')
+
+
+class YamlSections(NamedTuple):
+    # the text before the first key, like comments and a document start marker
+    prefix: str
+    # (top level key, raw text) of every top level key, in the order of the document
+    sections: List[Tuple[str, str]]
+    # the text after the root mapping, like a document end marker
+    suffix: str
+    # the parsed values of the sections that were loaded, by their key
+    values: Dict[str, Any]
+
+
+def _find_top_level_keys(text: str, yaml_backend: YamlBackend) -> Union[Tuple[List[Tuple[str, int]], int], None]:
+    # returns the top level keys with the index where each one starts, and the
+    # index where the root mapping ends, from a pass over the parser events, so
+    # no nodes or values are built. returns None for a document that cannot be
+    # split into sections that parse on their own
+    import yaml
+    key_starts: List[Tuple[str, int]] = []
+    root_end: Union[int, None] = None
+    document_count: int = 0
+    depth: int = 0
+    is_key_next: bool = False
+    # the files can have many thousands of events, most of them scalars in the
+    # sections that are skipped, so the events are told apart by their exact type
+    scalar_event_type = yaml.ScalarEvent
+    start_event_types = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+    end_event_types = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+    loader = yaml_backend.loader(text)
+    get_event = loader.get_event
+    try:
+        while True:
+            event = get_event()
+            event_type = type(event)
+            if event_type is scalar_event_type:
+                if depth == 1:
+                    if is_key_next:
+                        key_start: int = event.start_mark.index
+                        # the key must be a plain string at the start of a line, where
+                        # the section starts. the marks of both backends are checked
+                        # against the text, since they are not always the same
+                        if event.start_mark.column != 0 or not text.startswith(event.value, key_start) or event.tag is not None \
+                                or loader.resolve(yaml.ScalarNode, event.value, event.implicit) != 'tag:yaml.org,2002:str':
+                            return None
+                        key_starts.append((event.value, key_start))
+                    is_key_next = not is_key_next
+                elif depth == 0:
+                    return None
+            elif event_type in start_event_types:
+                if depth == 0:
+                    if event_type is not yaml.MappingStartEvent or event.flow_style:
+                        return None
+                    is_key_next = True
+                elif depth == 1 and is_key_next:
+                    # a complex key, like a mapping used as a key
+                    return None
+                depth += 1
+            elif event_type in end_event_types:
+                depth -= 1
+                if depth == 1:
+                    is_key_next = True
+                elif depth == 0:
+                    root_end = event.start_mark.index
+            elif event_type is yaml.AliasEvent:
+                # an alias may refer to an anchor in another section
+                return None
+            elif event_type is yaml.DocumentStartEvent:
+                document_count += 1
+                # tag directives would not apply to a section parsed on its own
+                if document_count > 1 or event.tags:
+                    return None
+            elif event_type is yaml.StreamEndEvent:
+                break
+    finally:
+        loader.dispose()
+    if root_end is None or len({key for key, _ in key_starts}) != len(key_starts):
+        return None
+    return key_starts, root_end
+
+
+def _find_section_start(text: str, key_start: int, min_start: int) -> int:
+    # returns the start of the comment lines right above the key at key_start
+    section_start: int = key_start
+    line_end: int = key_start
+    while line_end > min_start:
+        line_start: int = text.rfind('\n', min_start, line_end - 1) + 1
+        if line_start <= min_start:
+            break
+        line: str = text[line_start:line_end].rstrip('\r\n')
+        if line.startswith('#'):
+            section_start = line_start
+        elif line.strip() != '':
+            break
+        line_end = line_start
+    return section_start
+
+
+def _load_section(key: str, section_text: str, yaml_backend: YamlBackend) -> Any:
+    section_data: Any = yaml_backend.load(section_text)
+    if not isinstance(section_data, dict) or list(section_data.keys()) != [key]:
+        raise ValueError(f"The YAML section of {key} cannot be loaded on its own.")
+    return section_data[key]
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float))
+
+
+def _get_events(text: str, yaml_backend: YamlBackend) -> List[Any]:
+    loader = yaml_backend.loader(text)
+    try:
+        events: List[Any] = []
+        while loader.check_event():
+            events.append(loader.get_event())
+        return events
+    finally:
+        loader.dispose()
+
+
+def _dump_scalar(value: Any, style: Union[str, None], yaml_backend: YamlBackend) -> Union[str, None]:
+    # returns the text of the scalar without a document end marker, in the style
+    # of the scalar it replaces when that style can be used for the value
+    import yaml
+    text: str = yaml_backend.dump(
+        value, default_style=style if isinstance(value, str) and style in KEPT_SCALAR_STYLES else None)
+    events: List[Any] = _get_events(text=text, yaml_backend=yaml_backend)
+    # stream start, document start, scalar, document end, stream end
+    if len(events) != 5 or type(events[2]) is not yaml.ScalarEvent:
+        return None
+    return text[events[2].start_mark.index:events[2].end_mark.index]
+
+
+def _patch_scalar_section(key: str, section_text: str, value: Any, yaml_backend: YamlBackend) -> Union[str, None]:
+    # returns the section with only the text of its scalar value replaced, so the
+    # key, comments and formatting around it stay as they were. returns None when
+    # the value cannot be patched, and the section must be dumped again
+    import yaml
+    events: List[Any] = _get_events(
+        text=section_text, yaml_backend=yaml_backend)
+    # stream start, document start, mapping start, key, value, mapping end, document end, stream end
+    if len(events) != 8 or type(events[4]) is not yaml.ScalarEvent or events[4].anchor is not None or events[4].tag is not None:
+        return None
+    value_start: int = events[4].start_mark.index
+    value_end: int = events[4].end_mark.index
+    scalar_text: Union[str, None] = _dump_scalar(
+        value=value, style=events[4].style, yaml_backend=yaml_backend)
+    if scalar_text is None:
+        return None
+    # a block scalar ends after the blank lines below it, which are kept
+    old_scalar_text: str = section_text[value_start:value_end]
+    trailing_text: str = old_scalar_text[len(old_scalar_text.rstrip('\r\n ')):]
+    patched_section_text: str = section_text[:value_start] + \
+        scalar_text.rstrip('\r\n ') + trailing_text + section_text[value_end:]
+    try:
+        patched_value: Any = _load_section(
+            key=key, section_text=patched_section_text, yaml_backend=yaml_backend)
+    except Exception:
+        return None
+    if not is_same_value(patched_value, value):
+        return None
+    return patched_section_text
+
+
+def load_yaml_sections(text: str, keys: Collection[str], yaml_backend: YamlBackend) -> Union[YamlSections, None]:
+    # parses only the sections of the keys, and keeps the other sections as raw text.
+    # returns None for a document that cannot be split, which must be loaded whole
+    body: str = text[1:] if text.startswith(BYTE_ORDER_MARK) else text
+    found: Union[Tuple[List[Tuple[str, int]], int], None] = _find_top_level_keys(
+        text=body, yaml_backend=yaml_backend)
+    if found is None:
+        return None
+    key_starts, root_end = found
+    if not len(key_starts):
+        return None
+
+    # the comments right above a key belong to its section, so they stay with the key
+    # when the section before it is written again. blank lines above the comments stay
+    # in the section before, since they can be the end of a block scalar
+    key_starts = [key_starts[0]] + [(key, _find_section_start(text=body, key_start=key_start, min_start=previous_key_start))
+                                    for (key, key_start), (_, previous_key_start) in zip(key_starts[1:], key_starts)]
+
+    sections: List[Tuple[str, str]] = []
+    for i, (key, key_start) in enumerate(key_starts):
+        section_end: int = key_starts[i + 1][1] if i + \
+            1 < len(key_starts) else root_end
+        sections.append((key, body[key_start:section_end]))
+    yaml_sections: YamlSections = YamlSections(prefix=text[:len(text) - len(body)] + body[:key_starts[0][1]],
+                                               sections=sections, suffix=body[root_end:], values={})
+    try:
+        return load_yaml_section_values(yaml_sections=yaml_sections, keys=keys, yaml_backend=yaml_backend)
+    except ValueError:
+        return None
+
+
+def load_yaml_section_values(yaml_sections: YamlSections, keys: Iterable[str], yaml_backend: YamlBackend) -> YamlSections:
+    # returns the sections with the values of the keys that were not loaded yet
+    keys_to_load: Set[str] = set(keys) - set(yaml_sections.values.keys())
+    if not len(keys_to_load):
+        return yaml_sections
+    values: Dict[str, Any] = dict(yaml_sections.values)
+    for key, section_text in yaml_sections.sections:
+        if key in keys_to_load:
+            values[key] = _load_section(
+                key=key, section_text=section_text, yaml_backend=yaml_backend)
+    return yaml_sections._replace(values=values)
+
+
+def get_yaml_section_keys(yaml_sections: YamlSections) -> List[str]:
+    return [key for key, _ in yaml_sections.sections]
+
+
+def dump_yaml_sections(yaml_sections: YamlSections, data: Dict[str, Any], yaml_backend: YamlBackend) -> Tuple[str, YamlSections]:
+    # returns the text of the data, and the sections of that text. the sections that
+    # were not loaded, or whose values did not change, are written as they were read.
+    # a changed scalar is patched in its section, and other changes dump the section
+    if not len(data):
+        return yaml_backend.dump(data), YamlSections(prefix='', sections=[], suffix='', values={})
+
+    sections: List[Tuple[str, str]] = []
+    values: Dict[str, Any] = {}
+    for key, section_text in yaml_sections.sections:
+        if key in yaml_sections.values:
+            if key not in data:
+                # the key was deleted
+                continue
+            if not is_same_value(data[key], yaml_sections.values[key]):
+                patched_section_text: Union[str, None] = None
+                if _is_scalar(data[key]) and _is_scalar(yaml_sections.values[key]):
+                    patched_section_text = _patch_scalar_section(
+                        key=key, section_text=section_text, value=data[key], yaml_backend=yaml_backend)
+                section_text = patched_section_text if patched_section_text is not None else yaml_backend.dump({
+                    key: data[key]})
+            values[key] = data[key]
+        sections.append((key, section_text))
+    section_keys: Set[str] = set(get_yaml_section_keys(yaml_sections))
+    for key, value in data.items():
+        if key not in section_keys:
+            sections.append((key, yaml_backend.dump({key: value})))
+            values[key] = value
+
+    # the raw text of a section ends with a line break, except
+    # maybe the last section of a file without a final line break
+    for i in range(len(sections) - 1):
+        key, section_text = sections[i]
+        if not section_text.endswith('\n'):
+            sections[i] = (key, section_text + '\n')
+
+    new_yaml_sections: YamlSections = YamlSections(
+        prefix=yaml_sections.prefix, sections=sections, suffix=yaml_sections.suffix, values=values)
+    return ''.join([new_yaml_sections.prefix] + [section_text for _, section_text in sections] + [new_yaml_sections.suffix]), new_yaml_sections
@@ -1,33 +1,88 @@
-from typing import Any, Dict
+from typing import Any, Dict, Union
 from pydantic import BaseModel
-import pydash
+
+from cff2toml.models.property_path import get_property, has_property, is_same_value, with_property, without_property
+
+# a value that is never stored in metadata, to tell missing properties apart from None
+_MISSING: Any = object()
 
 
 class Metadata(BaseModel):
+    # the metadata is never changed in place. set and delete replace it with
+    # a new version that only copies the dicts and lists on the changed path
+    # and shares the rest with the old version, so snapshots are never copied
     _metadata: Dict[str, Any] = {}
+    # the version that was loaded with from_dict or marked clean,
+    # so the metadata is dirty when it is not that version anymore
+    _clean_metadata: Union[Dict[str, Any], None] = None
 
     def from_dict(self, d: Dict[str, Any]) -> None:
+        # the metadata takes over the dict, which must not be changed afterwards
         self._metadata = d
+        self._clean_metadata = d
+
+    def add_loaded_properties(self, properties: Dict[str, Any]) -> None:
+        # adds top level properties that were loaded after the rest, like the skipped
+        # sections of a file, to both the loaded and the current version, so they
+        # are not changes, and the metadata stays as clean or dirty as it was
+        is_dirty: bool = self.is_dirty
+        clean_metadata: Dict[str, Any] = self._clean_metadata if self._clean_metadata is not None else {}
+        self._clean_metadata = {**clean_metadata, **properties}
+        self._metadata = {**self._metadata, **properties} if is_dirty else self._clean_metadata
 
     def to_dict(self) -> Dict[str, Any]:
         return self._metadata.copy()
 
+    def to_clean_dict(self) -> Dict[str, Any]:
+        # the version that was loaded or last marked clean
+        return self._clean_metadata.copy() if self._clean_metadata is not None else {}
+
     def get(self, property_path: str, default_value: Any = None) -> Any:
-        return pydash.objects.get(
-            obj=self._metadata, path=property_path, default=default_value)
+        return get_property(self._metadata, property_path, default_value)
 
     def set(self, property_path: str, value: Any) -> None:
-        self._metadata = pydash.objects.set_(
-            obj=self._metadata, path=property_path, value=value)
+        # True == 1 and 1.0 == 1, so a value of another type is a change
+        current_value: Any = self.get(
+            property_path=property_path, default_value=_MISSING)
+        if is_same_value(current_value, value):
+            return
+        self._metadata = with_property(self._metadata, property_path, value)
 
     def delete(self, property_path: str) -> None:
         if self._metadata is not None:
-            data_as_dict: Dict = dict(self._metadata)
-            pydash.objects.unset(obj=data_as_dict, path=property_path)
-            self._metadata = data_as_dict
+            self._metadata = without_property(self._metadata, property_path)
 
     def has(self, property_path: str) -> bool:
         if self._metadata is None:
             return False
         else:
-            return pydash.objects.has(self._metadata, path=property_path)
+            return has_property(self._metadata, property_path)
+
+    def snapshot(self) -> 'Metadata':
+        # a snapshot shares the current version, so it
+        # does not see later changes and costs no copy
+        metadata_snapshot: Metadata = Metadata()
+        metadata_snapshot._metadata = self._metadata
+        metadata_snapshot._clean_metadata = self._clean_metadata
+        return metadata_snapshot
+
+    def restore(self, metadata_snapshot: 'Metadata', loaded_properties: Union[Dict[str, Any], None] = None) -> None:
+        # restoring the version that was loaded or saved makes the metadata clean again.
+        # the top level properties that were loaded after the snapshot was taken, like
+        # the skipped sections of a file, are not changes, so they are kept
+        if not loaded_properties:
+            self._metadata = metadata_snapshot._metadata
+            return
+        metadata: Dict[str, Any] = {
+            **metadata_snapshot._metadata, **loaded_properties}
+        clean_metadata: Dict[str, Any] = self._clean_metadata if self._clean_metadata is not None else {}
+        if len(metadata) == len(clean_metadata) and all(clean_metadata.get(key, _MISSING) is value for key, value in metadata.items()):
+            metadata = clean_metadata
+        self._metadata = metadata
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._metadata is not self._clean_metadata
+
+    def mark_clean(self) -> None:
+        self._clean_metadata = self._metadata
@@ -0,0 +1,204 @@
+import copy
+from functools import lru_cache
+from typing import Any, List, Tuple, Union
+
+# a property path like 'project.urls.Source' or 'authors[0].name' is compiled
+# once into a tuple of keys, like ('project', 'urls', 'Source') or
+# ('authors', 0, 'name'), which is then used to walk the dicts and lists
+# directly. it follows pydash's path semantics for dicts and lists:
+# - keys are separated by dots, and a dot in a key is escaped with a backslash
+# - a bracketed integer like [0] is a list index, and a dotted integer like
+#   .0 is a list index in a list and a key in a dict
+# - negative list indexes count from the end of the list
+# - setting a missing path creates dicts, or a list for a bracketed index,
+#   and setting a list index past the end pads the list with None
+# - setting a path through None does nothing
+# with_property and without_property never change the object. they return a new
+# version of it that shares everything with the old version except the containers
+# on the path, so Metadata can tell its versions apart
+PropertyPathKey = Union[str, int]
+PropertyPath = Tuple[PropertyPathKey, ...]
+
+_MISSING: Any = object()
+
+
+class PropertyPathException(Exception):
+    pass
+
+
+@lru_cache(maxsize=1024)
+def compile_property_path(property_path: str) -> PropertyPath:
+    keys: List[PropertyPathKey] = []
+    key_chars: List[str] = []
+    i: int = 0
+    path_length: int = len(property_path)
+    # a key ends at a dot, or at a bracket, which may be followed by a dot
+    has_pending_key: bool = True
+    while i < path_length:
+        c: str = property_path[i]
+        if c == '\\' and i + 1 < path_length:
+            key_chars.append(property_path[i + 1])
+            i += 2
+            continue
+        if c == '.':
+            if has_pending_key:
+                keys.append(''.join(key_chars))
+            key_chars = []
+            has_pending_key = True
+        elif c == '[':
+            end: int = property_path.find(']', i)
+            if end == -1:
+                raise PropertyPathException(
+                    f"Missing ] in property path: {property_path}")
+            if has_pending_key and (key_chars or i == 0):
+                keys.append(''.join(key_chars))
+            key_chars = []
+            index: str = property_path[i + 1:end].strip()
+            if len(index) >= 2 and index[0] == index[-1] and index[0] in '\'"':
+                keys.append(index[1:-1])
+            else:
+                try:
+                    keys.append(int(index))
+                except ValueError:
+                    keys.append(index)
+            has_pending_key = False
+            i = end + 1
+            continue
+        else:
+            key_chars.append(c)
+            has_pending_key = True
+        i += 1
+    if has_pending_key:
+        keys.append(''.join(key_chars))
+    return tuple(keys)
+
+
+def _to_list_index(key: PropertyPathKey) -> Union[int, None]:
+    if isinstance(key, int):
+        return key
+    try:
+        return int(key)
+    except ValueError:
+        return None
+
+
+def _get_dict_key(obj: dict, key: PropertyPathKey) -> Any:
+    # a list index also finds a dict key with the same digits
+    if key not in obj and isinstance(key, int) and str(key) in obj:
+        return str(key)
+    return key
+
+
+def _get_child(obj: Any, key: PropertyPathKey) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(_get_dict_key(obj, key), _MISSING)
+    if isinstance(obj, list):
+        index: Union[int, None] = _to_list_index(key)
+        if index is not None and -len(obj) <= index < len(obj):
+            return obj[index]
+    return _MISSING
+
+
+def get_property(obj: Any, property_path: str, default_value: Any = None) -> Any:
+    for key in compile_property_path(property_path):
+        obj = _get_child(obj, key)
+        if obj is _MISSING:
+            return default_value
+    return obj
+
+
+def has_property(obj: Any, property_path: str) -> bool:
+    return get_property(obj, property_path, default_value=_MISSING) is not _MISSING
+
+
+def _set_child(obj: Any, key: PropertyPathKey, value: Any) -> None:
+    if isinstance(obj, dict):
+        obj[key] = value
+    elif isinstance(obj, list):
+        index: Union[int, None] = _to_list_index(key)
+        if index is None:
+            raise PropertyPathException(
+                f"Cannot use {key} as a list index.")
+        if index >= len(obj):
+            obj.extend([None] * (index + 1 - len(obj)))
+        obj[index] = value
+    else:
+        raise PropertyPathException(
+            f"Cannot set {key} in a {type(obj).__name__}.")
+
+
+def _delete_child(obj: Any, key: PropertyPathKey) -> bool:
+    if isinstance(obj, dict):
+        key = _get_dict_key(obj, key)
+        if key in obj:
+            del obj[key]
+            return True
+    elif isinstance(obj, list):
+        index: Union[int, None] = _to_list_index(key)
+        if index is not None and -len(obj) <= index < len(obj):
+            del obj[index]
+            return True
+    return False
+
+
+def is_same_value(value: Any, other_value: Any) -> bool:
+    # like ==, but values of different types, like 1 and 1.0 or True and 1,
+    # are different, also when they are inside dicts and lists
+    if value is other_value:
+        return True
+    if type(value) is not type(other_value):
+        return False
+    if isinstance(value, dict):
+        return len(value) == len(other_value) and all(key in other_value and is_same_value(item, other_value[key]) for key, item in value.items())
+    if isinstance(value, list):
+        return len(value) == len(other_value) and all(is_same_value(item, other_item) for item, other_item in zip(value, other_value))
+    return value == other_value
+
+
+def _copy_with_child(obj: Any, key: PropertyPathKey, child: Any) -> Any:
+    obj_copy: Any = copy.copy(obj)
+    if isinstance(obj_copy, dict):
+        key = _get_dict_key(obj_copy, key)
+    _set_child(obj_copy, key, child)
+    return obj_copy
+
+
+def _with_keys(obj: Any, keys: PropertyPath, i: int, value: Any) -> Any:
+    if i == len(keys) - 1:
+        return _copy_with_child(obj, keys[i], value)
+    child: Any = _get_child(obj, keys[i])
+    if child is None:
+        return obj
+    if child is _MISSING:
+        child = [] if isinstance(keys[i + 1], int) else {}
+    new_child: Any = _with_keys(child, keys, i + 1, value)
+    if new_child is child:
+        return obj
+    return _copy_with_child(obj, keys[i], new_child)
+
+
+def with_property(obj: Any, property_path: str, value: Any) -> Any:
+    # returns a copy of obj with the value set, without changing obj
+    return _with_keys(obj, compile_property_path(property_path), 0, value)
+
+
+def _without_keys(obj: Any, keys: PropertyPath, i: int) -> Any:
+    if i == len(keys) - 1:
+        if _get_child(obj, keys[i]) is _MISSING:
+            return obj
+        obj_copy: Any = copy.copy(obj)
+        _delete_child(obj_copy, keys[i])
+        return obj_copy
+    child: Any = _get_child(obj, keys[i])
+    if child is _MISSING:
+        return obj
+    new_child: Any = _without_keys(child, keys, i + 1)
+    if new_child is child:
+        return obj
+    return _copy_with_child(obj, keys[i], new_child)
+
+
+def without_property(obj: Any, property_path: str) -> Any:
+    # returns a copy of obj with the value deleted, without changing obj,
+    # or obj itself when there is no value to delete
+    return _without_keys(obj, compile_property_path(property_path), 0)
@@ -0,0 +1,195 @@
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import IO, Any, Callable, Dict, List, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+# JSON-RPC 2.0 with one message per line, so a client, or nc, writes a request
+# as a line and reads its response as a line
+
+JSON_RPC_VERSION: str = "2.0"
+
+# error codes from the JSON-RPC 2.0 specification
+PARSE_ERROR: int = -32700
+INVALID_REQUEST: int = -32600
+METHOD_NOT_FOUND: int = -32601
+INVALID_PARAMS: int = -32602
+INTERNAL_ERROR: int = -32603
+# the first of the codes that are reserved for errors of the methods
+SERVER_ERROR: int = -32000
+
+
+class JsonRpcServerException(Exception):
+    pass
+
+
+class JsonRpcException(Exception):
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_error(self) -> Dict[str, Any]:
+        error: Dict[str, Any] = {'code': self.code, 'message': self.message}
+        if self.data is not None:
+            error['data'] = self.data
+        return error
+
+
+class JsonRpcMethod:
+
+    def __init__(self, function: Callable[[Any], Any], params_model: Type[BaseModel]):
+        self.function = function
+        self.params_model = params_model
+
+
+def _to_response(request_id: Any, result: Any = None, error: Union[JsonRpcException, None] = None) -> Dict[str, Any]:
+    response: Dict[str, Any] = {'jsonrpc': JSON_RPC_VERSION}
+    if error is None:
+        response['result'] = result
+    else:
+        response['error'] = error.to_error()
+    response['id'] = request_id
+    return response
+
+
+class JsonRpcServer:
+
+    def __init__(self):
+        # {method name} -> method
+        self.methods: Dict[str, JsonRpcMethod] = {}
+        # the methods share open files, so requests of several connections are handled one at a time
+        self._lock: threading.Lock = threading.Lock()
+
+    def add_method(self, name: str, function: Callable[[Any], Any], params_model: Type[BaseModel]) -> None:
+        # the params of a request are validated with the params model, which is passed to the function
+        self.methods[name] = JsonRpcMethod(
+            function=function, params_model=params_model)
+
+    def _call(self, request: Any) -> Any:
+        if not isinstance(request, dict) or request.get('jsonrpc') != JSON_RPC_VERSION or not isinstance(request.get('method'), str):
+            raise JsonRpcException(
+                INVALID_REQUEST, "Invalid Request")
+        method: Union[JsonRpcMethod, None] = self.methods.get(
+            request['method'])
+        if method is None:
+            raise JsonRpcException(
+                METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        params: Any = request.get('params', {})
+        if not isinstance(params, dict):
+            raise JsonRpcException(
+                INVALID_PARAMS, "Invalid params: params must be an object")
+        try:
+            validated_params: BaseModel = method.params_model.model_validate(
+                params)
+        except ValidationError as e:
+            raise JsonRpcException(
+                INVALID_PARAMS, "Invalid params", data=json.loads(e.json(include_url=False)))
+        try:
+            return method.function(validated_params)
+        except JsonRpcException:
+            raise
+        except Exception as e:
+            raise JsonRpcException(
+                SERVER_ERROR, f"{type(e).__name__}: {e}")
+
+    def handle_request(self, request: Any) -> Union[Dict[str, Any], None]:
+        # returns the response, or None for a notification, which is a request without an id
+        is_notification: bool = isinstance(request, dict) and 'id' not in request
+        request_id: Any = request.get('id') if isinstance(
+            request, dict) else None
+        try:
+            with self._lock:
+                result: Any = self._call(request)
+        except JsonRpcException as e:
+            return None if is_notification else _to_response(request_id=request_id, error=e)
+        return None if is_notification else _to_response(request_id=request_id, result=result)
+
+    def handle_line(self, line: str) -> Union[str, None]:
+        # returns the response line without its line break, or None when there is nothing to answer
+        if line.strip() == '':
+            return None
+        try:
+            message: Any = json.loads(line)
+        except ValueError:
+            return json.dumps(_to_response(request_id=None, error=JsonRpcException(PARSE_ERROR, "Parse error")))
+        if isinstance(message, list):
+            # a batch, whose responses are sent together in one list
+            if not len(message):
+                return json.dumps(_to_response(request_id=None, error=JsonRpcException(INVALID_REQUEST, "Invalid Request")))
+            responses: List[Dict[str, Any]] = [
+                response for response in map(self.handle_request, message) if response is not None]
+            return json.dumps(responses) if len(responses) else None
+        response: Union[Dict[str, Any], None] = self.handle_request(message)
+        return None if response is None else json.dumps(response)
+
+    def serve_stream(self, reader: IO[str], writer: IO[str]) -> None:
+        # answers the requests until the reader ends, like stdin when the client closes it
+        for line in reader:
+            response_line: Union[str, None] = self.handle_line(line)
+            if response_line is not None:
+                writer.write(response_line)
+                writer.write('\n')
+                writer.flush()
+
+    def serve_unix_socket(self, socket_path: str, on_ready: Union[Callable[[], None], None] = None) -> None:
+        # answers the requests of every connection until the server is interrupted
+        with self.open_unix_socket_server(socket_path=socket_path) as unix_socket_server:
+            if on_ready is not None:
+                on_ready()
+            try:
+                unix_socket_server.serve_forever()
+            finally:
+                _remove_socket_file(socket_path)
+
+    def open_unix_socket_server(self, socket_path: str) -> socketserver.UnixStreamServer:
+        _remove_stale_socket_file(socket_path)
+        json_rpc_server: JsonRpcServer = self
+
+        class JsonRpcRequestHandler(socketserver.StreamRequestHandler):
+
+            def handle(self) -> None:
+                for line in self.rfile:
+                    response_line: Union[str, None] = json_rpc_server.handle_line(
+                        line.decode('utf-8', errors='replace'))
+                    if response_line is not None:
+                        self.wfile.write(response_line.encode('utf-8'))
+                        self.wfile.write(b'\n')
+                        self.wfile.flush()
+
+        unix_socket_server: socketserver.UnixStreamServer = socketserver.ThreadingUnixStreamServer(
+            socket_path, JsonRpcRequestHandler)
+        unix_socket_server.daemon_threads = True
+        return unix_socket_server
+
+
+def _remove_socket_file(socket_path: str) -> None:
+    try:
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.remove(socket_path)
+    except OSError:
+        pass
+
+
+def _remove_stale_socket_file(socket_path: str) -> None:
+    # a socket file left by a server that did not stop cleanly is removed, but
+    # the socket of a server that is still running is not taken over
+    try:
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            return
+    except OSError:
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        try:
+            client_socket.connect(socket_path)
+        except OSError:
+            _remove_socket_file(socket_path)
+            return
+    raise JsonRpcServerException(
+        f"A server is already listening on {socket_path}")
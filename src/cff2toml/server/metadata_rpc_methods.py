@@ -0,0 +1,133 @@
+import os
+from typing import Any, Dict, List, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from cff2toml.models.files.atomic_write import Durability
+from cff2toml.models.files.cff_file import DEFAULT_CITATION_CFF_FILE_PATH
+from cff2toml.models.files.loaded_file_cache import LoadedFileCache
+from cff2toml.models.files.pyproject_toml_file import DEFAULT_PYPROJECT_TOML_FILE_PATH
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import PROPERTY_MAPPINGS, SYNCHRONIZED_CFF_KEYS, CffAndPyprojectTomlFileSynchronizer
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import SyncSource
+from cff2toml.models.files.yaml_backend import YamlBackendName
+from cff2toml.server.json_rpc_server import INVALID_PARAMS, JsonRpcException, JsonRpcServer
+
+
+class FilePairParams(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
+    # relative paths are relative to the working directory of the server
+    cff_file_path: str = DEFAULT_CITATION_CFF_FILE_PATH
+    pyproject_toml_file_path: str = DEFAULT_PYPROJECT_TOML_FILE_PATH
+
+
+class ViewParams(FilePairParams):
+    # the common property names to view, or None for all of them
+    names: Union[List[str], None] = None
+
+
+class ChangeParams(FilePairParams):
+    # {common property name} -> {value}
+    values: Dict[str, str]
+
+
+class SyncParams(FilePairParams):
+    source: SyncSource = SyncSource.PYPROJECT_TOML
+    delete_missing_metadata: bool = True
+
+
+class WrittenFilesResult(BaseModel):
+    written_file_paths: List[str] = []
+
+
+def _check_common_property_names(names: List[str]) -> None:
+    unknown_names: List[str] = [
+        name for name in names if name not in PROPERTY_MAPPINGS]
+    if len(unknown_names):
+        raise JsonRpcException(
+            INVALID_PARAMS, f"Unknown common property names: {', '.join(unknown_names)}, expected some of: {', '.join(PROPERTY_MAPPINGS)}")
+
+
+class MetadataRpcMethods:
+
+    # the view, change and sync operations of the CLI as JSON-RPC methods. the files
+    # stay open between requests, and are parsed again only when they changed on disk
+
+    def __init__(self, yaml_backend: Union[YamlBackendName, str, None] = None, durability: Durability = Durability.NONE):
+        self.durability = durability
+        # only the synchronized sections of CFF files are parsed
+        self.loaded_file_cache: LoadedFileCache = LoadedFileCache(
+            yaml_backend=yaml_backend, selected_cff_keys=SYNCHRONIZED_CFF_KEYS)
+
+    def add_to(self, json_rpc_server: JsonRpcServer) -> None:
+        json_rpc_server.add_method(
+            "view", function=self.view, params_model=ViewParams)
+        json_rpc_server.add_method(
+            "change", function=self.change, params_model=ChangeParams)
+        json_rpc_server.add_method(
+            "sync", function=self.sync, params_model=SyncParams)
+
+    def _open_file_pair(self, params: FilePairParams) -> CffAndPyprojectTomlFileSynchronizer:
+        return CffAndPyprojectTomlFileSynchronizer(
+            cff_file=self.loaded_file_cache.get_cff_file(
+                file_path=os.path.abspath(params.cff_file_path)),
+            pyproject_toml_file=self.loaded_file_cache.get_pyproject_toml_file(
+                file_path=os.path.abspath(params.pyproject_toml_file_path)))
+
+    def _save(self, file_sync: CffAndPyprojectTomlFileSynchronizer) -> WrittenFilesResult:
+        file_paths: List[str] = [file_sync.cff_file.file_path,
+                                 file_sync.pyproject_toml_file.file_path]
+        try:
+            written_file_paths: List[str] = file_sync.save(
+                durability=self.durability)
+        except:
+            # the open files may have metadata that was not written
+            for file_path in file_paths:
+                self.loaded_file_cache.discard(file_path=file_path)
+            raise
+        for file_path in written_file_paths:
+            self.loaded_file_cache.mark_saved(file_path=file_path)
+        return WrittenFilesResult(written_file_paths=written_file_paths)
+
+    def view(self, params: ViewParams) -> Dict[str, Any]:
+        # {common property name} -> the property path and value in each file
+        names: List[str] = list(
+            PROPERTY_MAPPINGS) if params.names is None else params.names
+        _check_common_property_names(names=names)
+        file_sync: CffAndPyprojectTomlFileSynchronizer = self._open_file_pair(
+            params=params)
+        return {name: common_property_values.model_dump(mode='json') for name, common_property_values in file_sync.get_common_property_values().items() if name in names}
+
+    def change(self, params: ChangeParams) -> Dict[str, Any]:
+        _check_common_property_names(names=list(params.values))
+        if 'authors' in params.values:
+            raise JsonRpcException(
+                INVALID_PARAMS, "Authors cannot be changed to a text value.")
+        file_sync: CffAndPyprojectTomlFileSynchronizer = self._open_file_pair(
+            params=params)
+        file_sync.set_common_properties(values=params.values)
+        return self._save(file_sync=file_sync).model_dump(mode='json')
+
+    def sync(self, params: SyncParams) -> Dict[str, Any]:
+        file_sync: CffAndPyprojectTomlFileSynchronizer = self._open_file_pair(
+            params=params)
+        try:
+            if params.source == SyncSource.CFF:
+                file_sync.update_pyproject_toml_with_cff(
+                    delete_missing_metadata=params.delete_missing_metadata)
+            else:
+                file_sync.update_cff_with_pyproject_toml(
+                    delete_missing_metadata=params.delete_missing_metadata)
+        except:
+            self.loaded_file_cache.discard(file_path=file_sync.cff_file.file_path)
+            self.loaded_file_cache.discard(
+                file_path=file_sync.pyproject_toml_file.file_path)
+            raise
+        return self._save(file_sync=file_sync).model_dump(mode='json')
+
+
+def create_metadata_json_rpc_server(yaml_backend: Union[YamlBackendName, str, None] = None, durability: Durability = Durability.NONE) -> JsonRpcServer:
+    json_rpc_server: JsonRpcServer = JsonRpcServer()
+    MetadataRpcMethods(yaml_backend=yaml_backend,
+                       durability=durability).add_to(json_rpc_server=json_rpc_server)
+    return json_rpc_server
@@ -0,0 +1,104 @@
+import os
+from typing import Dict, List, Tuple
+
+import tomlkit
+import yaml
+
+# the number of authors in the small, medium, huge and massive benchmark files.
+# the other lists in the files grow with the authors
+SIZES: Dict[str, int] = {
+    'small': 2,
+    'medium': 50,
+    'huge': 2000,
+    'massive': 20000,
+}
+
+# the massive files take long to run every benchmark with,
+# so they are only used when they are asked for
+DEFAULT_SIZES: List[str] = ['small', 'medium', 'huge']
+
+GIVEN_NAMES: List[str] = ['Jane', 'John', 'Maria José', 'Wei', 'Ada']
+NAME_PARTICLES: List[str] = ['', 'van', 'de la', 'van den', '']
+FAMILY_NAMES: List[str] = ['Doe', 'Smith', 'García', 'Zhang', 'Lovelace']
+NAME_SUFFIXES: List[str] = ['', 'Jr.', '', 'III', '']
+
+
+def make_names(count: int) -> List[str]:
+    # full names like the ones in pyproject.toml files, with middle names,
+    # particles and suffixes, so every branch of the name parser is used
+    names: List[str] = []
+    for i in range(count):
+        name_parts: List[str] = [GIVEN_NAMES[i % 5], NAME_PARTICLES[(i // 5) % 5],
+                                 FAMILY_NAMES[(i // 25) % 5] + (str(i) if i >= 125 else ''), NAME_SUFFIXES[i % 5]]
+        names.append(' '.join([p for p in name_parts if p]))
+    return names
+
+
+def make_cff_metadata(author_count: int) -> Dict:
+    authors: List[Dict[str, str]] = []
+    for i in range(author_count):
+        author: Dict[str, str] = {
+            'given-names': GIVEN_NAMES[i % 5],
+            'family-names': FAMILY_NAMES[(i // 5) % 5] + str(i),
+            'email': f"author{i}@example.com",
+            'affiliation': f"University {i % 7}",
+            'orcid': f"https://orcid.org/0000-0000-0000-{i:04d}"
+        }
+        if NAME_PARTICLES[i % 5]:
+            author['name-particle'] = NAME_PARTICLES[i % 5]
+        if NAME_SUFFIXES[i % 5]:
+            author['name-suffix'] = NAME_SUFFIXES[i % 5]
+        authors.append(author)
+    return {
+        'cff-version': '1.2.0',
+        'title': 'benchmarktool',
+        'message': 'If you use this software, please cite it using the metadata from this file.',
+        'type': 'software',
+        'authors': authors,
+        'repository-code': 'https://example.com/benchmarktool',
+        'abstract': 'A tool to benchmark cff2toml. ' * max(1, author_count // 10),
+        'keywords': [f"keyword {i}" for i in range(max(2, author_count // 2))],
+        'license': 'MIT',
+        'version': '1.0.0',
+        # cited works are often the biggest part of a CFF file,
+        # and no synchronized metadata is in them
+        'references': [{
+            'type': 'article',
+            'title': f"Reference {i}",
+            'authors': [{'family-names': FAMILY_NAMES[(i + j) % 5], 'given-names': GIVEN_NAMES[j % 5]} for j in range(3)],
+            'year': 2000 + i % 25,
+            'doi': f"10.5281/zenodo.{i}",
+        } for i in range(author_count)],
+    }
+
+
+def make_pyproject_toml_metadata(author_count: int) -> Dict:
+    return {
+        'build-system': {'requires': ['hatchling'], 'build-backend': 'hatchling.build'},
+        'project': {
+            'name': 'benchmarktool',
+            'version': '0.9.0',
+            'description': 'A tool to benchmark cff2toml.',
+            'license': 'Apache-2.0',
+            'authors': [{'name': name, 'email': f"author{i}@example.com"} for i, name in enumerate(make_names(author_count))],
+            'keywords': [f"keyword {i}" for i in range(max(2, author_count // 2))],
+            'dependencies': [f"dependency{i}>=1.0" for i in range(max(2, author_count // 4))],
+            'urls': {'Source': 'https://example.com/benchmarktool/source'},
+        },
+        'tool': {'benchmark': {f"option{i}": i for i in range(max(2, author_count // 4))}},
+    }
+
+
+def write_benchmark_files(dir_path: str, size: str) -> Tuple[str, str]:
+    # returns the paths of the CITATION.cff and pyproject.toml files
+    author_count: int = SIZES[size]
+    cff_file_path: str = os.path.join(dir_path, f"{size}_CITATION.cff")
+    pyproject_toml_file_path: str = os.path.join(
+        dir_path, f"{size}_pyproject.toml")
+    with open(cff_file_path, 'w') as f:
+        yaml.safe_dump(make_cff_metadata(author_count=author_count),
+                       f, sort_keys=False, allow_unicode=True)
+    with open(pyproject_toml_file_path, 'w') as f:
+        f.write(tomlkit.dumps(make_pyproject_toml_metadata(
+            author_count=author_count)))
+    return cff_file_path, pyproject_toml_file_path
@@ -0,0 +1,91 @@
+# compares the compiled property paths of cff2toml.models.property_path
+# with pydash, which Metadata used before, on the paths cff2toml uses.
+# cff2toml sets and deletes by copying the containers on the path, and
+# pydash changes them in place.
+# run with: python -m tests.benchmarks.property_path_benchmark
+import copy
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+import pydash
+
+from cff2toml.models.property_path import get_property, has_property, with_property, without_property
+
+PROPERTY_PATHS: List[str] = [
+    'project.name',
+    'project.version',
+    'project.description',
+    'project.license.text',
+    'project.urls.Source',
+    'project.keywords',
+    'project.authors',
+]
+
+METADATA: Dict[str, Any] = {
+    'project': {
+        'name': 'my-package',
+        'version': '0.0.1',
+        'description': 'my package',
+        'license': {'text': 'MIT'},
+        'urls': {'Source': 'https://example.com/source'},
+        'keywords': ['a', 'b'],
+        'authors': [{'name': 'Jane Doe'}],
+    }
+}
+
+
+def _get_all(get: Callable) -> Callable[[], None]:
+    def run() -> None:
+        for property_path in PROPERTY_PATHS:
+            get(METADATA, property_path)
+    return run
+
+
+def _set_all(set_: Callable) -> Callable[[], None]:
+    metadata: Dict[str, Any] = copy.deepcopy(METADATA)
+
+    def run() -> None:
+        for property_path in PROPERTY_PATHS:
+            set_(metadata, property_path, 'value')
+    return run
+
+
+def _delete_all(unset: Callable, set_: Callable) -> Callable[[], None]:
+    # deletes and puts back each property, so every run deletes something
+    metadata: Dict[str, Any] = copy.deepcopy(METADATA)
+
+    def run() -> None:
+        for property_path in PROPERTY_PATHS:
+            unset(metadata, property_path)
+            set_(metadata, property_path, 'value')
+    return run
+
+
+def _put_back(metadata: Dict[str, Any], property_path: str, value: Any) -> None:
+    # without_property does not change the metadata, so there is nothing to put back
+    pass
+
+
+BENCHMARKS: List[Tuple[str, Callable[[], None], Callable[[], None]]] = [
+    ('get', _get_all(get_property), _get_all(pydash.get)),
+    ('has', _get_all(has_property), _get_all(pydash.has)),
+    ('set', _set_all(with_property), _set_all(pydash.set_)),
+    ('delete', _delete_all(without_property, _put_back), _delete_all(pydash.unset, pydash.set_)),
+]
+
+
+def _time_per_call_ns(run: Callable[[], None], number: int) -> float:
+    seconds: float = min(timeit.repeat(run, number=number, repeat=5))
+    return seconds / (number * len(PROPERTY_PATHS)) * 1e9
+
+
+def main(number: int = 2000) -> None:
+    print(f"{'operation':<10}{'cff2toml ns':>14}{'pydash ns':>14}{'speedup':>10}")
+    for name, run, pydash_run in BENCHMARKS:
+        ns: float = _time_per_call_ns(run, number)
+        pydash_ns: float = _time_per_call_ns(pydash_run, number)
+        print(f"{name:<10}{ns:>14.0f}{pydash_ns:>14.0f}{pydash_ns / ns:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from cff2toml.models.agents.authors.synchronizers.cff_and_pyproject_toml_author_synchronizer import CffAndPyprojectTomlAuthorSynchronizer
+from cff2toml.models.agents.people.human_name import HumanNameParser
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_drift import check_cff_and_pyproject_toml_file_pair
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import SYNCHRONIZED_CFF_KEYS, CffAndPyprojectTomlFileSynchronizer
+from cff2toml.models.metadata import Metadata
+from tests.benchmarks.fixtures import DEFAULT_SIZES, SIZES, make_names, write_benchmark_files
+
+# times the hot paths of cff2toml on small, medium and huge files,
+# and saves the results as JSON, so two runs can be compared.
+# run with: python -m tests.benchmarks --output results.json
+# and compare with: python -m tests.benchmarks --compare old.json new.json
+
+RESULTS_FORMAT_VERSION: int = 1
+
+# an operation is timed in batches that take at least this long,
+# and the fastest of the repeated batches is kept
+DEFAULT_MIN_BATCH_TIME_S: float = 0.05
+DEFAULT_REPEAT: int = 5
+
+# a benchmark is a regression when it is this much slower than before
+DEFAULT_REGRESSION_THRESHOLD: float = 1.10
+
+METADATA_PROPERTY_PATHS: List[str] = [
+    'project.name', 'project.version', 'project.description', 'project.license', 'project.urls.Source', 'project.authors']
+
+
+class BenchmarkFiles(NamedTuple):
+    cff_file_path: str
+    pyproject_toml_file_path: str
+    # a directory for files that are written by the benchmarks
+    output_dir_path: str
+
+
+# a benchmark makes an operation from the files of one size, so
+# the setup, like parsing the files, is not part of the timing
+Benchmark = Callable[[BenchmarkFiles], Callable[[], Any]]
+
+
+def _open_file_synchronizer(files: BenchmarkFiles) -> CffAndPyprojectTomlFileSynchronizer:
+    return CffAndPyprojectTomlFileSynchronizer(cff_file=CffFile(file_path=files.cff_file_path),
+                                               pyproject_toml_file=PyprojectTomlFile(file_path=files.pyproject_toml_file_path))
+
+
+def cff_file_load(files: BenchmarkFiles) -> Callable[[], Any]:
+    return lambda: CffFile(file_path=files.cff_file_path).metadata
+
+
+def cff_file_load_synchronized_keys(files: BenchmarkFiles) -> Callable[[], Any]:
+    # like view all, which only parses the synchronized sections of the CFF file
+    return lambda: CffFile(file_path=files.cff_file_path, selected_keys=SYNCHRONIZED_CFF_KEYS).get_metadata('title')
+
+
+def pyproject_toml_file_load(files: BenchmarkFiles) -> Callable[[], Any]:
+    return lambda: PyprojectTomlFile(file_path=files.pyproject_toml_file_path).metadata
+
+
+def cff_file_save(files: BenchmarkFiles) -> Callable[[], Any]:
+    cff_file: CffFile = CffFile(file_path=files.cff_file_path)
+    cff_file.metadata
+    output_file_path: str = os.path.join(
+        files.output_dir_path, 'CITATION.cff')
+    return lambda: cff_file.save(file_path=output_file_path, force=True)
+
+
+def cff_file_change_version(files: BenchmarkFiles) -> Callable[[], Any]:
+    # like change --set version=..., which only parses the version section, sets
+    # it through the synchronizer like the CLI does, and patches it on save
+    output_file_path: str = os.path.join(
+        files.output_dir_path, 'CITATION.cff')
+    versions: List[str] = ['1.0.0', '2.0.0']
+
+    def run() -> None:
+        # alternate the versions, so every save changes the version
+        versions.reverse()
+        file_sync: CffAndPyprojectTomlFileSynchronizer = CffAndPyprojectTomlFileSynchronizer(
+            cff_file=CffFile(file_path=files.cff_file_path,
+                             selected_keys=['version']),
+            pyproject_toml_file=PyprojectTomlFile(file_path=files.pyproject_toml_file_path))
+        file_sync.set_common_properties(values={'version': versions[0]})
+        file_sync.cff_file.save(file_path=output_file_path)
+    return run
+
+
+def pyproject_toml_file_save(files: BenchmarkFiles) -> Callable[[], Any]:
+    pyproject_toml_file: PyprojectTomlFile = PyprojectTomlFile(
+        file_path=files.pyproject_toml_file_path)
+    pyproject_toml_file.metadata
+    output_file_path: str = os.path.join(
+        files.output_dir_path, 'pyproject.toml')
+    return lambda: pyproject_toml_file.save(file_path=output_file_path, force=True)
+
+
+def metadata_get(files: BenchmarkFiles) -> Callable[[], Any]:
+    metadata: Metadata = PyprojectTomlFile(
+        file_path=files.pyproject_toml_file_path).metadata
+
+    def run() -> None:
+        for property_path in METADATA_PROPERTY_PATHS:
+            metadata.get(property_path)
+    return run
+
+
+def metadata_set(files: BenchmarkFiles) -> Callable[[], Any]:
+    metadata: Metadata = PyprojectTomlFile(
+        file_path=files.pyproject_toml_file_path).metadata
+    values: List[str] = ['a', 'b']
+
+    def run() -> None:
+        # alternate the values, so every set changes the metadata
+        values.reverse()
+        for property_path in METADATA_PROPERTY_PATHS[:-1]:
+            metadata.set(property_path, values[0])
+    return run
+
+
+def _update(files: BenchmarkFiles, update: Callable[[CffAndPyprojectTomlFileSynchronizer], None]) -> Callable[[], Any]:
+    file_sync: CffAndPyprojectTomlFileSynchronizer = _open_file_synchronizer(
+        files)
+    cff_metadata_snapshot: Metadata = file_sync.cff_file.metadata.snapshot()
+    pyproject_toml_metadata_snapshot: Metadata = file_sync.pyproject_toml_file.metadata.snapshot()
+
+    def run() -> None:
+        # start every update from the files as they were loaded
+        file_sync.cff_file.metadata.restore(cff_metadata_snapshot)
+        file_sync.pyproject_toml_file.metadata.restore(
+            pyproject_toml_metadata_snapshot)
+        update(file_sync)
+    return run
+
+
+def update_cff_with_pyproject_toml(files: BenchmarkFiles) -> Callable[[], Any]:
+    return _update(files, lambda file_sync: file_sync.update_cff_with_pyproject_toml())
+
+
+def update_pyproject_toml_with_cff(files: BenchmarkFiles) -> Callable[[], Any]:
+    return _update(files, lambda file_sync: file_sync.update_pyproject_toml_with_cff())
+
+
+def update_in_sync_files(files: BenchmarkFiles) -> Callable[[], Any]:
+    # files that were synced before, which is what most syncs find
+    file_sync: CffAndPyprojectTomlFileSynchronizer = _open_file_synchronizer(
+        files)
+    file_sync.update_cff_with_pyproject_toml()
+    return lambda: file_sync.update_cff_with_pyproject_toml()
+
+
+def check_file_pair(files: BenchmarkFiles) -> Callable[[], Any]:
+    return lambda: check_cff_and_pyproject_toml_file_pair(cff_file_path=files.cff_file_path, pyproject_toml_file_path=files.pyproject_toml_file_path, check_all=True)
+
+
+def to_cff_author_data(files: BenchmarkFiles) -> Callable[[], Any]:
+    authors = PyprojectTomlFile(
+        file_path=files.pyproject_toml_file_path).authors
+    return lambda: [CffAndPyprojectTomlAuthorSynchronizer.to_cff_author_data(author=author) for author in authors]
+
+
+def to_pyproject_toml_author_data(files: BenchmarkFiles) -> Callable[[], Any]:
+    authors = CffFile(file_path=files.cff_file_path).authors
+    return lambda: [CffAndPyprojectTomlAuthorSynchronizer.to_pyproject_toml_author_data(author=author) for author in authors]
+
+
+def pyproject_toml_authors_to_author_data(files: BenchmarkFiles) -> Callable[[], Any]:
+    authors = PyprojectTomlFile(
+        file_path=files.pyproject_toml_file_path).authors
+    return lambda: CffAndPyprojectTomlAuthorSynchronizer.to_author_data(authors=authors)
+
+
+def cff_authors_to_author_data(files: BenchmarkFiles) -> Callable[[], Any]:
+    authors = CffFile(file_path=files.cff_file_path).authors
+    return lambda: CffAndPyprojectTomlAuthorSynchronizer.to_author_data(authors=authors)
+
+
+def human_name_parse(files: BenchmarkFiles) -> Callable[[], Any]:
+    names: List[str] = [author['name'] for author in PyprojectTomlFile(
+        file_path=files.pyproject_toml_file_path).metadata_project_authors]
+    return lambda: [HumanNameParser.parse(text=name) for name in names]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    'cff_file_load': cff_file_load,
+    'cff_file_load_synchronized_keys': cff_file_load_synchronized_keys,
+    'pyproject_toml_file_load': pyproject_toml_file_load,
+    'cff_file_save': cff_file_save,
+    'cff_file_change_version': cff_file_change_version,
+    'pyproject_toml_file_save': pyproject_toml_file_save,
+    'metadata_get': metadata_get,
+    'metadata_set': metadata_set,
+    'update_cff_with_pyproject_toml': update_cff_with_pyproject_toml,
+    'update_pyproject_toml_with_cff': update_pyproject_toml_with_cff,
+    'update_in_sync_files': update_in_sync_files,
+    'check_file_pair': check_file_pair,
+    'to_cff_author_data': to_cff_author_data,
+    'to_pyproject_toml_author_data': to_pyproject_toml_author_data,
+    'pyproject_toml_authors_to_author_data': pyproject_toml_authors_to_author_data,
+    'cff_authors_to_author_data': cff_authors_to_author_data,
+    'human_name_parse': human_name_parse,
+}
+
+
+def time_operation(operation: Callable[[], Any], min_batch_time_s: float = DEFAULT_MIN_BATCH_TIME_S, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    timer = timeit.Timer(operation)
+    # like timeit.Timer.autorange, but with a configurable batch time
+    number: int = 1
+    while True:
+        batch_time_s: float = timer.timeit(number=number)
+        if batch_time_s >= min_batch_time_s:
+            break
+        number *= 10 if batch_time_s < min_batch_time_s / 10 else 2
+    batch_times_s: List[float] = [batch_time_s] + \
+        timer.repeat(repeat=repeat - 1, number=number)
+    return {
+        'seconds_per_operation': min(batch_times_s) / number,
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def run_benchmarks(benchmark_names: List[str], sizes: List[str], min_batch_time_s: float = DEFAULT_MIN_BATCH_TIME_S, repeat: int = DEFAULT_REPEAT, on_result: Callable[[str, str, Dict[str, Any]], None] = lambda benchmark_name, size, result: None) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+    tmp_dir_path: str = tempfile.mkdtemp(prefix='cff2toml-benchmarks-')
+    try:
+        for size in sizes:
+            size_dir_path: str = os.path.join(tmp_dir_path, size)
+            output_dir_path: str = os.path.join(size_dir_path, 'output')
+            os.makedirs(output_dir_path)
+            cff_file_path, pyproject_toml_file_path = write_benchmark_files(
+                dir_path=size_dir_path, size=size)
+            files: BenchmarkFiles = BenchmarkFiles(
+                cff_file_path=cff_file_path, pyproject_toml_file_path=pyproject_toml_file_path, output_dir_path=output_dir_path)
+            for benchmark_name in benchmark_names:
+                result: Dict[str, Any] = time_operation(
+                    BENCHMARKS[benchmark_name](files), min_batch_time_s=min_batch_time_s, repeat=repeat)
+                results.setdefault(benchmark_name, {})[size] = result
+                on_result(benchmark_name, size, result)
+    finally:
+        shutil.rmtree(tmp_dir_path, ignore_errors=True)
+    return {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': {size: SIZES[size] for size in sizes},
+        'results': results
+    }
+
+
+def compare_results(old_results: Dict[str, Any], new_results: Dict[str, Any], threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[Tuple[str, str, float, float, float, bool]]:
+    # returns (benchmark, size, old seconds, new seconds, ratio, is regression)
+    # for the benchmarks and sizes that are in both results
+    comparisons: List[Tuple[str, str, float, float, float, bool]] = []
+    for benchmark_name, new_size_results in new_results['results'].items():
+        old_size_results: Dict[str, Any] = old_results['results'].get(
+            benchmark_name, {})
+        for size, new_result in new_size_results.items():
+            if size not in old_size_results:
+                continue
+            old_seconds: float = old_size_results[size]['seconds_per_operation']
+            new_seconds: float = new_result['seconds_per_operation']
+            ratio: float = new_seconds / old_seconds
+            comparisons.append(
+                (benchmark_name, size, old_seconds, new_seconds, ratio, ratio > threshold))
+    return comparisons
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in [('s', 1), ('ms', 1e-3), ('us', 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _print_result(benchmark_name: str, size: str, result: Dict[str, Any]) -> None:
+    print(f"{benchmark_name:<40}{size:<8}{_format_seconds(result['seconds_per_operation']):>12}")
+
+
+def _load_results(file_path: str) -> Dict[str, Any]:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def main(argv: List[str] = sys.argv[1:]) -> int:
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmarks',
+                                     description='Time the hot paths of cff2toml, or compare two saved runs.')
+    parser.add_argument('--benchmark', action='append', choices=list(BENCHMARKS),
+                        help='benchmark to run (can be repeated, defaults to all)')
+    parser.add_argument('--size', action='append', choices=list(SIZES),
+                        help=f"file size to run with (can be repeated, defaults to {', '.join(DEFAULT_SIZES)})")
+    parser.add_argument('--output', help='JSON file to save the results to')
+    parser.add_argument('--quick', action='store_true',
+                        help='time each benchmark once with short batches, to check that they run')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two saved results instead of running the benchmarks')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help=f"slowdown ratio that is flagged as a regression (default: {DEFAULT_REGRESSION_THRESHOLD})")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        comparisons = compare_results(old_results=_load_results(args.compare[0]), new_results=_load_results(
+            args.compare[1]), threshold=args.threshold)
+        print(f"{'benchmark':<40}{'size':<8}{'old':>12}{'new':>12}{'ratio':>8}")
+        for benchmark_name, size, old_seconds, new_seconds, ratio, is_regression in comparisons:
+            print(f"{benchmark_name:<40}{size:<8}{_format_seconds(old_seconds):>12}{_format_seconds(new_seconds):>12}{ratio:>7.2f}x{'  REGRESSION' if is_regression else ''}")
+        # fail like a test, so the comparison can be used in scripts
+        return 1 if any(comparison[5] for comparison in comparisons) else 0
+
+    print(f"{'benchmark':<40}{'size':<8}{'time/op':>12}")
+    results: Dict[str, Any] = run_benchmarks(benchmark_names=args.benchmark or list(BENCHMARKS), sizes=args.size or DEFAULT_SIZES,
+                                             min_batch_time_s=0.001 if args.quick else DEFAULT_MIN_BATCH_TIME_S, repeat=1 if args.quick else DEFAULT_REPEAT, on_result=_print_result)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"saved the results to {args.output}")
+    return 0
@@ -0,0 +1,35 @@
+import json
+
+from tests.benchmarks.run_benchmarks import BENCHMARKS, compare_results, main, run_benchmarks
+
+
+def test_every_benchmark_runs_on_small_files():
+    results = run_benchmarks(benchmark_names=list(BENCHMARKS), sizes=[
+                             'small'], min_batch_time_s=0, repeat=1)
+    assert list(results['results'].keys()) == list(BENCHMARKS)
+    for size_results in results['results'].values():
+        assert size_results['small']['seconds_per_operation'] > 0
+
+
+def test_compare_results_flags_regressions():
+    old_results = {'results': {'a': {'small': {'seconds_per_operation': 1.0}, 'huge': {
+        'seconds_per_operation': 1.0}}, 'b': {'small': {'seconds_per_operation': 1.0}}}}
+    new_results = {'results': {'a': {'small': {'seconds_per_operation': 1.05}, 'huge': {
+        'seconds_per_operation': 2.0}}, 'c': {'small': {'seconds_per_operation': 1.0}}}}
+    assert compare_results(old_results=old_results, new_results=new_results, threshold=1.1) == [
+        ('a', 'small', 1.0, 1.05, 1.05, False), ('a', 'huge', 1.0, 2.0, 2.0, True)]
+
+
+def test_main_saves_and_compares_results(tmp_path):
+    old_file_path = str(tmp_path / 'old.json')
+    new_file_path = str(tmp_path / 'new.json')
+    assert main(['--quick', '--size', 'small', '--benchmark',
+                'metadata_get', '--output', old_file_path]) == 0
+    with open(old_file_path, 'r') as f:
+        results = json.load(f)
+    assert results['sizes'] == {'small': 2}
+    results['results']['metadata_get']['small']['seconds_per_operation'] /= 10
+    with open(new_file_path, 'w') as f:
+        json.dump(results, f)
+    assert main(['--compare', old_file_path, new_file_path]) == 0
+    assert main(['--compare', new_file_path, old_file_path]) == 1
@@ -0,0 +1,35 @@
+import os
+
+from cff2toml.cli.about_command.about_metadata import read_about_metadata, write_about_metadata_module
+from cff2toml.models.agents.authors.cff_entity_author import CffEntityAuthor
+from cff2toml.models.files.cff_file import CffFile
+
+
+def test_read_about_metadata_formats_authors_like_cff_file(dummy_cff_file_path):
+    about_metadata = read_about_metadata(
+        citation_cff_file_path=dummy_cff_file_path)
+    cff_file = CffFile(file_path=dummy_cff_file_path)
+    assert about_metadata['title'] == cff_file.metadata_title
+    assert about_metadata['version'] == cff_file.metadata_version
+    assert about_metadata['repository-code'] == cff_file.metadata_repository_code
+    assert about_metadata['authors'] == [{'name': author.name if isinstance(author, CffEntityAuthor) else author.format_full_name(
+    ), 'email': author.email} for author in cff_file.authors]
+
+
+def test_read_about_metadata_names_entities_without_names_anonymous(tmp_path):
+    citation_cff_file_path = os.path.join(tmp_path, 'CITATION.cff')
+    with open(citation_cff_file_path, 'w') as f:
+        f.write('title: sometool\nauthors:\n  - email: someone@somedomain.com\n')
+    assert read_about_metadata(citation_cff_file_path=citation_cff_file_path)['authors'] == [
+        {'name': 'anonymous', 'email': 'someone@somedomain.com'}]
+
+
+def test_write_about_metadata_module(dummy_cff_file_path, tmp_path):
+    module_file_path = os.path.join(tmp_path, '_about_metadata.py')
+    write_about_metadata_module(
+        citation_cff_file_path=dummy_cff_file_path, module_file_path=module_file_path)
+    module_globals = {}
+    with open(module_file_path, 'r') as f:
+        exec(f.read(), module_globals)
+    assert module_globals['ABOUT_METADATA'] == read_about_metadata(
+        citation_cff_file_path=dummy_cff_file_path)
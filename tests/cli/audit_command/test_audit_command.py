@@ -0,0 +1,24 @@
+import json
+
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+
+runner = CliRunner()
+
+
+def test_audit_command(dummy_git_repo_dir_path):
+    repo_dir_path, commits = dummy_git_repo_dir_path
+    result = runner.invoke(app, ['--json', 'audit', '--repo', repo_dir_path])
+    assert result.exit_code == 0
+    output = json.loads(result.output)
+    assert output['commits'] == 3
+    assert output['drifted'] == 1
+    assert output['results'][1]['commit'] == commits[2]
+
+
+def test_audit_command_with_a_bad_rev_range(dummy_git_repo_dir_path):
+    repo_dir_path, _ = dummy_git_repo_dir_path
+    result = runner.invoke(
+        app, ['audit', '--repo', repo_dir_path, '--rev-range', 'nope'])
+    assert result.exit_code == 1
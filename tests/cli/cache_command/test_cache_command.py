@@ -0,0 +1,37 @@
+import os
+import shutil
+
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+from cff2toml.models.files.parse_cache import set_default_parse_cache
+
+runner = CliRunner()
+
+
+def _count_cache_entries(cache_dir):
+    return sum(len(os.listdir(os.path.join(cache_dir, versioned_dir, 'data'))) for versioned_dir in os.listdir(cache_dir))
+
+
+def test_cache_warm_warms_the_entries_that_the_commands_use(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    project_dir = os.path.join(tmp_path, 'project')
+    os.makedirs(project_dir)
+    cff_file_path = os.path.join(project_dir, 'CITATION.cff')
+    pyproject_toml_file_path = os.path.join(project_dir, 'pyproject.toml')
+    shutil.copy(dummy_cff_file_path, cff_file_path)
+    shutil.copy(dummy_pyproject_toml_file_path, pyproject_toml_file_path)
+    cache_dir = os.path.join(tmp_path, 'cache')
+    try:
+        result = runner.invoke(
+            app, ['--cache-dir', cache_dir, 'cache', 'warm', project_dir])
+        assert result.exit_code == 0
+
+        entries = _count_cache_entries(cache_dir)
+        for args in [['view', 'version'], ['view', 'all'], ['check']]:
+            result = runner.invoke(app, ['--cache-dir', cache_dir] + args + (
+                [project_dir] if args == ['check'] else ['--cff-file-path', cff_file_path, '--pyproject-toml-path', pyproject_toml_file_path]))
+            assert result.exit_code in [0, 1], result.output
+        # the commands only used entries that were warmed
+        assert _count_cache_entries(cache_dir) == entries
+    finally:
+        set_default_parse_cache(None)
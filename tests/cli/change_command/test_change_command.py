@@ -0,0 +1,31 @@
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+from tests.temp_copied_file import TempCopiedFile
+
+runner = CliRunner()
+
+
+def test_change_version_only_changes_the_version(dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file, TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            text_before_change = f.read()
+        result = runner.invoke(app, ['change', 'version', '1.2.3', '--cff-file-path',
+                               tmp_dummy_cff_file.file_path, '--pyproject-toml-path', tmp_dummy_pyproject_toml_file.file_path])
+        assert result.exit_code == 0
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            assert f.read() == text_before_change.replace(
+                'version: "0.0.2"\n', 'version: "1.2.3"\n')
+
+
+def test_change_with_file_paths_before_the_command_fails(dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file, TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            text_before_change = f.read()
+        for file_path_option, file_path in [('--cff-file-path', tmp_dummy_cff_file.file_path), ('--pyproject-toml-path', tmp_dummy_pyproject_toml_file.file_path)]:
+            result = runner.invoke(
+                app, ['change', file_path_option, file_path, 'version', '1.2.3'])
+            assert result.exit_code == 2
+            assert file_path_option in result.output
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            assert f.read() == text_before_change
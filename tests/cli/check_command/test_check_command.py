@@ -0,0 +1,45 @@
+import json
+import os
+import shutil
+
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+
+runner = CliRunner()
+
+
+def _copy_file_pair(dir_path, cff_file_path, pyproject_toml_file_path):
+    os.makedirs(dir_path)
+    shutil.copy2(cff_file_path, os.path.join(dir_path, 'CITATION.cff'))
+    shutil.copy2(pyproject_toml_file_path,
+                 os.path.join(dir_path, 'pyproject.toml'))
+
+
+def test_check_command_exit_codes(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    _copy_file_pair(os.path.join(tmp_path, 'a'), dummy_cff_file_path,
+                    dummy_pyproject_toml_file_path)
+    result = runner.invoke(app, ['sync-tree', str(tmp_path)])
+    assert result.exit_code == 0
+    result = runner.invoke(app, ['check', str(tmp_path)])
+    assert result.exit_code == 0
+
+    _copy_file_pair(os.path.join(tmp_path, 'b'), dummy_cff_file_path,
+                    dummy_pyproject_toml_file_path)
+    result = runner.invoke(app, ['--json', 'check', str(tmp_path)])
+    assert result.exit_code == 1
+    output = json.loads(result.output)
+    assert output['status'] == 'drift'
+    assert [len(result['drifted_common_property_values'])
+            for result in output['results']] == [1]
+
+    with open(os.path.join(tmp_path, 'a', 'pyproject.toml'), 'w') as f:
+        f.write('[[[')
+    result = runner.invoke(app, ['--json', 'check', '--all', str(tmp_path)])
+    assert result.exit_code == 2
+    assert json.loads(result.output)['checked'] == 2
+
+
+def test_check_command_without_pairs(tmp_path):
+    result = runner.invoke(app, ['check', str(tmp_path)])
+    assert result.exit_code == 2
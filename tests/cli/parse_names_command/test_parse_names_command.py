@@ -0,0 +1,26 @@
+import json
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+
+runner = CliRunner()
+
+
+def test_parse_names_command():
+    result = runner.invoke(app, ['parse-names'],
+                           input='Jan van den Berg\n\nBob Dave Smith Jr.\r\nJosé García')
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {'first_name': 'Jan', 'middle_name': '', 'particle': 'van den',
+            'last_name': 'Berg', 'suffix': ''},
+        {'first_name': '', 'middle_name': '', 'particle': '', 'last_name': '', 'suffix': ''},
+        {'first_name': 'Bob', 'middle_name': 'Dave', 'particle': '',
+            'last_name': 'Smith', 'suffix': 'Jr.'},
+        {'first_name': 'José', 'middle_name': '', 'particle': '',
+            'last_name': 'García', 'suffix': ''}]
+
+
+def test_parse_names_command_without_input():
+    result = runner.invoke(app, ['parse-names'], input='')
+    assert result.exit_code == 0
+    assert result.output == ''
@@ -0,0 +1,21 @@
+import json
+
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+
+runner = CliRunner()
+
+
+def test_serve_command_over_stdio(dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    requests = [
+        {'jsonrpc': '2.0', 'id': 1, 'method': 'view', 'params': {
+            'cff_file_path': dummy_cff_file_path, 'pyproject_toml_file_path': dummy_pyproject_toml_file_path, 'names': ['title']}},
+        {'jsonrpc': '2.0', 'id': 2, 'method': 'about'}]
+    result = runner.invoke(
+        app, ['serve'], input=''.join(json.dumps(request) + '\n' for request in requests))
+    assert result.exit_code == 0
+    responses = [json.loads(line) for line in result.output.splitlines()]
+    assert [response['id'] for response in responses] == [1, 2]
+    assert responses[0]['result']['title']['pyproject_toml_property_path'] == 'project.name'
+    assert responses[1]['error']['code'] == -32601
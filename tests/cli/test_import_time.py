@@ -0,0 +1,181 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, NamedTuple, Tuple
+
+import pytest
+
+# import time budgets of the CLI entry points, measured with python -X importtime.
+# the budgets leave room for slower machines, and they can be scaled with
+# CFF2TOML_IMPORT_TIME_BUDGET_SCALE, like 2.0 on a slow CI runner.
+# run python -m tests.cli.test_import_time for the report of every entry point
+IMPORT_TIME_BUDGET_SCALE: float = float(
+    os.environ.get('CFF2TOML_IMPORT_TIME_BUDGET_SCALE', '1.0'))
+
+HELP_IMPORT_TIME_BUDGET_MS: float = 200
+ABOUT_IMPORT_TIME_BUDGET_MS: float = 300
+FILE_COMMAND_IMPORT_TIME_BUDGET_MS: float = 600
+
+# a budget that is exceeded is measured again, since one run can be slowed down by the machine
+MAX_MEASUREMENTS: int = 3
+
+REPORT_MODULE_COUNT: int = 15
+
+# modules that no command needs anymore
+ALWAYS_FORBIDDEN_MODULE_NAMES: List[str] = ['pydash']
+# modules that are only needed to read and write metadata files
+FILE_MODULE_NAMES: List[str] = ['tomlkit', 'pydantic']
+
+
+class EntryPoint(NamedTuple):
+    args: List[str]
+    budget_ms: float
+    forbidden_module_names: List[str]
+    # the exit code that the command must exit with, so a command that
+    # crashes early in its startup does not pass its budget
+    exit_code: int = 0
+
+
+ENTRY_POINTS: List[EntryPoint] = [
+    EntryPoint(['--help'], HELP_IMPORT_TIME_BUDGET_MS,
+               ALWAYS_FORBIDDEN_MODULE_NAMES + FILE_MODULE_NAMES + ['rich', 'yaml']),
+    EntryPoint(['view', '--help'], FILE_COMMAND_IMPORT_TIME_BUDGET_MS,
+               ALWAYS_FORBIDDEN_MODULE_NAMES),
+    EntryPoint(['about'], ABOUT_IMPORT_TIME_BUDGET_MS,
+               ALWAYS_FORBIDDEN_MODULE_NAMES + FILE_MODULE_NAMES),
+] + [
+    EntryPoint(['view', name], FILE_COMMAND_IMPORT_TIME_BUDGET_MS, ALWAYS_FORBIDDEN_MODULE_NAMES) for name in ['version', 'license', 'title', 'repo', 'description', 'all']
+] + [
+    EntryPoint(['change', name, value], FILE_COMMAND_IMPORT_TIME_BUDGET_MS, ALWAYS_FORBIDDEN_MODULE_NAMES) for name, value in [('version', '1.2.3'), ('license', 'MIT'), ('title', 'sometool'), ('repo', 'https://example.com/sometool'), ('description', 'some tool')]
+] + [
+    EntryPoint(['change', '--set', 'version=1.2.3', '--set', 'license=MIT'],
+               FILE_COMMAND_IMPORT_TIME_BUDGET_MS, ALWAYS_FORBIDDEN_MODULE_NAMES),
+    # the dummy files are not in sync
+    EntryPoint(['check'], FILE_COMMAND_IMPORT_TIME_BUDGET_MS,
+               ALWAYS_FORBIDDEN_MODULE_NAMES, exit_code=1),
+]
+
+# runs the CLI like the cff2toml script does
+START_CLI_CODE: str = "import sys; sys.argv = ['cff2toml'] + sys.argv[1:]; from cff2toml.main import start; start()"
+
+IMPORT_TIME_LINE_PATTERN = re.compile(
+    r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)\s*$')
+
+
+class ImportTimes(NamedTuple):
+    total_us: int
+    # {module name} -> (self time, cumulative time)
+    module_times_us: Dict[str, Tuple[int, int]]
+    exit_code: int = 0
+
+
+def parse_import_times(importtime_output: str) -> ImportTimes:
+    total_us: int = 0
+    module_times_us: Dict[str, Tuple[int, int]] = {}
+    for line in importtime_output.splitlines():
+        match = IMPORT_TIME_LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module_name = match.groups()
+        module_times_us[module_name] = (int(self_us), int(cumulative_us))
+        # the cumulative times of the top level imports add up to the total
+        if indent == '':
+            total_us += int(cumulative_us)
+    return ImportTimes(total_us=total_us, module_times_us=module_times_us)
+
+
+def measure_import_times(args: List[str], cwd: str) -> ImportTimes:
+    completed_process = subprocess.run([sys.executable, '-X', 'importtime', '-c', START_CLI_CODE] + args,
+                                       cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return parse_import_times(completed_process.stderr)._replace(exit_code=completed_process.returncode)
+
+
+def format_import_time_report(args: List[str], import_times: ImportTimes, module_count: int = REPORT_MODULE_COUNT) -> str:
+    # ranks the modules by their own import time, without their imports
+    ranked_module_times_us = sorted(
+        import_times.module_times_us.items(), key=lambda item: item[1][0], reverse=True)
+    lines: List[str] = [
+        f"cff2toml {' '.join(args)}: {import_times.total_us / 1000:.1f} ms in {len(import_times.module_times_us)} modules",
+        f"{'self ms':>10}{'cumulative ms':>15}  module"]
+    for module_name, (self_us, cumulative_us) in ranked_module_times_us[:module_count]:
+        lines.append(
+            f"{self_us / 1000:>10.1f}{cumulative_us / 1000:>15.1f}  {module_name}")
+    return '\n'.join(lines)
+
+
+def get_imported_forbidden_module_names(import_times: ImportTimes, forbidden_module_names: List[str]) -> List[str]:
+    return sorted({module_name for module_name in import_times.module_times_us
+                   for forbidden_module_name in forbidden_module_names
+                   if module_name == forbidden_module_name or module_name.startswith(forbidden_module_name + '.')})
+
+
+def copy_dummy_files(dummy_directory_file_path: str, working_dir: str) -> None:
+    # the commands read and change CITATION.cff and pyproject.toml in the working directory
+    shutil.copy(os.path.join(dummy_directory_file_path, 'dummy_CITATION.cff'),
+                os.path.join(working_dir, 'CITATION.cff'))
+    shutil.copy(os.path.join(dummy_directory_file_path, 'dummy_pyproject.toml'),
+                os.path.join(working_dir, 'pyproject.toml'))
+
+
+@pytest.fixture
+def dummy_working_dir(dummy_directory_file_path, tmp_path):
+    copy_dummy_files(dummy_directory_file_path=dummy_directory_file_path,
+                     working_dir=str(tmp_path))
+    return str(tmp_path)
+
+
+def test_parse_import_times():
+    import_times = parse_import_times('\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |   b',
+        'import time:        50 |        150 | a',
+        'import time:        20 |         20 | c']))
+    assert import_times.total_us == 170
+    assert import_times.module_times_us == {
+        'b': (100, 100), 'a': (50, 150), 'c': (20, 20)}
+
+
+@pytest.mark.parametrize('entry_point', ENTRY_POINTS, ids=[' '.join(entry_point.args) for entry_point in ENTRY_POINTS])
+def test_import_time(entry_point, dummy_working_dir):
+    budget_ms: float = entry_point.budget_ms * IMPORT_TIME_BUDGET_SCALE
+    best_import_times: ImportTimes = measure_import_times(
+        args=entry_point.args, cwd=dummy_working_dir)
+    for _ in range(MAX_MEASUREMENTS - 1):
+        if best_import_times.total_us / 1000 <= budget_ms:
+            break
+        import_times = measure_import_times(
+            args=entry_point.args, cwd=dummy_working_dir)
+        if import_times.total_us < best_import_times.total_us:
+            best_import_times = import_times
+
+    report: str = format_import_time_report(
+        args=entry_point.args, import_times=best_import_times)
+    print(report)
+    assert best_import_times.exit_code == entry_point.exit_code, \
+        f"cff2toml {' '.join(entry_point.args)} exited with {best_import_times.exit_code} instead of {entry_point.exit_code}\n{report}"
+    assert len(best_import_times.module_times_us) > 0, report
+    imported_forbidden_module_names = get_imported_forbidden_module_names(
+        import_times=best_import_times, forbidden_module_names=entry_point.forbidden_module_names)
+    assert imported_forbidden_module_names == [
+    ], f"cff2toml {' '.join(entry_point.args)} imported {', '.join(imported_forbidden_module_names)}\n{report}"
+    assert best_import_times.total_us / 1000 <= budget_ms, \
+        f"cff2toml {' '.join(entry_point.args)} took {best_import_times.total_us / 1000:.1f} ms to import, over its budget of {budget_ms:.0f} ms\n{report}"
+
+
+def main() -> None:
+    dummy_directory_file_path: str = os.path.join(os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))), 'dummy_files')
+    for entry_point in ENTRY_POINTS:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            copy_dummy_files(
+                dummy_directory_file_path=dummy_directory_file_path, working_dir=tmp_dir)
+            print(format_import_time_report(args=entry_point.args,
+                  import_times=measure_import_times(args=entry_point.args, cwd=tmp_dir)))
+            print()
+
+
+if __name__ == '__main__':
+    main()
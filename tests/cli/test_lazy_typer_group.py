@@ -0,0 +1,23 @@
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import LAZY_COMMANDS, app
+
+runner = CliRunner()
+
+
+def test_help_lists_every_command():
+    result = runner.invoke(app, ['--help'])
+    assert result.exit_code == 0
+    for name in LAZY_COMMANDS:
+        assert name in result.output
+
+
+def test_commands_are_loaded_when_they_are_run(dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    result = runner.invoke(app, ['view', 'version', '--cff-file-path',
+                           dummy_cff_file_path, '--pyproject-toml-path', dummy_pyproject_toml_file_path])
+    assert result.exit_code == 0
+    assert '0.0.2' in result.output
+    assert '0.0.1' in result.output
+    result = runner.invoke(app, ['about'])
+    assert result.exit_code == 0
+    assert 'cff2toml' in result.output
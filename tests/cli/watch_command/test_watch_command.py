@@ -0,0 +1,25 @@
+import json
+import os
+import shutil
+
+from typer.testing import CliRunner
+
+from cff2toml.cli.app import app
+
+runner = CliRunner()
+
+
+def test_watch_command_stops_after_the_timeout(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    shutil.copy2(dummy_cff_file_path, os.path.join(tmp_path, 'CITATION.cff'))
+    shutil.copy2(dummy_pyproject_toml_file_path,
+                 os.path.join(tmp_path, 'pyproject.toml'))
+    result = runner.invoke(
+        app, ['--json', 'watch', str(tmp_path), '--timeout', '0.1'])
+    assert result.exit_code == 0
+    assert result.output == ''
+
+
+def test_watch_command_without_pairs(tmp_path):
+    result = runner.invoke(
+        app, ['watch', str(tmp_path), '--timeout', '0.1'])
+    assert result.exit_code == 1
@@ -1,5 +1,7 @@
 import pytest
 import os
+import shutil
+import subprocess
 
 from cff2toml.models.agents.authors.cff_entity_author import CffEntityAuthor
 from cff2toml.models.agents.authors.cff_person_author import CffPersonAuthor
@@ -84,3 +86,57 @@ def dummy_pyproject_author_organization():
     author.name = 'Some Company'
     author.email = 'somecompany@somewherecool.nl'
     return author
+
+
+DUMMY_GIT_CFF_TEXT: str = """cff-version: 1.2.0
+title: sometool
+version: {version}
+license: MIT
+authors:
+  - given-names: Will
+    family-names: Riley
+    email: test1@willriley.net
+"""
+
+DUMMY_GIT_PYPROJECT_TOML_TEXT: str = """[project]
+name = "sometool"
+version = "{version}"
+license = "MIT"
+authors = [
+  {{ name = "Will Riley", email = "test1@willriley.net" }},
+]
+"""
+
+
+@pytest.fixture
+def dummy_git_repo_dir_path(tmp_path):
+    # a repository whose files are in sync, then drift apart in the version, then are in sync again,
+    # with commits that do not change them in between. returns the repository and its commits
+    if shutil.which('git') is None:
+        pytest.skip("git is not available")
+    repo_dir_path = str(tmp_path)
+
+    def git(*args: str) -> str:
+        return subprocess.run(['git', '-C', repo_dir_path, '-c', 'user.name=Some One', '-c', 'user.email=someone@somedomain.com'] + list(args),
+                              check=True, stdout=subprocess.PIPE).stdout.decode('utf-8').strip()
+
+    def commit(file_texts, message: str) -> str:
+        for file_name, text in file_texts.items():
+            with open(os.path.join(repo_dir_path, file_name), 'w') as f:
+                f.write(text)
+        git('add', '-A')
+        git('commit', '-q', '-m', message)
+        return git('rev-parse', 'HEAD')
+
+    git('init', '-q')
+    commits = [
+        commit({'README.md': 'sometool\n'}, 'add readme'),
+        commit({'CITATION.cff': DUMMY_GIT_CFF_TEXT.format(version='1.0.0'), 'pyproject.toml': DUMMY_GIT_PYPROJECT_TOML_TEXT.format(
+            version='1.0.0')}, 'add metadata'),
+        commit({'pyproject.toml': DUMMY_GIT_PYPROJECT_TOML_TEXT.format(
+            version='1.1.0')}, 'bump pyproject.toml'),
+        commit({'README.md': 'sometool 1.1.0\n'}, 'change readme'),
+        commit({'CITATION.cff': DUMMY_GIT_CFF_TEXT.format(
+            version='1.1.0')}, 'bump CITATION.cff'),
+    ]
+    return repo_dir_path, commits
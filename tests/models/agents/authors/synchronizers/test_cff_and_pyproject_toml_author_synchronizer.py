@@ -1,5 +1,7 @@
-from pytest import fixture
-from cff2toml.models.agents.authors.synchronizers.cff_and_pyproject_toml_author_synchronizer import CffAndPyprojectTomlAuthorSynchronizer
+from pydantic import ValidationError
+from pytest import fixture, raises
+from cff2toml.models.agents.authors.pyproject_toml_author import PyprojectTomlAuthor
+from cff2toml.models.agents.authors.synchronizers.cff_and_pyproject_toml_author_synchronizer import CffAndPyprojectTomlAuthorSynchronizer, get_author_fingerprint
 
 
 @fixture
@@ -63,3 +65,55 @@ def test_to_pyproject_toml_data_with_all_parts(author_synchronizer, dummy_cff_au
 
     assert pyproject_toml_author_data['name'] == 'Billy Bob de Longshot VIII'
     assert pyproject_toml_author_data['email'] == 'longshot@somewherecool.nl'
+
+
+def test_to_author_data_is_the_same_as_converting_each_author(author_synchronizer, dummy_cff_author_person, dummy_cff_author_entity, dummy_pyproject_author_person, dummy_pyproject_author_organization):
+
+    anonymous_cff_author_person = dummy_cff_author_person.model_copy()
+    anonymous_cff_author_person.given_names = ''
+    anonymous_cff_author_person.family_names = ''
+    anonymous_pyproject_author = PyprojectTomlAuthor(email='someone@somewherecool.nl')
+
+    authors = [dummy_cff_author_person, anonymous_cff_author_person, dummy_cff_author_entity,
+               dummy_pyproject_author_person, dummy_pyproject_author_organization, anonymous_pyproject_author]
+
+    author_data_for_cff, author_data_for_pyproject_toml = author_synchronizer.to_author_data(
+        authors)
+
+    assert author_data_for_cff == [
+        author_synchronizer.to_cff_author_data(author) for author in authors]
+    assert author_data_for_pyproject_toml == [
+        author_synchronizer.to_pyproject_toml_author_data(author) for author in authors]
+    assert author_data_for_cff[1] == {
+        'email': 'longshot@somewherecool.nl', 'name': 'anonymous', 'orcid': 'someorcidid'}
+    # the authors are not changed
+    assert anonymous_cff_author_person.given_names == ''
+    assert dummy_pyproject_author_person.name == 'Penelope Cheddar van Gouda X'
+
+
+def test_to_author_data_with_an_unknown_author(author_synchronizer):
+    with raises(TypeError):
+        author_synchronizer.to_author_data(['Billy Bob de Longshot'])
+
+
+def test_get_author_fingerprint():
+    assert get_author_fingerprint({'name': 'Jan', 'email': 'jan@somewherecool.nl'}) == get_author_fingerprint(
+        {'email': 'jan@somewherecool.nl', 'name': 'Jan'})
+    assert get_author_fingerprint({'name': 'Jan'}) != get_author_fingerprint(
+        {'name': 'Jan', 'email': 'jan@somewherecool.nl'})
+    assert get_author_fingerprint({'name': 'Jan', 'affiliation': ['a', 'b']}) is None
+    assert get_author_fingerprint('Jan') is None
+
+
+def test_metadata_to_author_data_is_the_same_as_converting_the_file_authors(author_synchronizer, dummy_cff_file, dummy_pyproject_toml_file):
+    for _ in range(2):
+        assert author_synchronizer.cff_metadata_to_author_data(dummy_cff_file.metadata_authors) == author_synchronizer.to_author_data(
+            dummy_cff_file.authors)
+        assert author_synchronizer.pyproject_toml_metadata_to_author_data(dummy_pyproject_toml_file.metadata_project_authors) == author_synchronizer.to_author_data(
+            dummy_pyproject_toml_file.authors)
+
+
+def test_metadata_to_author_data_with_an_invalid_author(author_synchronizer):
+    with raises(ValidationError):
+        author_synchronizer.pyproject_toml_metadata_to_author_data([
+                                                                   {'name': ['Jan', 'Berg']}])
@@ -1,5 +1,4 @@
-
-from cff2toml.models.agents.people.human_name import HumanName, HumanNameParser
+from cff2toml.models.agents.people.human_name import HumanName, HumanNameParser, Token
 
 
 def test_parse_with_different_human_names():
@@ -26,3 +25,49 @@ def test_parse_with_different_human_names():
         assert human_name.particle == expected_particle
         assert human_name.last_name == expected_last_name
         assert human_name.suffix == expected_suffix
+
+
+def test_get_name_parts_with_different_human_names():
+    assert HumanNameParser.get_name_parts(
+        'Jan van den Berg') == ('Jan', '', 'van den', 'Berg', '')
+    assert HumanNameParser.get_name_parts(
+        '  Tony Li  ') == ('Tony', '', '', 'Li', '')
+    assert HumanNameParser.get_name_parts(
+        'Tony  Li') == ('Tony', '', '', 'Li', '')
+    # longer middle names are merged like they always were
+    assert HumanNameParser.get_name_parts(
+        'Anna Maria Luisa Sofia Ruiz') == ('Anna', 'Maria LuisaSofia', '', 'Ruiz', '')
+    assert HumanNameParser.get_name_parts('') == ('', '', '', '', '')
+
+
+def test_get_tokens():
+    assert HumanNameParser.get_tokens('Adam van het Francisco IV') == [
+        Token(tag='first_name', value='Adam'),
+        Token(tag='particle', value='van het'),
+        Token(tag='last_name', value='Francisco'),
+        Token(tag='suffix', value='IV')]
+
+
+def test_parse_returns_a_new_human_name_for_a_remembered_name():
+    human_name: HumanName = HumanNameParser.parse(text='Bob Dave Smith Jr.')
+    human_name.first_name = 'Robert'
+    assert HumanNameParser.parse(text='Bob Dave Smith Jr.').first_name == 'Bob'
+
+
+def test_set_full_name():
+    human_name: HumanName = HumanName()
+    human_name.full_name = 'Sally Lou van May'
+    assert human_name.full_name == 'Sally Lou van May'
+    assert human_name.middle_name == 'Lou'
+    assert human_name.particle == 'van'
+
+
+def test_parse_many():
+    human_names = HumanNameParser.parse_many(
+        iter(['Jan van den Berg', 'Tony', 'Jan van den Berg']))
+    assert [(human_name.particle, human_name.last_name) for human_name in human_names] == [
+        ('van den', 'Berg'), ('', ''), ('van den', 'Berg')]
+    human_names = list(HumanNameParser.parse_many(
+        ['Bob Dave Smith Jr.', 'Bob Dave Smith Jr.']))
+    assert human_names[0] == human_names[1]
+    assert human_names[0] is not human_names[1]
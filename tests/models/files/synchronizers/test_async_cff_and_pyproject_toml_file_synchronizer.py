@@ -0,0 +1,75 @@
+import asyncio
+import os
+import shutil
+from typing import List
+
+from cff2toml.models.files.async_metadata_file import AsyncFileExecutor
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.synchronizers.async_cff_and_pyproject_toml_file_synchronizer import AsyncCffAndPyprojectTomlFileSynchronizer, async_sync_file_pairs
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import SyncSource, TreeSyncResult
+
+
+def _copy_file_pairs(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path, count: int):
+    file_pairs = []
+    for i in range(count):
+        package_dir_path = os.path.join(tmp_path, str(i))
+        os.makedirs(package_dir_path)
+        file_pairs.append((shutil.copy2(dummy_cff_file_path, os.path.join(package_dir_path, 'CITATION.cff')),
+                           shutil.copy2(dummy_pyproject_toml_file_path, os.path.join(package_dir_path, 'pyproject.toml'))))
+    return file_pairs
+
+
+def test_async_synchronizer_changes_and_saves_both_files(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    [(cff_file_path, pyproject_toml_file_path)] = _copy_file_pairs(
+        tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path, count=1)
+
+    async def change_version() -> List[str]:
+        file_sync = await AsyncCffAndPyprojectTomlFileSynchronizer.open(cff_file_path, pyproject_toml_file_path)
+        await file_sync.set_common_properties({'version': '9.8.7'})
+        common_property_values = await file_sync.get_common_property_values()
+        assert common_property_values['version'].is_in_sync == True
+        return await file_sync.save()
+
+    assert asyncio.run(change_version()) == [
+        cff_file_path, pyproject_toml_file_path]
+    assert CffFile(file_path=cff_file_path).get_metadata('version') == '9.8.7'
+    assert PyprojectTomlFile(file_path=pyproject_toml_file_path).get_metadata(
+        'project.version') == '9.8.7'
+
+
+def test_async_sync_file_pairs(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    file_pairs = _copy_file_pairs(
+        tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path, count=5)
+    with open(file_pairs[0][1], 'w') as f:
+        f.write('[[[')
+
+    async def sync() -> List[TreeSyncResult]:
+        with AsyncFileExecutor(max_workers=2) as executor:
+            return [result async for result in async_sync_file_pairs(iter(file_pairs), source=SyncSource.PYPROJECT_TOML, max_concurrency=3, executor=executor)]
+
+    results = asyncio.run(sync())
+    assert sorted(result.cff_file_path for result in results) == sorted(
+        cff_file_path for cff_file_path, _ in file_pairs)
+    assert [result.is_ok for result in results if result.cff_file_path ==
+            file_pairs[0][0]] == [False]
+    for cff_file_path, pyproject_toml_file_path in file_pairs[1:]:
+        assert CffFile(file_path=cff_file_path).get_metadata('version') == PyprojectTomlFile(
+            file_path=pyproject_toml_file_path).get_metadata('project.version')
+
+
+def test_async_sync_file_pairs_stops_early(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    file_pairs = _copy_file_pairs(
+        tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path, count=4)
+
+    async def sync_first() -> TreeSyncResult:
+        results = async_sync_file_pairs(file_pairs, max_concurrency=1)
+        async for result in results:
+            await results.aclose()
+            return result
+
+    result = asyncio.run(sync_first())
+    assert result.cff_file_path == file_pairs[0][0]
+    # the pairs after the first were never started
+    assert CffFile(file_path=file_pairs[-1][0]).get_metadata('version') == CffFile(
+        file_path=dummy_cff_file_path).get_metadata('version')
@@ -0,0 +1,66 @@
+import os
+import shutil
+
+import pytest
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_drift import CheckStatus, check_cff_and_pyproject_toml_file_pair, check_cff_and_pyproject_toml_file_pairs, get_check_status, is_common_property_in_sync
+
+
+@pytest.mark.parametrize("common_property_name,cff_value,pyproject_toml_value,is_in_sync", [
+    ("version", 1.0, "1.0", True),
+    ("version", "1.0.1", "1.0.0", False),
+    ("description", "Some tool that does\nsomething cool.\n",
+     "Some tool that does something cool.", True),
+    ("license", None, "MIT", False),
+    ("authors", [{'given-names': 'Will', 'family-names': 'Riley', 'email': 'test1@willriley.net', 'orcid': 'https://orcid.org/0000-0000-0000-0001'}],
+     [{'name': 'Will Riley', 'email': 'test1@willriley.net'}], True),
+    ("authors", [{'given-names': 'Will', 'family-names': 'Riley'}],
+     [{'name': 'Willy Riley'}], False),
+])
+def test_is_common_property_in_sync_compares_normalized_values(common_property_name, cff_value, pyproject_toml_value, is_in_sync):
+    assert is_common_property_in_sync(common_property_name=common_property_name,
+                                      cff_value=cff_value, pyproject_toml_value=pyproject_toml_value) == is_in_sync
+
+
+def test_check_file_pair_stops_at_the_first_drift_and_never_writes(dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    mtimes = [os.stat(file_path).st_mtime_ns for file_path in [
+        dummy_cff_file_path, dummy_pyproject_toml_file_path]]
+    result = check_cff_and_pyproject_toml_file_pair(
+        cff_file_path=dummy_cff_file_path, pyproject_toml_file_path=dummy_pyproject_toml_file_path)
+    assert result.status == CheckStatus.DRIFT
+    assert [drifted.common_property_name for drifted in result.drifted_common_property_values] == [
+        'title']
+    result = check_cff_and_pyproject_toml_file_pair(
+        cff_file_path=dummy_cff_file_path, pyproject_toml_file_path=dummy_pyproject_toml_file_path, check_all=True)
+    assert [drifted.common_property_name for drifted in result.drifted_common_property_values] == [
+        'title', 'version', 'description', 'license', 'code_repository_url', 'authors']
+    assert [os.stat(file_path).st_mtime_ns for file_path in [
+        dummy_cff_file_path, dummy_pyproject_toml_file_path]] == mtimes
+
+
+def test_check_file_pairs(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    in_sync_file_pair = (os.path.join(tmp_path, 'CITATION.cff'),
+                         os.path.join(tmp_path, 'pyproject.toml'))
+    with open(in_sync_file_pair[0], 'w') as f:
+        f.write('cff-version: 1.2.0\ntitle: sometool\nversion: 1.0\n')
+    with open(in_sync_file_pair[1], 'w') as f:
+        f.write('[project]\nname = "sometool"\nversion = "1.0"\n')
+    broken_file_pair = (os.path.join(tmp_path, 'broken.cff'),
+                        os.path.join(tmp_path, 'broken.toml'))
+    shutil.copy2(dummy_cff_file_path, broken_file_pair[0])
+    with open(broken_file_pair[1], 'w') as f:
+        f.write('[[[')
+    drifted_file_pair = (dummy_cff_file_path, dummy_pyproject_toml_file_path)
+
+    results = list(check_cff_and_pyproject_toml_file_pairs(
+        file_pairs=[in_sync_file_pair, drifted_file_pair, broken_file_pair]))
+    assert [result.status for result in results] == [
+        CheckStatus.IN_SYNC, CheckStatus.DRIFT]
+    assert get_check_status(results) == CheckStatus.DRIFT
+
+    results = list(check_cff_and_pyproject_toml_file_pairs(
+        file_pairs=[in_sync_file_pair, drifted_file_pair, broken_file_pair], check_all=True))
+    assert [result.status for result in results] == [
+        CheckStatus.IN_SYNC, CheckStatus.DRIFT, CheckStatus.ERROR]
+    assert results[2].error.startswith('LoadTomlFileException')
+    assert get_check_status(results) == CheckStatus.ERROR
+    assert get_check_status([]) == CheckStatus.IN_SYNC
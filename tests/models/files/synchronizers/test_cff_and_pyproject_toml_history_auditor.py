@@ -0,0 +1,28 @@
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_history_auditor import CffAndPyprojectTomlHistoryAuditor
+
+
+def test_audit_reports_drift_per_commit_that_changed_the_files(dummy_git_repo_dir_path):
+    repo_dir_path, commits = dummy_git_repo_dir_path
+    auditor = CffAndPyprojectTomlHistoryAuditor(repo_dir=repo_dir_path)
+    results = list(auditor.audit())
+    assert [result.commit for result in results] == [
+        commits[1], commits[2], commits[4]]
+    assert [result.is_in_sync for result in results] == [True, False, True]
+    assert [(drifted.common_property_name, drifted.cff_value, drifted.pyproject_toml_value)
+            for drifted in results[1].drifted_common_property_values] == [('version', '1.0.0', '1.1.0')]
+    # every version of each file was parsed once
+    assert len(auditor._parsed_blobs) == 4
+
+
+def test_audit_rev_range_and_missing_files(dummy_git_repo_dir_path):
+    repo_dir_path, commits = dummy_git_repo_dir_path
+    results = list(CffAndPyprojectTomlHistoryAuditor(
+        repo_dir=repo_dir_path, rev_range=f"{commits[2]}..HEAD").audit())
+    assert [result.commit for result in results] == [commits[4]]
+
+    results = list(CffAndPyprojectTomlHistoryAuditor(
+        repo_dir=repo_dir_path, cff_file_path='README.md').audit())
+    assert [result.commit for result in results] == commits[:-1]
+    assert results[0].missing_file_paths == ['pyproject.toml']
+    assert results[1].is_in_sync == False
+    assert results[1].error != ''
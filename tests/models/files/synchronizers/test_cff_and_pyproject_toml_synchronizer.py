@@ -1,9 +1,10 @@
+import pytest
 from typing import List
 from cff2toml.models.agents.authors.cff_person_author import CffPersonAuthor
 from cff2toml.models.agents.authors.pyproject_toml_author import PyprojectTomlAuthor
 from cff2toml.models.files.cff_file import CffAuthor, CffFile
 from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
-from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import CffAndPyprojectTomlFileSynchronizer
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_file_synchronizer import PROPERTY_MAPPINGS, CffAndPyprojectTomlFileSynchronizer, CffAndPyprojectTomlFileSynchronizerException
 
 
 def test_update_cff_with_pyproject_toml_only_deletes_metadata_for_mapped_properties_missing_in_pyproject_toml(dummy_cff_and_pyproject_toml_file_synchronizer):
@@ -250,3 +251,139 @@ def test_set_authors_with_only_cff_person_authors(dummy_cff_and_pyproject_toml_f
     assert pyproject_toml_authors[1].name == 'Willy Riley'
     assert pyproject_toml_authors[0].email == 'test1@willriley.net'
     assert pyproject_toml_authors[1].email == 'test2@willriley.net'
+
+
+def test_save_returns_only_written_file_paths(dummy_cff_and_pyproject_toml_file_synchronizer):
+    synchronizer: CffAndPyprojectTomlFileSynchronizer = dummy_cff_and_pyproject_toml_file_synchronizer
+    cff_file = synchronizer.cff_file
+    pyproject_toml_file = synchronizer.pyproject_toml_file
+
+    assert synchronizer.save() == []
+
+    # the CFF file already has this version
+    synchronizer.set_version('0.0.2')
+    assert synchronizer.save() == [pyproject_toml_file.file_path]
+
+    synchronizer.set_version('0.0.3')
+    assert synchronizer.save() == [
+        cff_file.file_path, pyproject_toml_file.file_path]
+    assert synchronizer.save() == []
+
+
+def test_update_cff_with_pyproject_toml_rolls_back_when_it_fails(dummy_cff_and_pyproject_toml_file_synchronizer, monkeypatch):
+    cff_file = dummy_cff_and_pyproject_toml_file_synchronizer.cff_file
+    pyproject_toml_file = dummy_cff_and_pyproject_toml_file_synchronizer.pyproject_toml_file
+    pyproject_toml_file.delete_metadata('project.license')
+
+    def fail_to_set_author_data(author_data_for_cff, author_data_for_pyproject_toml):
+        raise ValueError('cannot set authors')
+    monkeypatch.setattr(dummy_cff_and_pyproject_toml_file_synchronizer,
+                        '_set_author_data', fail_to_set_author_data)
+
+    with pytest.raises(ValueError):
+        dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml(
+            delete_missing_metadata=True)
+
+    # the version and the license were changed before the authors failed
+    assert cff_file.metadata_version == '0.0.2'
+    assert cff_file.has_metadata('license') == True
+    assert cff_file.metadata.is_dirty == False
+    assert pyproject_toml_file.has_metadata('project.license') == False
+
+
+def test_get_common_property_values(dummy_cff_and_pyproject_toml_file_synchronizer):
+    common_property_values = dummy_cff_and_pyproject_toml_file_synchronizer.get_common_property_values()
+    assert list(common_property_values.keys()) == list(PROPERTY_MAPPINGS.keys())
+    version_values = common_property_values['version']
+    assert version_values.cff_property_path == 'version'
+    assert version_values.cff_value == '0.0.2'
+    assert version_values.pyproject_toml_property_path == 'project.version'
+    assert version_values.pyproject_toml_value == '0.0.1'
+    assert version_values.is_in_sync == False
+    assert len(common_property_values['authors'].cff_value) == 2
+    assert common_property_values['authors'].is_in_sync == False
+
+    # the authors have different fields in each file, and are compared like drift checks do
+    dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml()
+    common_property_values = dummy_cff_and_pyproject_toml_file_synchronizer.get_common_property_values()
+    assert [values.is_in_sync for values in common_property_values.values()] == [
+        True] * len(PROPERTY_MAPPINGS)
+
+
+def test_set_common_properties(dummy_cff_and_pyproject_toml_file_synchronizer):
+    cff_file = dummy_cff_and_pyproject_toml_file_synchronizer.cff_file
+    pyproject_toml_file = dummy_cff_and_pyproject_toml_file_synchronizer.pyproject_toml_file
+    dummy_cff_and_pyproject_toml_file_synchronizer.set_common_properties(
+        values={'version': '1.2.3', 'license': 'MIT'})
+    assert cff_file.metadata_version == '1.2.3'
+    assert pyproject_toml_file.metadata_project_version == '1.2.3'
+    assert cff_file.metadata_license == 'MIT'
+    assert pyproject_toml_file.metadata_project_license == 'MIT'
+
+
+def test_set_common_properties_sets_none_when_one_is_missing(dummy_cff_and_pyproject_toml_file_synchronizer):
+    cff_file = dummy_cff_and_pyproject_toml_file_synchronizer.cff_file
+    with pytest.raises(CffAndPyprojectTomlFileSynchronizerException):
+        dummy_cff_and_pyproject_toml_file_synchronizer.set_common_properties(
+            values={'version': '1.2.3', 'missing': 'value'})
+    assert cff_file.metadata_version == '0.0.2'
+
+
+def test_update_cff_with_pyproject_toml_leaves_authors_in_sync_unchanged(dummy_cff_and_pyproject_toml_file_synchronizer):
+    cff_file = dummy_cff_and_pyproject_toml_file_synchronizer.cff_file
+    pyproject_toml_file = dummy_cff_and_pyproject_toml_file_synchronizer.pyproject_toml_file
+
+    dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml()
+    dummy_cff_and_pyproject_toml_file_synchronizer.save()
+    assert cff_file.metadata.is_dirty == False
+    assert pyproject_toml_file.metadata.is_dirty == False
+
+    dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml()
+    assert cff_file.metadata.is_dirty == False
+    assert pyproject_toml_file.metadata.is_dirty == False
+    assert dummy_cff_and_pyproject_toml_file_synchronizer.save() == []
+
+
+def test_update_cff_with_pyproject_toml_only_replaces_changed_authors(dummy_cff_and_pyproject_toml_file_synchronizer):
+    cff_file = dummy_cff_and_pyproject_toml_file_synchronizer.cff_file
+    pyproject_toml_file = dummy_cff_and_pyproject_toml_file_synchronizer.pyproject_toml_file
+
+    dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml()
+    cff_authors_before = cff_file.metadata_authors
+    assert len(cff_authors_before) == 2
+
+    pyproject_toml_file.set_metadata(
+        'project.authors[1].email', 'changed@willriley.net')
+    dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml()
+
+    cff_authors_after = cff_file.metadata_authors
+    assert cff_authors_after[0] is cff_authors_before[0]
+    assert cff_authors_after[1]['email'] == 'changed@willriley.net'
+
+    pyproject_toml_file.set_metadata('project.authors', pyproject_toml_file.metadata_project_authors + [
+                                     {'name': 'Jan van den Berg'}])
+    dummy_cff_and_pyproject_toml_file_synchronizer.update_cff_with_pyproject_toml()
+
+    cff_authors_after = cff_file.metadata_authors
+    assert len(cff_authors_after) == 3
+    assert cff_authors_after[0] is cff_authors_before[0]
+    assert cff_authors_after[2] == {
+        'family-names': 'Berg', 'given-names': 'Jan', 'name-particle': 'van den'}
+
+
+def test_set_common_properties_only_parses_the_used_cff_sections(dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    cff_file = CffFile(file_path=dummy_cff_file_path, selected_keys=[])
+    synchronizer = CffAndPyprojectTomlFileSynchronizer(
+        cff_file=cff_file, pyproject_toml_file=PyprojectTomlFile(file_path=dummy_pyproject_toml_file_path))
+
+    # the license section is parsed after the snapshot, and kept by the rollback
+    with pytest.raises(CffAndPyprojectTomlFileSynchronizerException):
+        synchronizer.set_common_properties(
+            values={'license': 'MIT', 'missing': 'value'})
+    assert list(cff_file._metadata.to_dict().keys()) == ['license']
+    assert cff_file.metadata_license == 'Apache-2.0'
+    assert cff_file._metadata.is_dirty == False
+
+    synchronizer.set_common_properties(values={'version': '1.2.3'})
+    assert list(cff_file._metadata.to_dict().keys()) == ['license', 'version']
+    assert cff_file.metadata_version == '1.2.3'
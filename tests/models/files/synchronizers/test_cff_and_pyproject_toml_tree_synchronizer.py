@@ -0,0 +1,71 @@
+import os
+import shutil
+from typing import List
+
+import pytest
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import CffAndPyprojectTomlTreeSynchronizer, SyncSource, TreeSyncResult, find_cff_and_pyproject_toml_file_pairs
+
+
+@pytest.fixture
+def dummy_tree_dir_path(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    for package_dir in ['a', os.path.join('b', 'c'), os.path.join('.git', 'd'), os.path.join('node_modules', 'e'), 'broken']:
+        package_dir_path = os.path.join(tmp_path, package_dir)
+        os.makedirs(package_dir_path)
+        shutil.copy2(dummy_cff_file_path, os.path.join(
+            package_dir_path, 'CITATION.cff'))
+        shutil.copy2(dummy_pyproject_toml_file_path, os.path.join(
+            package_dir_path, 'pyproject.toml'))
+    # a directory with only one of the two files is not a pair
+    os.makedirs(os.path.join(tmp_path, 'f'))
+    shutil.copy2(dummy_cff_file_path, os.path.join(
+        tmp_path, 'f', 'CITATION.cff'))
+    with open(os.path.join(tmp_path, 'broken', 'pyproject.toml'), 'w') as f:
+        f.write('[[[')
+    return str(tmp_path)
+
+
+def test_find_file_pairs_skips_pruned_directories(dummy_tree_dir_path):
+    pairs = find_cff_and_pyproject_toml_file_pairs(
+        root_dir=dummy_tree_dir_path)
+    pair_dirs: List[str] = [os.path.relpath(os.path.dirname(
+        cff_file_path), dummy_tree_dir_path) for cff_file_path, _ in pairs]
+    assert pair_dirs == ['a', os.path.join('b', 'c'), 'broken']
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sync_updates_cff_with_pyproject_toml_and_reports_errors_per_pair(dummy_tree_dir_path, max_workers):
+    tree_sync = CffAndPyprojectTomlTreeSynchronizer(
+        root_dir=dummy_tree_dir_path, max_workers=max_workers)
+    results: List[TreeSyncResult] = list(tree_sync.sync())
+
+    assert len(results) == 3
+    failed_results = [result for result in results if not result.is_ok]
+    assert len(failed_results) == 1
+    assert failed_results[0].pyproject_toml_file_path == os.path.join(
+        dummy_tree_dir_path, 'broken', 'pyproject.toml')
+    assert 'LoadTomlFileException' in failed_results[0].error
+
+    for package_dir in ['a', os.path.join('b', 'c')]:
+        cff_file = CffFile(file_path=os.path.join(
+            dummy_tree_dir_path, package_dir, 'CITATION.cff'))
+        assert cff_file.metadata_version == '0.0.1'
+        assert cff_file.metadata_title == 'someuncooltool'
+
+    # pruned directories are left alone
+    cff_file = CffFile(file_path=os.path.join(
+        dummy_tree_dir_path, '.git', 'd', 'CITATION.cff'))
+    assert cff_file.metadata_version == '0.0.2'
+
+
+def test_sync_updates_pyproject_toml_with_cff(dummy_tree_dir_path):
+    tree_sync = CffAndPyprojectTomlTreeSynchronizer(
+        root_dir=dummy_tree_dir_path, source=SyncSource.CFF, max_workers=1)
+    results: List[TreeSyncResult] = list(tree_sync.sync())
+
+    assert len([result for result in results if result.is_ok]) == 2
+    pyproject_toml_file = PyprojectTomlFile(file_path=os.path.join(
+        dummy_tree_dir_path, 'a', 'pyproject.toml'))
+    assert pyproject_toml_file.metadata_project_version == '0.0.2'
+    assert pyproject_toml_file.metadata_project_name == 'somecooltool'
@@ -0,0 +1,92 @@
+import os
+import shutil
+
+import pytest
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.file_watcher import PollingFileWatcher
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_tree_synchronizer import SyncSource
+from cff2toml.models.files.synchronizers.cff_and_pyproject_toml_watch_synchronizer import CffAndPyprojectTomlWatchSynchronizer
+
+
+@pytest.fixture
+def dummy_file_pair(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    cff_file_path = os.path.join(tmp_path, 'CITATION.cff')
+    pyproject_toml_file_path = os.path.join(tmp_path, 'pyproject.toml')
+    shutil.copy2(dummy_cff_file_path, cff_file_path)
+    shutil.copy2(dummy_pyproject_toml_file_path, pyproject_toml_file_path)
+    return (cff_file_path, pyproject_toml_file_path)
+
+
+def test_sync_changed_files_copies_the_changed_file_and_ignores_its_own_writes(dummy_file_pair):
+    cff_file_path, pyproject_toml_file_path = dummy_file_pair
+    watch_sync = CffAndPyprojectTomlWatchSynchronizer(
+        file_pairs=[dummy_file_pair])
+    assert watch_sync.load() == []
+
+    # nothing changed since the files were loaded
+    assert list(watch_sync.sync_changed_files(
+        changed_file_paths={cff_file_path})) == []
+
+    cff_file = CffFile(file_path=cff_file_path)
+    cff_file.set_metadata('version', '9.8.7')
+    cff_file.save()
+    results = list(watch_sync.sync_changed_files(
+        changed_file_paths={cff_file_path}))
+    assert len(results) == 1
+    assert results[0].is_ok == True
+    assert results[0].source == SyncSource.CFF
+    assert results[0].written_file_paths == [pyproject_toml_file_path]
+    assert PyprojectTomlFile(file_path=pyproject_toml_file_path).get_metadata(
+        'project.version') == '9.8.7'
+
+    # the events of the write of the sync are not synced back
+    assert list(watch_sync.sync_changed_files(
+        changed_file_paths={cff_file_path, pyproject_toml_file_path})) == []
+
+    pyproject_toml_file = PyprojectTomlFile(file_path=pyproject_toml_file_path)
+    pyproject_toml_file.set_metadata('project.version', '1.2.3')
+    pyproject_toml_file.save()
+    results = list(watch_sync.sync_changed_files(
+        changed_file_paths={pyproject_toml_file_path}))
+    assert [result.source for result in results] == [SyncSource.PYPROJECT_TOML]
+    assert CffFile(file_path=cff_file_path).get_metadata('version') == '1.2.3'
+
+
+def test_sync_changed_files_reports_errors_and_recovers(dummy_file_pair):
+    cff_file_path, pyproject_toml_file_path = dummy_file_pair
+    watch_sync = CffAndPyprojectTomlWatchSynchronizer(
+        file_pairs=[dummy_file_pair])
+    watch_sync.load()
+
+    with open(pyproject_toml_file_path, 'a') as f:
+        f.write('[[[')
+    results = list(watch_sync.sync_changed_files(
+        changed_file_paths={pyproject_toml_file_path}))
+    assert len(results) == 1
+    assert results[0].is_ok == False
+
+    with open(pyproject_toml_file_path, 'w') as f:
+        f.write('[project]\nname = "sometool"\nversion = "4.5.6"\n')
+    results = list(watch_sync.sync_changed_files(
+        changed_file_paths={pyproject_toml_file_path}))
+    assert len(results) == 1
+    assert results[0].is_ok == True
+    assert CffFile(file_path=cff_file_path).get_metadata('version') == '4.5.6'
+
+
+def test_watch_syncs_until_the_timeout(dummy_file_pair):
+    cff_file_path, pyproject_toml_file_path = dummy_file_pair
+    watch_sync = CffAndPyprojectTomlWatchSynchronizer(
+        file_pairs=[dummy_file_pair], debounce_s=0.01)
+    watch_sync.load()
+    cff_file = CffFile(file_path=cff_file_path)
+    cff_file.set_metadata('version', '9.8.7')
+    with PollingFileWatcher(file_paths=watch_sync.file_paths, poll_interval_s=0.01) as file_watcher:
+        cff_file.save()
+        results = list(watch_sync.watch(
+            file_watcher=file_watcher, timeout_s=0.2))
+    assert [result.written_file_paths for result in results] == [
+        [pyproject_toml_file_path]]
+    assert PyprojectTomlFile(file_path=pyproject_toml_file_path).get_metadata(
+        'project.version') == '9.8.7'
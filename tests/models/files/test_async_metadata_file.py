@@ -0,0 +1,47 @@
+import asyncio
+import os
+import shutil
+import threading
+
+from cff2toml.models.files.async_metadata_file import AsyncCffFile, AsyncFileExecutor, AsyncPyprojectTomlFile
+from cff2toml.models.files.atomic_write import Durability, WriteBatch
+from cff2toml.models.files.cff_file import CffFile
+
+
+def test_async_cff_file_opens_changes_and_saves(tmp_path, dummy_cff_file_path):
+    cff_file_path = os.path.join(tmp_path, 'CITATION.cff')
+    shutil.copy2(dummy_cff_file_path, cff_file_path)
+
+    async def change_version() -> bool:
+        async_cff_file = await AsyncCffFile.open(cff_file_path)
+        assert async_cff_file.file.is_loaded == True
+        assert await async_cff_file.has_metadata('version') == True
+        await async_cff_file.set_metadata('version', '9.8.7')
+        assert await async_cff_file.get_metadata('version') == '9.8.7'
+        return await async_cff_file.save()
+
+    assert asyncio.run(change_version()) == True
+    assert CffFile(file_path=cff_file_path).get_metadata('version') == '9.8.7'
+
+
+def test_async_files_run_in_the_executor_and_in_the_caller_context(tmp_path, dummy_pyproject_toml_file_path):
+    pyproject_toml_file_path = os.path.join(tmp_path, 'pyproject.toml')
+    shutil.copy2(dummy_pyproject_toml_file_path, pyproject_toml_file_path)
+
+    async def change_version(executor: AsyncFileExecutor) -> WriteBatch:
+        async_pyproject_toml_file = await AsyncPyprojectTomlFile.open(pyproject_toml_file_path, executor=executor)
+        assert async_pyproject_toml_file.executor is executor
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        assert thread_name.startswith('cff2toml')
+        await async_pyproject_toml_file.set_metadata('project.version', '9.8.7')
+        write_batch = WriteBatch()
+        with write_batch:
+            # the save joins the batch, which is flushed when it ends
+            await async_pyproject_toml_file.save(durability=Durability.BATCH)
+            assert write_batch.file_paths == {
+                os.path.realpath(pyproject_toml_file_path)}
+        return write_batch
+
+    with AsyncFileExecutor(max_workers=2) as executor:
+        write_batch = asyncio.run(change_version(executor=executor))
+    assert write_batch.file_paths == set()
@@ -0,0 +1,85 @@
+import os
+import stat
+
+import pytest
+from cff2toml.models.files import atomic_write
+from cff2toml.models.files.atomic_write import Durability, WriteBatch, atomic_write_text
+
+
+@pytest.fixture
+def existing_file_path(tmp_path):
+    file_path = os.path.join(tmp_path, 'existing.txt')
+    with open(file_path, 'w') as f:
+        f.write('old content')
+    os.chmod(file_path, 0o640)
+    return file_path
+
+
+@pytest.mark.parametrize("durability", [Durability.NONE, Durability.FILE, Durability.BATCH])
+def test_atomic_write_text_replaces_content_and_keeps_mode(existing_file_path, durability):
+    atomic_write_text(file_path=existing_file_path,
+                      text='new content', durability=durability)
+    with open(existing_file_path, 'r') as f:
+        assert f.read() == 'new content'
+    assert stat.S_IMODE(os.stat(existing_file_path).st_mode) == 0o640
+    # no temporary files are left behind
+    assert os.listdir(os.path.dirname(existing_file_path)) == ['existing.txt']
+
+
+def test_atomic_write_text_keeps_old_content_when_write_fails(existing_file_path):
+    with pytest.raises(TypeError):
+        atomic_write_text(file_path=existing_file_path,
+                          text=None)  # type: ignore
+    with open(existing_file_path, 'r') as f:
+        assert f.read() == 'old content'
+    assert os.listdir(os.path.dirname(existing_file_path)) == ['existing.txt']
+
+
+def test_write_batch_collects_files_written_with_batch_durability(existing_file_path):
+    with WriteBatch() as write_batch:
+        atomic_write_text(file_path=existing_file_path,
+                          text='new content', durability=Durability.BATCH)
+        assert write_batch.file_paths == {os.path.realpath(existing_file_path)}
+    # the files are flushed and forgotten when the batch ends
+    assert write_batch.file_paths == set()
+
+
+def test_atomic_write_text_gives_a_new_file_the_mode_of_the_umask(tmp_path, monkeypatch):
+    # the umask is cached on the first write of a new file
+    monkeypatch.setattr(atomic_write, '_umask', None)
+    umask = os.umask(0o027)
+    try:
+        file_path = os.path.join(tmp_path, 'new.txt')
+        atomic_write_text(file_path=file_path, text='new content')
+        # the umask is read once, and is not changed by reading it
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(file_path).st_mode) & 0o007 == 0
+
+
+def test_write_batch_flushes_only_its_own_files(existing_file_path, monkeypatch):
+    def fail_to_sync():
+        raise AssertionError('os.sync flushes every filesystem')
+    monkeypatch.setattr(os, 'sync', fail_to_sync, raising=False)
+    fsynced_fds = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, 'fsync', lambda fd: (
+        fsynced_fds.append(fd), fsync(fd)))
+
+    with WriteBatch():
+        atomic_write_text(file_path=existing_file_path,
+                          text='new content', durability=Durability.BATCH)
+        assert fsynced_fds == []
+    # the file, and then its directory
+    assert len(fsynced_fds) == 2
+
+
+def test_write_batch_flushes_the_directory_of_a_symlinked_file(existing_file_path, tmp_path):
+    link_dir_path = os.path.join(tmp_path, 'links')
+    os.makedirs(link_dir_path)
+    link_file_path = os.path.join(link_dir_path, 'link.txt')
+    os.symlink(existing_file_path, link_file_path)
+    write_batch = WriteBatch()
+    write_batch.add(link_file_path)
+    assert write_batch.file_paths == {os.path.realpath(existing_file_path)}
@@ -1,7 +1,8 @@
+import os
 from typing import OrderedDict
 
 import pytest
-from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.cff_file import CffFile, LoadCffFileException
 from tests.temp_copied_file import TempCopiedFile
 from unittest.mock import patch
 
@@ -166,3 +167,140 @@ def test_get_title_for_cff_with_default_file_path(dummy_cff_file_path):
         with patch('cff2toml.models.files.cff_file.CffFile.__init__.__defaults__', (tmp_dummy_cff_file.file_path,)):
             cff_file: CffFile = CffFile()
             assert cff_file.metadata_title == 'somecooltool'
+
+
+def test_cff_file_is_parsed_on_first_metadata_access(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        cff_file: CffFile = CffFile(file_path=tmp_dummy_cff_file.file_path)
+        assert cff_file.is_loaded == False
+        assert cff_file.file_stat is not None
+        assert cff_file.has_metadata('version') == True
+        assert cff_file.is_loaded == True
+
+
+def test_cff_file_with_missing_file_raises_exception_on_construction(dummy_directory_file_path):
+    with pytest.raises(LoadCffFileException):
+        CffFile(file_path=os.path.join(
+            dummy_directory_file_path, 'missing_CITATION.cff'))
+
+
+def test_cff_file_with_invalid_yaml_raises_exception_on_first_metadata_access(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        with open(tmp_dummy_cff_file.file_path, 'w') as f:
+            f.write('title: [')
+        cff_file: CffFile = CffFile(file_path=tmp_dummy_cff_file.file_path)
+        with pytest.raises(LoadCffFileException):
+            cff_file.get_metadata('title')
+
+
+def test_save_cff_file_skips_unchanged_metadata(dummy_cff_file):
+    cff_file: CffFile = dummy_cff_file
+    file_stat_before_save = os.stat(cff_file.file_path)
+
+    assert cff_file.save() == False
+    cff_file.set_metadata('version', '0.0.2')
+    assert cff_file.save() == False
+    assert os.stat(cff_file.file_path).st_mtime_ns == file_stat_before_save.st_mtime_ns
+
+    cff_file.set_metadata('version', '0.0.3')
+    assert cff_file.save() == True
+    assert cff_file.metadata.is_dirty == False
+    assert cff_file.save() == False
+
+
+def test_cff_file_with_selected_keys_only_parses_their_sections(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        cff_file: CffFile = CffFile(
+            file_path=tmp_dummy_cff_file.file_path, selected_keys=['version'])
+        assert cff_file.get_metadata('version') == '0.0.2'
+        assert cff_file.selected_keys == frozenset(['version'])
+        # only the sections that were used are parsed
+        assert list(cff_file._metadata.to_dict().keys()) == ['version']
+        assert cff_file.get_metadata('title') == 'somecooltool'
+        assert list(cff_file._metadata.to_dict().keys()) == [
+            'version', 'title']
+        assert cff_file.metadata.to_dict() == CffFile(
+            file_path=tmp_dummy_cff_file.file_path).metadata.to_dict()
+        assert cff_file.metadata.is_dirty == False
+
+
+def test_save_cff_file_with_selected_keys_keeps_the_other_sections(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        with open(tmp_dummy_cff_file.file_path, 'a') as f:
+            f.write('# cited works\nreferences:\n  - title:   "A reference"  # keep me\n')
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            text_before_save = f.read()
+
+        cff_file: CffFile = CffFile(
+            file_path=tmp_dummy_cff_file.file_path, selected_keys=['version'])
+        cff_file.set_metadata('version', '0.0.3')
+        assert cff_file.save() == True
+
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            # only the changed scalar is written again, in the same quotes
+            assert f.read() == text_before_save.replace(
+                'version: "0.0.2"\n', 'version: "0.0.3"\n')
+        assert CffFile(file_path=tmp_dummy_cff_file.file_path).get_metadata(
+            'references') == [{'title': 'A reference'}]
+
+
+def test_save_cff_file_only_changes_the_changed_scalars(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            text_before_save = f.read()
+
+        cff_file: CffFile = CffFile(file_path=tmp_dummy_cff_file.file_path)
+        assert cff_file.metadata.to_dict()['version'] == '0.0.2'
+        cff_file.set_metadata('version', '0.0.3')
+        cff_file.set_metadata('license', 'MIT')
+        assert cff_file.save() == True
+
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            assert f.read() == text_before_save.replace(
+                'version: "0.0.2"\n', 'version: "0.0.3"\n').replace('license: Apache-2.0\n', 'license: MIT\n')
+
+
+def test_save_cff_file_dumps_the_metadata_when_the_file_changed_after_it_was_opened(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        cff_file: CffFile = CffFile(file_path=tmp_dummy_cff_file.file_path)
+        cff_file.set_metadata('version', '0.0.3')
+        with open(tmp_dummy_cff_file.file_path, 'a') as f:
+            f.write('# changed by someone else\n')
+        assert cff_file.save() == True
+
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            assert 'changed by someone else' not in f.read()
+        assert CffFile(file_path=tmp_dummy_cff_file.file_path).get_metadata(
+            'version') == '0.0.3'
+
+
+def test_save_cff_file_with_force_or_to_another_path_before_any_metadata_access(dummy_cff_file_path, tmp_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            text_before_save = f.read()
+
+        assert CffFile(file_path=tmp_dummy_cff_file.file_path).save(
+            force=True) == True
+        with open(tmp_dummy_cff_file.file_path, 'r') as f:
+            assert f.read() == text_before_save
+
+        other_file_path = str(tmp_path / 'OTHER.cff')
+        assert CffFile(file_path=tmp_dummy_cff_file.file_path).save(
+            file_path=other_file_path) == True
+        assert CffFile(file_path=other_file_path).metadata.to_dict() == CffFile(
+            file_path=tmp_dummy_cff_file.file_path).metadata.to_dict()
+
+
+@pytest.mark.parametrize("selected_keys", [None, ['version']])
+def test_save_cff_file_with_an_equal_value_of_another_type(tmp_path, selected_keys):
+    cff_file_path = str(tmp_path / 'CITATION.cff')
+    with open(cff_file_path, 'w') as f:
+        f.write('cff-version: 1.2.0\ntitle: sometool\nversion: 1\n')
+
+    cff_file: CffFile = CffFile(
+        file_path=cff_file_path, selected_keys=selected_keys)
+    cff_file.set_metadata('version', 1.0)
+    assert cff_file.save() == True
+    version = CffFile(file_path=cff_file_path).get_metadata('version')
+    assert version == 1.0
+    assert isinstance(version, float)
@@ -0,0 +1,69 @@
+import os
+import threading
+
+import pytest
+from cff2toml.models.files.file_watcher import FileWatcher, FileWatcherException, InotifyFileWatcher, PollingFileWatcher, get_file_signature, open_file_watcher
+
+
+def _write_file(file_path: str, text: str) -> None:
+    # written like cff2toml and most editors save files, by renaming a new file over the old one
+    with open(file_path + '.tmp', 'w') as f:
+        f.write(text)
+    os.replace(file_path + '.tmp', file_path)
+
+
+def test_get_file_signature_changes_when_the_file_is_replaced(tmp_path):
+    file_path = os.path.join(tmp_path, 'CITATION.cff')
+    assert get_file_signature(file_path) is None
+    _write_file(file_path, 'title: a\n')
+    file_signature = get_file_signature(file_path)
+    assert file_signature is not None
+    _write_file(file_path, 'title: a\n')
+    assert get_file_signature(file_path) != file_signature
+
+
+def test_file_watcher_without_wait_cannot_be_created(tmp_path):
+    with pytest.raises(TypeError):
+        FileWatcher(file_paths=[os.path.join(tmp_path, 'CITATION.cff')])
+
+
+def test_polling_file_watcher(tmp_path):
+    file_path = os.path.join(tmp_path, 'CITATION.cff')
+    other_file_path = os.path.join(tmp_path, 'other.cff')
+    _write_file(file_path, 'title: a\n')
+    with PollingFileWatcher(file_paths=[file_path], poll_interval_s=0.01) as file_watcher:
+        assert file_watcher.wait(timeout_s=0.05) == set()
+        _write_file(other_file_path, 'title: a\n')
+        assert file_watcher.wait(timeout_s=0.05) == set()
+        _write_file(file_path, 'title: b\n')
+        assert file_watcher.wait(timeout_s=1) == {file_path}
+        os.remove(file_path)
+        assert file_watcher.wait(timeout_s=1) == {file_path}
+
+
+def test_inotify_file_watcher(tmp_path):
+    file_path = os.path.join(tmp_path, 'CITATION.cff')
+    other_file_path = os.path.join(tmp_path, 'other.cff')
+    _write_file(file_path, 'title: a\n')
+    try:
+        file_watcher = InotifyFileWatcher(file_paths=[file_path])
+    except FileWatcherException:
+        pytest.skip("inotify is not available")
+    with file_watcher:
+        assert file_watcher.wait(timeout_s=0.05) == set()
+        _write_file(other_file_path, 'title: a\n')
+        assert file_watcher.wait(timeout_s=0.05) == set()
+        # the watcher wakes up as soon as the file is written
+        timer = threading.Timer(0.05, _write_file, args=[file_path, 'title: b\n'])
+        timer.start()
+        assert file_watcher.wait(timeout_s=5) == {file_path}
+        timer.join()
+
+
+def test_open_file_watcher_falls_back_to_polling(tmp_path):
+    file_path = os.path.join(tmp_path, 'CITATION.cff')
+    with open_file_watcher(file_paths=[file_path], use_polling=True) as file_watcher:
+        assert isinstance(file_watcher, PollingFileWatcher)
+    # a directory that does not exist cannot be watched with inotify
+    with open_file_watcher(file_paths=[os.path.join(tmp_path, 'missing', 'CITATION.cff')]) as file_watcher:
+        assert isinstance(file_watcher, PollingFileWatcher)
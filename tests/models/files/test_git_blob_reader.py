@@ -0,0 +1,25 @@
+import pytest
+from cff2toml.models.files.git_blob_reader import GitBlobReader, GitException, list_git_commits
+
+
+def test_list_git_commits(dummy_git_repo_dir_path):
+    repo_dir_path, commits = dummy_git_repo_dir_path
+    assert list_git_commits(repo_dir=repo_dir_path) == commits
+    assert list_git_commits(repo_dir=repo_dir_path, rev_range=f"{commits[1]}..HEAD", file_paths=[
+                            'CITATION.cff', 'pyproject.toml']) == [commits[2], commits[4]]
+    with pytest.raises(GitException):
+        list_git_commits(repo_dir=repo_dir_path, rev_range='nope')
+
+
+def test_git_blob_reader(dummy_git_repo_dir_path):
+    repo_dir_path, commits = dummy_git_repo_dir_path
+    with GitBlobReader(repo_dir=repo_dir_path) as git_blob_reader:
+        for _ in range(2):
+            git_object = git_blob_reader.read_object(f"{commits[0]}:README.md")
+            assert git_object.object_type == 'blob'
+            assert git_object.content == b'sometool\n'
+        assert git_blob_reader.read_object(f"{commits[0]}:CITATION.cff") is None
+        assert git_blob_reader.read_object(
+            f"{commits[3]}:README.md").content == b'sometool 1.1.0\n'
+    with pytest.raises(GitException):
+        git_blob_reader.read_object(f"{commits[0]}:README.md")
@@ -0,0 +1,45 @@
+import os
+import shutil
+
+from cff2toml.models.files.loaded_file_cache import LoadedFileCache
+
+
+def test_loaded_file_cache_reuses_files_until_they_change(tmp_path, dummy_cff_file_path):
+    cff_file_path = os.path.join(tmp_path, 'CITATION.cff')
+    shutil.copy2(dummy_cff_file_path, cff_file_path)
+    loaded_file_cache = LoadedFileCache()
+    cff_file = loaded_file_cache.get_cff_file(file_path=cff_file_path)
+    assert loaded_file_cache.get_cff_file(file_path=cff_file_path) is cff_file
+
+    # a file that is saved here is kept with the metadata it wrote
+    cff_file.set_metadata('version', '9.8.7')
+    cff_file.save()
+    loaded_file_cache.mark_saved(file_path=cff_file_path)
+    assert loaded_file_cache.get_cff_file(file_path=cff_file_path) is cff_file
+
+    # a file that was changed by someone else is opened again
+    with open(cff_file_path, 'a') as f:
+        f.write('date-released: 2024-01-01\n')
+    changed_cff_file = loaded_file_cache.get_cff_file(file_path=cff_file_path)
+    assert changed_cff_file is not cff_file
+    assert changed_cff_file.get_metadata('version') == '9.8.7'
+
+    loaded_file_cache.discard(file_path=cff_file_path)
+    assert loaded_file_cache.get_cff_file(
+        file_path=cff_file_path) is not changed_cff_file
+
+
+def test_loaded_file_cache_keeps_the_most_recently_used_files(tmp_path, dummy_pyproject_toml_file_path):
+    file_paths = [os.path.join(tmp_path, f'{i}.toml') for i in range(3)]
+    for file_path in file_paths:
+        shutil.copy2(dummy_pyproject_toml_file_path, file_path)
+    loaded_file_cache = LoadedFileCache(max_files=2)
+    first_file = loaded_file_cache.get_pyproject_toml_file(
+        file_path=file_paths[0])
+    loaded_file_cache.get_pyproject_toml_file(file_path=file_paths[1])
+    assert loaded_file_cache.get_pyproject_toml_file(
+        file_path=file_paths[0]) is first_file
+    loaded_file_cache.get_pyproject_toml_file(file_path=file_paths[2])
+    assert len(loaded_file_cache) == 2
+    assert loaded_file_cache.get_pyproject_toml_file(
+        file_path=file_paths[0]) is first_file
@@ -54,3 +54,19 @@ def test_delete_metadata_for_missing_data(dummy_metadata_file):
     assert dummy_metadata_file.has_metadata('some.missing.property') == False
     dummy_metadata_file.delete_metadata('some.missing.property')
     assert dummy_metadata_file.has_metadata('some.missing.property') == False
+
+
+def test_set_metadata_with_same_value_does_not_make_metadata_dirty(dummy_metadata_file):
+    assert dummy_metadata_file.metadata.is_dirty == False
+    dummy_metadata_file.set_metadata('some.nestedproperty', 'somedata')
+    assert dummy_metadata_file.metadata.is_dirty == False
+    dummy_metadata_file.set_metadata(
+        'some.nestedproperty', 'somedifferentdata')
+    assert dummy_metadata_file.metadata.is_dirty == True
+
+
+def test_delete_metadata_for_missing_data_does_not_make_metadata_dirty(dummy_metadata_file):
+    dummy_metadata_file.delete_metadata('some.missing.property')
+    assert dummy_metadata_file.metadata.is_dirty == False
+    dummy_metadata_file.delete_metadata('some.nestedproperty')
+    assert dummy_metadata_file.metadata.is_dirty == True
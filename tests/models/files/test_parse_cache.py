@@ -0,0 +1,124 @@
+import os
+from typing import Any, List
+
+import pytest
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.parse_cache import ParseCache
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from tests.temp_copied_file import TempCopiedFile
+
+# 2020-01-01, old enough for the stat index to be written
+OLD_MTIME_NS: int = 1577836800 * 1_000_000_000
+
+
+class CountingParser:
+
+    def __init__(self):
+        self.parsed_texts: List[str] = []
+
+    def __call__(self, text: str) -> Any:
+        self.parsed_texts.append(text)
+        return {'text': text}
+
+
+@pytest.fixture
+def parse_cache(tmp_path):
+    return ParseCache(cache_dir=os.path.join(tmp_path, 'cache'))
+
+
+@pytest.fixture
+def old_file_path(tmp_path):
+    file_path = os.path.join(tmp_path, 'some_file.txt')
+    with open(file_path, 'w') as f:
+        f.write('some content')
+    os.utime(file_path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return file_path
+
+
+def test_load_parses_once_and_then_hits_the_stat_index(parse_cache, old_file_path):
+    parse = CountingParser()
+    assert parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse) == {
+        'text': 'some content'}
+    assert parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse) == {
+        'text': 'some content'}
+    assert len(parse.parsed_texts) == 1
+    assert parse_cache.misses == 1
+    assert parse_cache.hits == 1
+
+
+def test_load_falls_back_to_the_content_hash_when_the_stat_changes(parse_cache, old_file_path):
+    parse = CountingParser()
+    parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse)
+    os.utime(old_file_path, ns=(OLD_MTIME_NS + 1, OLD_MTIME_NS + 1))
+    parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse)
+    assert len(parse.parsed_texts) == 1
+    assert parse_cache.hits == 1
+
+
+def test_load_parses_again_when_the_content_changes(parse_cache, old_file_path):
+    parse = CountingParser()
+    parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse)
+    with open(old_file_path, 'w') as f:
+        f.write('other content')
+    assert parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse) == {
+        'text': 'other content'}
+    assert len(parse.parsed_texts) == 2
+
+
+def test_load_keeps_parsers_apart(parse_cache, old_file_path):
+    parse = CountingParser()
+    parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse)
+    parse_cache.load(file_path=old_file_path,
+                     parser_name='other', parse=parse)
+    assert len(parse.parsed_texts) == 2
+
+
+def test_load_replaces_corrupt_entries(parse_cache, old_file_path):
+    parse = CountingParser()
+    parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse)
+    data_dir = os.path.join(parse_cache.cache_dir, 'v1', 'data')
+    for entry_name in os.listdir(data_dir):
+        with open(os.path.join(data_dir, entry_name), 'wb') as f:
+            f.write(b'not a pickle')
+    assert parse_cache.load(file_path=old_file_path, parser_name='test', parse=parse) == {
+        'text': 'some content'}
+    assert len(parse.parsed_texts) == 2
+
+
+def test_evict_removes_entries_over_the_size_cap(parse_cache, tmp_path):
+    parse = CountingParser()
+    for i in range(5):
+        file_path = os.path.join(tmp_path, f"file_{i}.txt")
+        with open(file_path, 'w') as f:
+            f.write(f"content {i}" * 100)
+        parse_cache.load(file_path=file_path, parser_name='test', parse=parse)
+    size_bytes = parse_cache.stats().size_bytes
+    assert parse_cache.stats().entries == 5
+
+    parse_cache.max_size_bytes = size_bytes // 2
+    assert parse_cache.evict() > 0
+    assert parse_cache.stats().size_bytes <= parse_cache.max_size_bytes
+
+    remaining_entries = parse_cache.stats().entries
+    assert parse_cache.clear() == remaining_entries
+    assert parse_cache.stats().entries == 0
+
+
+def test_cached_files_have_the_same_metadata(parse_cache, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        expected_metadata = CffFile(
+            file_path=tmp_dummy_cff_file.file_path).metadata.to_dict()
+        for _ in range(2):
+            cff_file = CffFile(
+                file_path=tmp_dummy_cff_file.file_path, parse_cache=parse_cache)
+            assert cff_file.metadata.to_dict() == expected_metadata
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        expected_metadata = PyprojectTomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path).metadata.to_dict()
+        for _ in range(2):
+            pyproject_toml_file = PyprojectTomlFile(
+                file_path=tmp_dummy_pyproject_toml_file.file_path, parse_cache=parse_cache)
+            assert pyproject_toml_file.metadata.to_dict() == expected_metadata
+            assert pyproject_toml_file.metadata_project_version == '0.0.1'
+    assert parse_cache.hits == 2
+    assert parse_cache.misses == 2
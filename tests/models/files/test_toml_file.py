@@ -1,7 +1,8 @@
+import os
 from typing import OrderedDict
 
 import pytest
-from cff2toml.models.files.toml_file import TomlFile
+from cff2toml.models.files.toml_file import LoadTomlFileException, TomlFile
 from tests.temp_copied_file import TempCopiedFile
 
 
@@ -138,3 +139,170 @@ def test_save_toml_file_preserves_metadata_order_after_set_existing_metadata(dum
 
         assert list(after_ordered_metadata['project'].keys(
         )) == expected_second_level_pyproject_toml_file_metadata_ordered_keys['project']
+
+
+def test_toml_file_is_parsed_on_first_metadata_access(dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        assert toml_file.is_loaded == False
+        assert toml_file.file_stat is not None
+        assert toml_file.get_metadata('project.version') == '0.0.1'
+        assert toml_file.is_loaded == True
+
+
+def test_toml_file_with_missing_file_raises_exception_on_construction(dummy_directory_file_path):
+    with pytest.raises(LoadTomlFileException):
+        TomlFile(file_path=os.path.join(
+            dummy_directory_file_path, 'missing_pyproject.toml'))
+
+
+def test_toml_file_with_invalid_toml_raises_exception_on_first_metadata_access(dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'w') as f:
+            f.write('[[[')
+        toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        with pytest.raises(LoadTomlFileException):
+            toml_file.has_metadata('project')
+
+
+def test_save_toml_file_only_changes_the_changed_values(dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'r') as f:
+            text_before_save = f.read()
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'w') as f:
+            f.write('# keep this comment\n' + text_before_save)
+
+        toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        toml_file.set_metadata('project.version', '0.0.2')
+        toml_file.set_metadata('project.authors[1].name', 'Willy Bob Riley')
+        toml_file.delete_metadata('project.readme')
+        assert toml_file.save() == True
+
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'r') as f:
+            assert f.read() == '# keep this comment\n' + text_before_save.replace('version = "0.0.1"', 'version = "0.0.2"').replace(
+                '"Willy Riley"', '"Willy Bob Riley"').replace('readme = "README.md"\n', '')
+
+
+def test_save_toml_file_keeps_the_loaded_metadata_unchanged(dummy_pyproject_toml_file_path, tmp_path):
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        metadata_snapshot = toml_file.metadata.snapshot()
+        toml_file.set_metadata('project.version', '0.0.2')
+        assert toml_file.save(file_path=str(
+            tmp_path / 'other_pyproject.toml')) == True
+        assert metadata_snapshot.get('project.version') == '0.0.1'
+
+        # the document has the changes that were saved to the other file, and then the rollback
+        toml_file.metadata.restore(metadata_snapshot)
+        toml_file.set_metadata('project.license', 'MIT')
+        assert toml_file.save() == True
+        after_save_toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        assert after_save_toml_file.get_metadata('project.version') == '0.0.1'
+        assert after_save_toml_file.get_metadata('project.license') == 'MIT'
+
+
+def test_save_toml_file_with_dotted_keys(dummy_pyproject_toml_file_path):
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'w') as f:
+            f.write('[project]\nname = "x"\nurls.Source = "https://x"\nversion = "1"\n')
+        toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        toml_file.delete_metadata('project.urls.Source')
+        toml_file.set_metadata('project.license', 'MIT')
+        assert toml_file.save() == True
+
+        after_save_toml_file: TomlFile = TomlFile(
+            file_path=tmp_dummy_pyproject_toml_file.file_path)
+        assert after_save_toml_file.metadata.to_dict() == {
+            'project': {'name': 'x', 'urls': {}, 'version': '1', 'license': 'MIT'}}
+
+
+def test_save_toml_file_with_force_or_to_another_path_before_any_metadata_access(dummy_pyproject_toml_file_path, tmp_path):
+    with TempCopiedFile(source_file_path=dummy_pyproject_toml_file_path) as tmp_dummy_pyproject_toml_file:
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'r') as f:
+            text_before_save = f.read()
+
+        assert TomlFile(file_path=tmp_dummy_pyproject_toml_file.file_path).save(
+            force=True) == True
+        with open(tmp_dummy_pyproject_toml_file.file_path, 'r') as f:
+            assert f.read() == text_before_save
+
+        other_file_path = str(tmp_path / 'other_pyproject.toml')
+        assert TomlFile(file_path=tmp_dummy_pyproject_toml_file.file_path).save(
+            file_path=other_file_path) == True
+        with open(other_file_path, 'r') as f:
+            assert f.read() == text_before_save
+
+
+def test_save_toml_file_keeps_the_style_of_an_inline_array_whose_length_changes(tmp_path):
+    toml_file_path = str(tmp_path / 'pyproject.toml')
+    text_before_save = '[project]\nname = "x"\nauthors = [\n    {name = "A", email = "a@x"},  # first\n    {name = "B"},  # second\n]\n\n[tool.x]\na = 1\n'
+    with open(toml_file_path, 'w') as f:
+        f.write(text_before_save)
+
+    toml_file: TomlFile = TomlFile(file_path=toml_file_path)
+    toml_file.set_metadata('project.authors', toml_file.get_metadata(
+        'project.authors') + [{'name': 'C'}])
+    assert toml_file.save() == True
+    with open(toml_file_path, 'r') as f:
+        assert f.read() == text_before_save.replace(
+            '  # second\n', '  # second\n    {name = "C"},\n')
+
+    toml_file.set_metadata('project.authors',
+                           toml_file.get_metadata('project.authors')[:1])
+    assert toml_file.save() == True
+    with open(toml_file_path, 'r') as f:
+        assert f.read() == text_before_save.replace(
+            '    {name = "B"},  # second\n', '')
+    assert TomlFile(file_path=toml_file_path).get_metadata(
+        'project.authors') == [{'name': 'A', 'email': 'a@x'}]
+
+
+def test_save_toml_file_with_a_changed_dotted_key_keeps_the_comments_and_layout(tmp_path):
+    toml_file_path = str(tmp_path / 'pyproject.toml')
+    with open(toml_file_path, 'w') as f:
+        f.write('# header comment\n[project]\nname = "x"  # name comment\nauthors = [\n    {name = "A"},  # first\n]\nurls.Source = "a"\nversion = "1"\n\n[tool.x]\na = 1\n')
+
+    toml_file: TomlFile = TomlFile(file_path=toml_file_path)
+    toml_file.set_metadata('project.urls.Source', 'b')
+    assert toml_file.save() == True
+    # only the dotted key is moved into a table
+    expected_text = '# header comment\n[project]\nname = "x"  # name comment\nauthors = [\n    {name = "A"},  # first\n]\nversion = "1"\n\n[project.urls]\nSource = "b"\n\n[tool.x]\na = 1\n'
+    with open(toml_file_path, 'r') as f:
+        assert f.read() == expected_text
+
+    # the document is kept for the next saves
+    toml_file.set_metadata('project.version', '2')
+    toml_file.set_metadata('project.urls.Home', 'h')
+    assert toml_file.save() == True
+    with open(toml_file_path, 'r') as f:
+        assert f.read() == expected_text.replace('version = "1"', 'version = "2"').replace(
+            'Source = "b"\n', 'Source = "b"\nHome = "h"\n')
+
+
+def test_save_toml_file_replaces_a_changed_inline_table_of_an_array_whole(tmp_path):
+    toml_file_path = str(tmp_path / 'pyproject.toml')
+    text_before_save = '[project]\nauthors = [\n    {name = "Q"},\n    {name = "A", email = "a@x"},  # second\n]\n'
+    with open(toml_file_path, 'w') as f:
+        f.write(text_before_save)
+
+    toml_file: TomlFile = TomlFile(file_path=toml_file_path)
+    toml_file.set_metadata('project.authors[1]', {'name': 'Z'})
+    assert toml_file.save() == True
+    with open(toml_file_path, 'r') as f:
+        assert f.read() == text_before_save.replace(
+            '{name = "A", email = "a@x"}', '{name = "Z"}')
+    with open(toml_file_path, 'w') as f:
+        f.write(text_before_save.replace('{', '{ ').replace('}', ' }'))
+
+    toml_file = TomlFile(file_path=toml_file_path)
+    toml_file.set_metadata('project.authors[1]', {'name': 'Z'})
+    assert toml_file.save() == True
+    with open(toml_file_path, 'r') as f:
+        assert f.read() == text_before_save.replace(
+            '{name = "A", email = "a@x"}', '{name = "Z"}').replace('{', '{ ').replace('}', ' }')
@@ -0,0 +1,68 @@
+from typing import Dict
+
+import pytest
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.yaml_backend import YamlBackendException, YamlBackendName, get_yaml_backend, has_libyaml
+from tests.temp_copied_file import TempCopiedFile
+
+requires_libyaml = pytest.mark.skipif(
+    not has_libyaml(), reason="PyYAML was built without libyaml")
+
+
+@pytest.fixture
+def dummy_cff_file_with_many_references(dummy_cff_file_path):
+    with TempCopiedFile(source_file_path=dummy_cff_file_path) as tmp_dummy_cff_file:
+        cff_file: CffFile = CffFile(
+            file_path=tmp_dummy_cff_file.file_path, yaml_backend=YamlBackendName.PYTHON)
+        cff_file.set_metadata('references', [
+            {'type': 'article',
+             'title': f"Über die Analyse von Daten: a study of “things” number {i} " * 3,
+             'authors': [{'given-names': 'José', 'family-names': 'Núñez'}, {'name': 'Some Company'}],
+             'year': 2000 + i % 25,
+             'notes': 'first line\nsecond line\twith a tab\n'} for i in range(200)])
+        cff_file.save()
+        yield cff_file
+
+
+def _save_with_each_backend(cff_file: CffFile) -> Dict[YamlBackendName, bytes]:
+    saved_bytes: Dict[YamlBackendName, bytes] = {}
+    for yaml_backend in [YamlBackendName.PYTHON, YamlBackendName.LIBYAML]:
+        with TempCopiedFile(source_file_path=cff_file.file_path) as tmp_cff_file:
+            backend_cff_file: CffFile = CffFile(
+                file_path=tmp_cff_file.file_path, yaml_backend=yaml_backend)
+            backend_cff_file.set_metadata('version', '1.0.0')
+            backend_cff_file.save()
+            with open(tmp_cff_file.file_path, 'rb') as f:
+                saved_bytes[yaml_backend] = f.read()
+    return saved_bytes
+
+
+def test_auto_yaml_backend_prefers_libyaml():
+    expected_name = YamlBackendName.LIBYAML if has_libyaml() else YamlBackendName.PYTHON
+    assert get_yaml_backend(YamlBackendName.AUTO).name == expected_name
+
+
+def test_unknown_yaml_backend_raises_exception():
+    with pytest.raises(YamlBackendException):
+        get_yaml_backend('notabackend')
+
+
+@requires_libyaml
+def test_yaml_backends_load_the_same_metadata(dummy_cff_file_with_many_references):
+    python_cff_file = CffFile(
+        file_path=dummy_cff_file_with_many_references.file_path, yaml_backend=YamlBackendName.PYTHON)
+    libyaml_cff_file = CffFile(
+        file_path=dummy_cff_file_with_many_references.file_path, yaml_backend=YamlBackendName.LIBYAML)
+    assert python_cff_file.metadata.to_dict() == libyaml_cff_file.metadata.to_dict()
+
+
+@requires_libyaml
+def test_yaml_backends_save_byte_identical_files(dummy_cff_file):
+    saved_bytes = _save_with_each_backend(dummy_cff_file)
+    assert saved_bytes[YamlBackendName.PYTHON] == saved_bytes[YamlBackendName.LIBYAML]
+
+
+@requires_libyaml
+def test_yaml_backends_save_byte_identical_files_with_many_references(dummy_cff_file_with_many_references):
+    saved_bytes = _save_with_each_backend(dummy_cff_file_with_many_references)
+    assert saved_bytes[YamlBackendName.PYTHON] == saved_bytes[YamlBackendName.LIBYAML]
@@ -0,0 +1,120 @@
+import pytest
+import yaml
+from cff2toml.models.files.yaml_backend import YamlBackendName, get_yaml_backend, has_libyaml
+from cff2toml.models.files.yaml_sections import dump_yaml_sections, load_yaml_section_values, load_yaml_sections
+
+YAML_BACKEND_NAMES = [YamlBackendName.PYTHON] + \
+    ([YamlBackendName.LIBYAML] if has_libyaml() else [])
+
+CFF_TEXT = """# this file is a test
+cff-version: 1.2.0
+title: somecooltool
+abstract: |
+  A module that does
+  something cool.
+
+# cited works
+references:
+  - title:   'A reference'   # keep this comment
+    year: 2000
+version: 0.0.2
+"""
+
+
+@pytest.fixture(params=YAML_BACKEND_NAMES)
+def yaml_backend(request):
+    return get_yaml_backend(name=request.param)
+
+
+def test_load_yaml_sections_only_parses_the_keys(yaml_backend):
+    yaml_sections = load_yaml_sections(
+        text=CFF_TEXT, keys=['title', 'version', 'license'], yaml_backend=yaml_backend)
+    assert yaml_sections.values == {
+        'title': 'somecooltool', 'version': '0.0.2'}
+    assert yaml_sections.prefix == '# this file is a test\n'
+    assert [key for key, _ in yaml_sections.sections] == [
+        'cff-version', 'title', 'abstract', 'references', 'version']
+    # the comments above a key are in its section
+    assert yaml_sections.sections[3][1].startswith('# cited works\nreferences:')
+    assert ''.join([yaml_sections.prefix] + [section_text for _,
+                   section_text in yaml_sections.sections] + [yaml_sections.suffix]) == CFF_TEXT
+
+
+def test_load_yaml_section_values_has_the_values_of_a_full_load(yaml_backend):
+    yaml_sections = load_yaml_sections(
+        text=CFF_TEXT, keys=['title'], yaml_backend=yaml_backend)
+    yaml_sections = load_yaml_section_values(yaml_sections=yaml_sections, keys=[
+                                             'cff-version', 'abstract', 'references', 'version'], yaml_backend=yaml_backend)
+    assert yaml_sections.values == yaml.safe_load(CFF_TEXT)
+
+
+@pytest.mark.parametrize('text', [
+    'title: &title t\nversion: *title\n',
+    '{title: t, version: 1}\n',
+    "'title': t\n",
+    '1: t\n',
+    'title: a\ntitle: b\n',
+    '- title\n',
+    'title\n',
+    '',
+    '%TAG ! tag:example.com,2000:\n---\ntitle: t\n',
+    'title: t\n---\nversion: 1\n',
+])
+def test_load_yaml_sections_returns_none_for_documents_that_cannot_be_split(yaml_backend, text):
+    assert load_yaml_sections(
+        text=text, keys=['title'], yaml_backend=yaml_backend) is None
+
+
+def test_load_yaml_sections_with_a_byte_order_mark_and_no_final_line_break(yaml_backend):
+    text = '﻿title: Zoë\nversion: 1'
+    yaml_sections = load_yaml_sections(
+        text=text, keys=['version'], yaml_backend=yaml_backend)
+    assert yaml_sections.prefix == '﻿'
+    assert yaml_sections.values == {'version': 1}
+    dumped_text, _ = dump_yaml_sections(yaml_sections=yaml_sections, data={
+        'version': 1, 'license': 'MIT'}, yaml_backend=yaml_backend)
+    assert dumped_text == '﻿title: Zoë\nversion: 1\nlicense: MIT\n'
+
+
+def test_dump_yaml_sections_writes_back_unchanged_sections(yaml_backend):
+    yaml_sections = load_yaml_sections(
+        text=CFF_TEXT, keys=['title', 'abstract', 'version'], yaml_backend=yaml_backend)
+    dumped_text, dumped_yaml_sections = dump_yaml_sections(yaml_sections=yaml_sections, data={
+        'title': 'somecooltool', 'version': '0.0.3', 'license': 'MIT'}, yaml_backend=yaml_backend)
+    assert dumped_text == """# this file is a test
+cff-version: 1.2.0
+title: somecooltool
+# cited works
+references:
+  - title:   'A reference'   # keep this comment
+    year: 2000
+version: 0.0.3
+license: MIT
+"""
+    assert dumped_yaml_sections.values == {
+        'title': 'somecooltool', 'version': '0.0.3', 'license': 'MIT'}
+    assert dump_yaml_sections(yaml_sections=dumped_yaml_sections, data=dumped_yaml_sections.values,
+                              yaml_backend=yaml_backend)[0] == dumped_text
+
+
+def test_dump_yaml_sections_patches_changed_scalars_in_place(yaml_backend):
+    text = 'title: "somecooltool"  # the name\nabstract: >-\n  A module that does\n  something cool.\n\n# the version\nversion: 0.0.2\n'
+    yaml_sections = load_yaml_sections(
+        text=text, keys=['title', 'abstract', 'version'], yaml_backend=yaml_backend)
+    dumped_text, _ = dump_yaml_sections(yaml_sections=yaml_sections, data={
+        'title': "someone's tool", 'abstract': 'Something cool.', 'version': '1.0'}, yaml_backend=yaml_backend)
+    # the quotes, block styles and comments stay, but a string that looks like a number is quoted
+    assert dumped_text == 'title: "someone\'s tool"  # the name\nabstract: >-\n  Something cool.\n\n# the version\nversion: \'1.0\'\n'
+
+
+@pytest.mark.parametrize('value', ['multi\nline\n', '', None, 3, True, 'null', '- item', 'a: b', ' ', 'Zoë'])
+def test_dump_yaml_sections_patches_scalars_to_the_same_values(yaml_backend, value):
+    for section_text in ['title: plain\n', "title: 'single'\n", 'title: |\n  literal\n\n', 'title:\n  next line\n', 'title: ~\n']:
+        text = 'cff-version: 1.2.0\n' + section_text + 'version: 1\n'
+        yaml_sections = load_yaml_sections(
+            text=text, keys=['title'], yaml_backend=yaml_backend)
+        dumped_text, _ = dump_yaml_sections(yaml_sections=yaml_sections, data={
+            'title': value}, yaml_backend=yaml_backend)
+        assert yaml.safe_load(dumped_text) == {
+            'cff-version': '1.2.0', 'title': value, 'version': 1}
+        assert dumped_text.endswith('\nversion: 1\n')
@@ -0,0 +1,65 @@
+from pytest import fixture
+from cff2toml.models.metadata import Metadata
+
+
+@fixture
+def dummy_metadata():
+    metadata = Metadata()
+    metadata.from_dict({'some': {'nestedproperty': 'somedata', 'list': [1, 2]}, 'other': {
+                       'property': 'otherdata'}})
+    return metadata
+
+
+def test_set_copies_only_the_changed_path(dummy_metadata):
+    some = dummy_metadata.get('some')
+    other = dummy_metadata.get('other')
+    dummy_metadata.set('some.nestedproperty', 'somedifferentdata')
+    assert some['nestedproperty'] == 'somedata'
+    assert dummy_metadata.get('some') is not some
+    assert dummy_metadata.get('some.list') is some['list']
+    assert dummy_metadata.get('other') is other
+
+
+def test_snapshot_does_not_see_later_changes(dummy_metadata):
+    metadata_snapshot = dummy_metadata.snapshot()
+    dummy_metadata.set('some.list[2]', 3)
+    dummy_metadata.delete('other.property')
+    assert dummy_metadata.get('some.list') == [1, 2, 3]
+    assert dummy_metadata.has('other.property') == False
+    assert metadata_snapshot.get('some.list') == [1, 2]
+    assert metadata_snapshot.get('other.property') == 'otherdata'
+
+
+def test_restore_puts_back_the_snapshot(dummy_metadata):
+    metadata_snapshot = dummy_metadata.snapshot()
+    dummy_metadata.set('some.nestedproperty', 'somedifferentdata')
+    dummy_metadata.delete('other')
+    assert dummy_metadata.is_dirty == True
+    dummy_metadata.restore(metadata_snapshot)
+    assert dummy_metadata.get('some.nestedproperty') == 'somedata'
+    assert dummy_metadata.get('other.property') == 'otherdata'
+    assert dummy_metadata.is_dirty == False
+
+
+def test_restore_the_version_marked_clean_makes_metadata_clean(dummy_metadata):
+    dummy_metadata.set('some.nestedproperty', 'somedifferentdata')
+    metadata_snapshot = dummy_metadata.snapshot()
+    dummy_metadata.mark_clean()
+    dummy_metadata.delete('other')
+    dummy_metadata.restore(metadata_snapshot)
+    assert dummy_metadata.is_dirty == False
+    dummy_metadata.set('some.nestedproperty', 'somedata')
+    dummy_metadata.restore(metadata_snapshot)
+    assert dummy_metadata.is_dirty == False
+
+
+def test_set_an_equal_value_of_another_type_makes_metadata_dirty(dummy_metadata):
+    dummy_metadata.set('some.list[0]', 1)
+    assert dummy_metadata.is_dirty == False
+    dummy_metadata.set('some.list[0]', True)
+    assert dummy_metadata.is_dirty == True
+    assert dummy_metadata.get('some.list[0]') is True
+    dummy_metadata.mark_clean()
+    dummy_metadata.set('some.list[1]', 2.0)
+    assert dummy_metadata.is_dirty == True
+    assert isinstance(dummy_metadata.get('some.list[1]'), float)
@@ -0,0 +1,94 @@
+import copy
+
+import pytest
+from cff2toml.models.property_path import PropertyPathException, compile_property_path, get_property, has_property, is_same_value, with_property, without_property
+
+pydash = pytest.importorskip('pydash')
+
+PROPERTY_PATHS = [
+    'title',
+    'project.version',
+    'project.urls.Source',
+    'project.urls.Missing',
+    'project.authors[0].name',
+    'project.authors.1.email',
+    'project.authors[-1].name',
+    'project.authors[5].name',
+    'project.keywords.0',
+    'project.keywords[2]',
+    'project.name.first',
+    'project.none.key',
+    'tool.dotted\\.key',
+    'tool.0',
+    'missing.deeply.nested',
+]
+
+
+def make_metadata():
+    return {
+        'title': 'my-package',
+        'project': {
+            'version': '0.0.1',
+            'urls': {'Source': 'https://example.com/source'},
+            'authors': [{'name': 'Jane Doe', 'email': 'jane@example.com'}, {'name': 'John Doe', 'email': 'john@example.com'}],
+            'keywords': ['a', 'b', 'c'],
+            'name': 'my-package',
+            'none': None,
+        },
+        'tool': {'dotted.key': 1, '0': 'zero'},
+    }
+
+
+def test_compile_property_path():
+    assert compile_property_path('project.urls.Source') == (
+        'project', 'urls', 'Source')
+    assert compile_property_path('authors[0].name') == ('authors', 0, 'name')
+    assert compile_property_path('authors.0.name') == ('authors', '0', 'name')
+    assert compile_property_path('a\\.b.c') == ('a.b', 'c')
+    assert compile_property_path('a["b.c"]') == ('a', 'b.c')
+    assert compile_property_path('project.urls.Source') is compile_property_path(
+        'project.urls.Source')
+    with pytest.raises(PropertyPathException):
+        compile_property_path('authors[0')
+
+
+@pytest.mark.parametrize('property_path', PROPERTY_PATHS)
+def test_get_and_has_match_pydash(property_path):
+    metadata = make_metadata()
+    assert get_property(metadata, property_path, 'default') == pydash.get(
+        metadata, property_path, 'default')
+    assert has_property(metadata, property_path) == pydash.has(
+        metadata, property_path)
+
+
+@pytest.mark.parametrize('property_path', [p for p in PROPERTY_PATHS if p != 'project.name.first'] + ['new[1].key', 'new.1.key'])
+def test_with_property_matches_pydash_set_without_changing_the_object(property_path):
+    metadata = make_metadata()
+    expected_metadata = pydash.set_(copy.deepcopy(
+        metadata), property_path, 'value')
+    assert with_property(metadata, property_path, 'value') == expected_metadata
+    assert metadata == make_metadata()
+
+
+def test_with_property_through_a_string_fails():
+    with pytest.raises(PropertyPathException):
+        with_property(make_metadata(), 'project.name.first', 'value')
+
+
+@pytest.mark.parametrize('property_path', PROPERTY_PATHS)
+def test_without_property_matches_pydash_unset_without_changing_the_object(property_path):
+    metadata = make_metadata()
+    expected_metadata = copy.deepcopy(metadata)
+    expected_is_deleted = pydash.unset(expected_metadata, property_path)
+    new_metadata = without_property(metadata, property_path)
+    assert metadata == make_metadata()
+    assert (new_metadata is not metadata) == expected_is_deleted
+    assert new_metadata == expected_metadata
+
+
+def test_is_same_value_compares_types():
+    assert is_same_value({'a': [1, {'b': 'c'}]}, {'a': [1, {'b': 'c'}]}) == True
+    assert is_same_value(1, 1.0) == False
+    assert is_same_value(True, 1) == False
+    assert is_same_value({'a': [1]}, {'a': [1.0]}) == False
+    assert is_same_value([1, 2], [1]) == False
@@ -0,0 +1,94 @@
+import json
+import os
+import socket
+import threading
+
+import pytest
+from pydantic import BaseModel
+from cff2toml.server.json_rpc_server import INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR, SERVER_ERROR, JsonRpcServer, JsonRpcServerException
+
+
+class AddParams(BaseModel):
+    a: int
+    b: int = 0
+
+
+@pytest.fixture
+def json_rpc_server():
+    json_rpc_server = JsonRpcServer()
+
+    def add(params: AddParams) -> int:
+        if params.a < 0:
+            raise ValueError("a is negative")
+        return params.a + params.b
+    json_rpc_server.add_method('add', function=add, params_model=AddParams)
+    return json_rpc_server
+
+
+def _call(json_rpc_server: JsonRpcServer, message) -> object:
+    response_line = json_rpc_server.handle_line(json.dumps(message))
+    return None if response_line is None else json.loads(response_line)
+
+
+def test_handle_line(json_rpc_server):
+    assert _call(json_rpc_server, {'jsonrpc': '2.0', 'id': 1, 'method': 'add', 'params': {'a': 1, 'b': 2}}) == {
+        'jsonrpc': '2.0', 'result': 3, 'id': 1}
+    # a notification has no response
+    assert _call(json_rpc_server, {
+                 'jsonrpc': '2.0', 'method': 'add', 'params': {'a': 1}}) is None
+    assert json_rpc_server.handle_line('\n') is None
+
+
+@pytest.mark.parametrize("message,code", [
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'subtract'}, METHOD_NOT_FOUND),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'add', 'params': {'b': 1}}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'add', 'params': [1, 2]}, INVALID_PARAMS),
+    ({'jsonrpc': '2.0', 'id': 1, 'method': 'add', 'params': {'a': -1}}, SERVER_ERROR),
+    ({'id': 1, 'method': 'add'}, INVALID_REQUEST),
+    (1, INVALID_REQUEST),
+    ([], INVALID_REQUEST),
+])
+def test_handle_line_errors(json_rpc_server, message, code):
+    response = _call(json_rpc_server, message)
+    assert response['error']['code'] == code
+
+
+def test_handle_line_parse_error_and_batch(json_rpc_server):
+    assert json.loads(json_rpc_server.handle_line('{'))[
+        'error']['code'] == PARSE_ERROR
+    assert _call(json_rpc_server, [
+        {'jsonrpc': '2.0', 'id': 1, 'method': 'add', 'params': {'a': 1}},
+        {'jsonrpc': '2.0', 'method': 'add', 'params': {'a': 2}},
+        {'jsonrpc': '2.0', 'id': 3, 'method': 'add', 'params': {'a': 3, 'b': 3}}]) == [
+        {'jsonrpc': '2.0', 'result': 1, 'id': 1},
+        {'jsonrpc': '2.0', 'result': 6, 'id': 3}]
+
+
+def test_unix_socket_server(json_rpc_server, tmp_path):
+    if not hasattr(socket, 'AF_UNIX'):
+        pytest.skip("Unix sockets are not available")
+    socket_path = os.path.join(tmp_path, 'cff2toml.sock')
+    unix_socket_server = json_rpc_server.open_unix_socket_server(
+        socket_path=socket_path)
+    thread = threading.Thread(target=unix_socket_server.serve_forever)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(socket_path)
+            client_file = client_socket.makefile('rw')
+            for i in range(3):
+                client_file.write(json.dumps(
+                    {'jsonrpc': '2.0', 'id': i, 'method': 'add', 'params': {'a': i, 'b': 1}}) + '\n')
+                client_file.flush()
+                assert json.loads(client_file.readline()) == {
+                    'jsonrpc': '2.0', 'result': i + 1, 'id': i}
+        # a second server cannot take over the socket of a running server
+        with pytest.raises(JsonRpcServerException):
+            json_rpc_server.open_unix_socket_server(socket_path=socket_path)
+    finally:
+        unix_socket_server.shutdown()
+        unix_socket_server.server_close()
+        thread.join()
+    # but it takes over the socket file that a stopped server left
+    json_rpc_server.open_unix_socket_server(
+        socket_path=socket_path).server_close()
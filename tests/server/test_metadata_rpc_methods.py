@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+
+import pytest
+from cff2toml.models.files.cff_file import CffFile
+from cff2toml.models.files.pyproject_toml_file import PyprojectTomlFile
+from cff2toml.server.json_rpc_server import INVALID_PARAMS, SERVER_ERROR
+from cff2toml.server.metadata_rpc_methods import create_metadata_json_rpc_server
+
+
+@pytest.fixture
+def dummy_file_pair_params(tmp_path, dummy_cff_file_path, dummy_pyproject_toml_file_path):
+    cff_file_path = os.path.join(tmp_path, 'CITATION.cff')
+    pyproject_toml_file_path = os.path.join(tmp_path, 'pyproject.toml')
+    shutil.copy2(dummy_cff_file_path, cff_file_path)
+    shutil.copy2(dummy_pyproject_toml_file_path, pyproject_toml_file_path)
+    return {'cff_file_path': cff_file_path, 'pyproject_toml_file_path': pyproject_toml_file_path}
+
+
+def _call(json_rpc_server, method, params):
+    return json.loads(json_rpc_server.handle_line(json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params})))
+
+
+def test_view_change_and_sync(dummy_file_pair_params):
+    json_rpc_server = create_metadata_json_rpc_server()
+    response = _call(json_rpc_server, 'view', {
+                     **dummy_file_pair_params, 'names': ['version']})
+    assert list(response['result']) == ['version']
+    assert response['result']['version']['cff_value'] == CffFile(
+        file_path=dummy_file_pair_params['cff_file_path']).get_metadata('version')
+
+    response = _call(json_rpc_server, 'change', {
+                     **dummy_file_pair_params, 'values': {'version': '9.8.7'}})
+    assert response['result'] == {'written_file_paths': [
+        dummy_file_pair_params['cff_file_path'], dummy_file_pair_params['pyproject_toml_file_path']]}
+    assert PyprojectTomlFile(file_path=dummy_file_pair_params['pyproject_toml_file_path']).get_metadata(
+        'project.version') == '9.8.7'
+
+    # a file that was changed by someone else since the last request is read again
+    pyproject_toml_file = PyprojectTomlFile(
+        file_path=dummy_file_pair_params['pyproject_toml_file_path'])
+    pyproject_toml_file.set_metadata('project.version', '1.2.3')
+    pyproject_toml_file.save()
+    response = _call(json_rpc_server, 'view', {
+                     **dummy_file_pair_params, 'names': ['version']})
+    assert response['result']['version']['pyproject_toml_value'] == '1.2.3'
+    assert response['result']['version']['cff_value'] == '9.8.7'
+
+    response = _call(json_rpc_server, 'sync', dummy_file_pair_params)
+    assert dummy_file_pair_params['cff_file_path'] in response['result']['written_file_paths']
+    assert CffFile(file_path=dummy_file_pair_params['cff_file_path']).get_metadata(
+        'version') == '1.2.3'
+
+
+def test_errors(dummy_file_pair_params, tmp_path):
+    json_rpc_server = create_metadata_json_rpc_server()
+    assert _call(json_rpc_server, 'change', {
+                 **dummy_file_pair_params, 'values': {'authors': 'x'}})['error']['code'] == INVALID_PARAMS
+    assert _call(json_rpc_server, 'sync', {
+                 **dummy_file_pair_params, 'source': 'yaml'})['error']['code'] == INVALID_PARAMS
+    response = _call(json_rpc_server, 'view', {
+                     **dummy_file_pair_params, 'cff_file_path': os.path.join(tmp_path, 'missing.cff')})
+    assert response['error']['code'] == SERVER_ERROR
+    assert response['error']['message'].startswith('LoadCffFileException')